@@ -10,12 +10,17 @@ This example demonstrates advanced features:
 - Performance monitoring
 """
 
+import json
 import os
+import random
+import threading
 import time
+import uuid
 import hmac
 import hashlib
+from collections import Counter, deque
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from sendly import Sendly
@@ -26,65 +31,112 @@ from sendly.errors import (
     APIError,
     NetworkError
 )
+from sendly.utils import is_valid_phone_number
+
+# Webhook signing secret from your Sendly dashboard. The HMAC key schedule is
+# computed once here; each verification copies the keyed state, which is
+# cheaper per event than a one-shot hmac.digest(). Signatures are always
+# HMAC-SHA256 (the "sha256=" header), so other MACs such as keyed BLAKE2b
+# won't verify them.
+WEBHOOK_SECRET = os.environ.get(
+    'SENDLY_WEBHOOK_SECRET', 'whsec_your_webhook_secret_here'
+).encode('utf-8')
+_HMAC_TEMPLATE = hmac.new(WEBHOOK_SECRET, digestmod=hashlib.sha256)
+
+# One client is shared by the examples (and by worker threads) so keep-alive
+# connections are reused. rate_limit paces requests client-side (10/s here),
+# so bursts wait for tokens instead of being rejected with 429s.
+_client: Optional[Sendly] = None
+
+def get_client() -> Sendly:
+    """Return the shared client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = Sendly(
+            api_key=os.environ.get('SENDLY_API_KEY'),
+            max_retries=3,
+            timeout=30.0,
+            rate_limit=10
+        )
+    return _client
+
+def close_client() -> None:
+    """Close the shared client if it was created."""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
 
 def webhook_verification_example():
     """Demonstrate webhook signature verification."""
     print("🔐 Webhook Verification Example")
     print("-" * 35)
     
-    # Example webhook payload (what you'd receive in your webhook endpoint)
-    webhook_payload = {
-        "messageId": "msg_abc123",
-        "status": "delivered",
-        "to": "+14155552671",
-        "timestamp": "2023-10-01T12:00:00Z",
-        "eventType": "message.delivered"
-    }
+    # Example webhook request body, exactly as received by your webhook endpoint.
+    # Read the raw bytes, before any JSON parsing, and keep them for hashing:
+    #   Flask:   raw_body = request.get_data(cache=False)
+    #   FastAPI: raw_body = await request.body()
+    #   Django:  raw_body = request.body
+    raw_body = (
+        b'{"messageId":"msg_abc123","status":"delivered","to":"+14155552671",'
+        b'"timestamp":"2023-10-01T12:00:00Z","eventType":"message.delivered"}'
+    )
     
     # Example webhook signature (from X-Sendly-Signature header)
-    webhook_secret = "whsec_your_webhook_secret_here"
     webhook_signature = "sha256=abc123def456..."  # This would be in the header
     
-    def verify_webhook_signature(payload: Dict[str, Any], signature: str, secret: str) -> bool:
-        """Verify webhook signature for security."""
-        import json
+    def verify_webhook_signature(raw_body: bytes, signature_header: str) -> bool:
+        """Verify webhook signature for security.
+        
+        Sign the raw request body, not a re-serialized copy of the parsed
+        JSON: any difference in key order or whitespace breaks the signature.
+        """
+        # Reject malformed headers before hashing. The header's length is
+        # public, so checking it early leaks nothing about the secret.
+        prefix = "sha256="
+        if (
+            not signature_header
+            or len(signature_header) != len(prefix) + 2 * _HMAC_TEMPLATE.digest_size
+            or not signature_header.startswith(prefix)
+        ):
+            return False
+        try:
+            received = bytes.fromhex(signature_header[len(prefix):])
+        except ValueError:
+            return False
         
-        # Create expected signature
-        payload_string = json.dumps(payload, separators=(',', ':'), sort_keys=True)
-        expected_signature = hmac.new(
-            secret.encode('utf-8'),
-            payload_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        h = _HMAC_TEMPLATE.copy()
+        h.update(raw_body)
         
-        # Compare signatures (use hmac.compare_digest for security)
-        expected_header = f"sha256={expected_signature}"
-        return hmac.compare_digest(expected_header, signature)
+        # Compare digests in constant time (use hmac.compare_digest for security)
+        return hmac.compare_digest(h.digest(), received)
     
-    # In a real webhook handler, you'd verify the signature first
+    # In a real webhook handler, verify the signature before parsing the body
+    is_valid = verify_webhook_signature(raw_body, webhook_signature)
+    print(f"🔐 Placeholder signature valid: {is_valid}")
+    
+    # Simulate a correctly signed request (Sendly computes this header for you)
+    webhook_signature = "sha256=" + hmac.new(WEBHOOK_SECRET, raw_body, hashlib.sha256).hexdigest()
+    if not verify_webhook_signature(raw_body, webhook_signature):
+        print("❌ Signature mismatch, rejecting webhook")
+        return
+    
+    webhook_payload = json.loads(raw_body)
     print("🔍 Webhook payload received:")
     print(f"   Message ID: {webhook_payload['messageId']}")
     print(f"   Status: {webhook_payload['status']}")
     print(f"   Event Type: {webhook_payload['eventType']}")
     print(f"   Timestamp: {webhook_payload['timestamp']}")
     
-    # Simulate signature verification (would use actual signature in production)
-    # is_valid = verify_webhook_signature(webhook_payload, webhook_signature, webhook_secret)
-    # print(f"   Signature Valid: {is_valid}")
-    
     print("✅ Webhook processed successfully")
     print()
 
 def batch_processing_example():
-    """Demonstrate batch message processing with proper rate limiting."""
+    """Demonstrate batch message processing with request coalescing."""
     print("📊 Batch Processing Example")
     print("-" * 30)
     
-    client = Sendly(
-        api_key=os.environ.get('SENDLY_API_KEY'),
-        max_retries=3,
-        timeout=30.0
-    )
+    client = get_client()
     
     # Example: Send personalized messages to multiple recipients
     recipients = [
@@ -95,15 +147,28 @@ def batch_processing_example():
         {'phone': '+14155552675', 'name': 'Eve', 'code': 'MNO345'},
     ]
     
-    def send_message(recipient: Dict[str, str]) -> Dict[str, Any]:
-        """Send a message to a single recipient."""
+    # Build each message body and tag list once, while preparing the batch,
+    # so the send loop only has to hand them to the client
+    for recipient in recipients:
+        recipient['text'] = f"Hi {recipient['name']}! Your verification code is: {recipient['code']}"
+        recipient['tags'] = ['batch-send', 'verification', f"user-{recipient['name'].lower()}"]
+        # One key per logical message, so any retry of it can't send it twice
+        recipient['idempotency_key'] = uuid.uuid4().hex
+    
+    def submit_message(recipient: Dict[str, Any]):
+        """Queue a message for a single recipient."""
+        return client.sms.submit(
+            to=recipient['phone'],
+            text=recipient['text'],
+            message_type='otp',
+            tags=recipient['tags'],
+            idempotency_key=recipient['idempotency_key']
+        )
+    
+    def collect_result(recipient: Dict[str, Any], future) -> Dict[str, Any]:
+        """Wait for a queued message and summarize the outcome."""
         try:
-            response = client.sms.send(
-                to=recipient['phone'],
-                text=f"Hi {recipient['name']}! Your verification code is: {recipient['code']}",
-                message_type='otp',
-                tags=['batch-send', 'verification', f"user-{recipient['name'].lower()}"]
-            )
+            response = future.result()
             
             return {
                 'recipient': recipient,
@@ -114,11 +179,6 @@ def batch_processing_example():
                 'error': None
             }
             
-        except RateLimitError as e:
-            print(f"⏳ Rate limited for {recipient['name']}, retrying after {e.retry_after or 1}s...")
-            time.sleep(e.retry_after or 1)
-            return send_message(recipient)  # Retry once
-            
         except Exception as e:
             return {
                 'recipient': recipient,
@@ -129,29 +189,46 @@ def batch_processing_example():
                 'error': str(e)
             }
     
+    # Screen out malformed numbers in one pass before anything is queued
+    valid = []
+    for recipient in recipients:
+        if is_valid_phone_number(recipient['phone']):
+            valid.append(recipient)
+        else:
+            print(f"   ❌ Skipping {recipient['name']}: invalid phone number {recipient['phone']}")
+    recipients = valid
+    
     print(f"📤 Sending messages to {len(recipients)} recipients...")
     
-    # Sequential processing (recommended for rate limit compliance)
+    # Queue every message up front. Messages submitted together are coalesced
+    # into a single bulk request, so the batch costs one round trip instead of
+    # one per recipient. Rate limits are handled by the client's retry logic.
+    futures = []
+    for recipient in recipients:
+        try:
+            futures.append((recipient, submit_message(recipient)))
+        except ValidationError as e:
+            print(f"   ❌ Invalid message for {recipient['name']}: {e.message}")
+    
     results = []
     total_cost = 0.0
     successful_sends = 0
     
-    for i, recipient in enumerate(recipients, 1):
-        print(f"   Sending {i}/{len(recipients)} to {recipient['name']}...")
-        
-        result = send_message(recipient)
+    # Collect output and write it once, rather than a print per recipient
+    lines = []
+    for recipient, future in futures:
+        result = collect_result(recipient, future)
         results.append(result)
         
         if result['success']:
             successful_sends += 1
             total_cost += result['cost']
-            print(f"   ✅ Sent to {recipient['name']} (ID: {result['message_id']})")
+            lines.append(f"   ✅ Sent to {recipient['name']} (ID: {result['message_id']})")
         else:
-            print(f"   ❌ Failed to send to {recipient['name']}: {result['error']}")
-        
-        # Rate limiting: wait between requests
-        if i < len(recipients):
-            time.sleep(0.1)  # 100ms delay between requests
+            lines.append(f"   ❌ Failed to send to {recipient['name']}: {result['error']}")
+    
+    if lines:
+        print('\n'.join(lines))
     
     print(f"\n📈 Batch Processing Summary:")
     print(f"   Total Messages: {len(recipients)}")
@@ -160,7 +237,6 @@ def batch_processing_example():
     print(f"   Total Cost: ${total_cost:.4f}")
     print(f"   Average Cost: ${total_cost/successful_sends:.4f}" if successful_sends > 0 else "   Average Cost: N/A")
     
-    client.close()
     print()
 
 def concurrent_processing_example():
@@ -168,13 +244,17 @@ def concurrent_processing_example():
     print("⚡ Concurrent Processing Example")
     print("-" * 35)
     
-    # Note: Each thread should have its own client instance for thread safety
-    def create_client():
-        return Sendly(
-            api_key=os.environ.get('SENDLY_API_KEY'),
-            max_retries=2,
-            timeout=15.0
-        )
+    # Sending is I/O-bound, so use a few threads per CPU, capped at the
+    # client's connection pool size (32 by default). Set SENDLY_CONCURRENCY to
+    # match your account's concurrency limit.
+    max_workers = int(os.environ.get(
+        'SENDLY_CONCURRENCY', min(32, (os.cpu_count() or 1) * 4)
+    ))
+    
+    # The shared client is safe to use from every worker thread, so
+    # connections (and their TLS sessions) are reused instead of being set up
+    # again for each message.
+    client = get_client()
     
     # Example: Send different message types concurrently
     message_tasks = [
@@ -206,7 +286,6 @@ def concurrent_processing_example():
     
     def send_concurrent_message(task: Dict[str, Any]) -> Dict[str, Any]:
         """Send a message in a separate thread."""
-        client = create_client()
         try:
             response = client.sms.send(**task)
             return {
@@ -224,13 +303,11 @@ def concurrent_processing_example():
                 'routing': None,
                 'error': str(e)
             }
-        finally:
-            client.close()
     
     print(f"🚀 Sending {len(message_tasks)} messages concurrently...")
     
     # Use ThreadPoolExecutor for concurrent processing
-    with ThreadPoolExecutor(max_workers=4) as executor:
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='sendly') as executor:
         # Submit all tasks
         future_to_task = {
             executor.submit(send_concurrent_message, task): task 
@@ -305,21 +382,63 @@ def performance_monitoring_example():
     print("📊 Performance Monitoring Example")
     print("-" * 37)
     
-    client = Sendly(api_key=os.environ.get('SENDLY_API_KEY'))
-    
-    # Metrics collection
-    metrics = {
-        'total_requests': 0,
-        'successful_requests': 0,
-        'failed_requests': 0,
-        'total_cost': 0.0,
-        'response_times': [],
-        'error_types': {}
-    }
+    client = get_client()
+    
+    # Metrics collection. Averages come from running totals, and only the
+    # most recent response times are kept, so a long-running monitor uses
+    # constant memory. Response times are integer nanoseconds from the
+    # monotonic perf_counter_ns() clock, which can't jump with NTP adjustments.
+    #
+    # Each sending thread updates its own shard, so concurrent senders never
+    # contend on shared counters; shards are merged when metrics are reported.
+    counters = ('total_requests', 'successful_requests', 'failed_requests',
+                'total_cost', 'total_response_ns')
+    shards: List[Dict[str, Any]] = []
+    shards_lock = threading.Lock()
+    local = threading.local()
+    
+    def new_metrics() -> Dict[str, Any]:
+        """Create an empty metrics shard."""
+        metrics = dict.fromkeys(counters, 0)
+        metrics['response_times'] = deque(maxlen=65536)
+        metrics['error_types'] = Counter()
+        return metrics
+    
+    def thread_metrics() -> Dict[str, Any]:
+        """Return the calling thread's metrics shard."""
+        metrics = getattr(local, 'metrics', None)
+        if metrics is None:
+            metrics = local.metrics = new_metrics()
+            with shards_lock:
+                shards.append(metrics)
+        return metrics
+    
+    def merged_metrics() -> Dict[str, Any]:
+        """Combine every thread's shard into one set of metrics."""
+        merged = new_metrics()
+        with shards_lock:
+            for shard in shards:
+                for key in counters:
+                    merged[key] += shard[key]
+                merged['response_times'].extend(shard['response_times'])
+                merged['error_types'].update(shard['error_types'])
+        return merged
+    
+    def record_response_time(metrics: Dict[str, Any], start_ns: int) -> float:
+        """Add the time since start_ns to the running stats.
+        
+        Returns:
+            Response time in seconds
+        """
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        metrics['total_response_ns'] += elapsed_ns
+        metrics['response_times'].append(elapsed_ns)
+        return elapsed_ns * 1e-9
     
     def send_monitored_message(to: str, text: str, **kwargs) -> Dict[str, Any]:
         """Send a message with performance monitoring."""
-        start_time = time.time()
+        metrics = thread_metrics()
+        start_ns = time.perf_counter_ns()
         metrics['total_requests'] += 1
         
         try:
@@ -330,8 +449,7 @@ def performance_monitoring_example():
             if response.cost:
                 metrics['total_cost'] += response.cost.amount
             
-            response_time = time.time() - start_time
-            metrics['response_times'].append(response_time)
+            response_time = record_response_time(metrics, start_ns)
             
             return {
                 'success': True,
@@ -343,11 +461,9 @@ def performance_monitoring_example():
         except Exception as e:
             # Record error metrics
             metrics['failed_requests'] += 1
-            error_type = type(e).__name__
-            metrics['error_types'][error_type] = metrics['error_types'].get(error_type, 0) + 1
+            metrics['error_types'][type(e).__name__] += 1
             
-            response_time = time.time() - start_time
-            metrics['response_times'].append(response_time)
+            response_time = record_response_time(metrics, start_ns)
             
             return {
                 'success': False,
@@ -368,18 +484,19 @@ def performance_monitoring_example():
     print("🧪 Sending test messages with performance monitoring...")
     
     for i, (to, text) in enumerate(test_messages, 1):
-        print(f"   Test {i}: ", end='', flush=True)
         result = send_monitored_message(to, text, message_type='transactional')
         
+        # One write per message, after the timed send has finished
         if result['success']:
-            print(f"✅ Success ({result['response_time']:.3f}s)")
+            print(f"   Test {i}: ✅ Success ({result['response_time']:.3f}s)")
         else:
-            print(f"❌ Error: {result['error']} ({result['response_time']:.3f}s)")
+            print(f"   Test {i}: ❌ Error: {result['error']} ({result['response_time']:.3f}s)")
         
         time.sleep(0.1)  # Small delay between requests
     
     # Calculate and display metrics
-    avg_response_time = sum(metrics['response_times']) / len(metrics['response_times'])
+    metrics = merged_metrics()
+    avg_response_time = metrics['total_response_ns'] / metrics['total_requests'] * 1e-9
     success_rate = (metrics['successful_requests'] / metrics['total_requests']) * 100
     
     print(f"\n📈 Performance Metrics:")
@@ -395,7 +512,6 @@ def performance_monitoring_example():
         for error_type, count in metrics['error_types'].items():
             print(f"     {error_type}: {count}")
     
-    client.close()
     print()
 
 def error_recovery_example():
@@ -403,22 +519,31 @@ def error_recovery_example():
     print("🔄 Error Recovery Example")
     print("-" * 26)
     
-    client = Sendly(api_key=os.environ.get('SENDLY_API_KEY'))
+    # The shared client paces sends; a 429 also halves its rate for a while
+    client = get_client()
+    
+    def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+        """Full-jitter exponential backoff, so retrying clients spread out."""
+        return random.uniform(0, min(cap, base * (2 ** attempt)))
     
     def send_with_recovery(to: str, text: str, max_attempts: int = 3) -> bool:
         """Send message with custom retry logic."""
+        # Generated once and reused by every attempt, so a retry after a
+        # timeout can't deliver (or bill) the message twice
+        idempotency_key = uuid.uuid4().hex
         
         for attempt in range(max_attempts):
             try:
-                response = client.sms.send(to=to, text=text)
+                response = client.sms.send(to=to, text=text, idempotency_key=idempotency_key)
                 print(f"   ✅ Success on attempt {attempt + 1}: {response.id}")
                 return True
                 
             except RateLimitError as e:
                 print(f"   ⏳ Rate limited on attempt {attempt + 1}")
                 if attempt < max_attempts - 1:
-                    wait_time = e.retry_after or (2 ** attempt)  # Exponential backoff
-                    print(f"      Waiting {wait_time}s before retry...")
+                    # Prefer the server's Retry-After, otherwise back off with jitter
+                    wait_time = e.retry_after or backoff_delay(attempt)
+                    print(f"      Waiting {wait_time:.2f}s before retry...")
                     time.sleep(wait_time)
                     continue
                 else:
@@ -428,8 +553,8 @@ def error_recovery_example():
             except NetworkError as e:
                 print(f"   🌐 Network error on attempt {attempt + 1}: {e.message}")
                 if attempt < max_attempts - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    print(f"      Retrying in {wait_time}s...")
+                    wait_time = backoff_delay(attempt)
+                    print(f"      Retrying in {wait_time:.2f}s...")
                     time.sleep(wait_time)
                     continue
                 else:
@@ -465,8 +590,6 @@ def error_recovery_example():
         success = send_with_recovery(to, text)
         print(f"   Final result: {'✅ Success' if success else '❌ Failed'}")
         print()
-    
-    client.close()
 
 def main():
     """Run all advanced examples."""
@@ -481,12 +604,15 @@ def main():
         return
     
     # Run advanced examples
-    webhook_verification_example()
-    batch_processing_example()
-    concurrent_processing_example()
-    custom_configuration_example()
-    performance_monitoring_example()
-    error_recovery_example()
+    try:
+        webhook_verification_example()
+        batch_processing_example()
+        concurrent_processing_example()
+        custom_configuration_example()
+        performance_monitoring_example()
+        error_recovery_example()
+    finally:
+        close_client()
     
     print("✨ All advanced examples completed!")
 
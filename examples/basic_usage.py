@@ -10,6 +10,8 @@ This example demonstrates the fundamental features of the Sendly Python SDK:
 """
 
 import os
+from typing import Optional
+
 from sendly import Sendly
 from sendly.errors import (
     ValidationError,
@@ -19,16 +21,43 @@ from sendly.errors import (
     NetworkError
 )
 
+# Sample message for each message type, built once at import
+MESSAGE_TYPE_EXAMPLES = (
+    ('transactional', 'Your order #12345 has been shipped!'),
+    ('otp', 'Your verification code: 567890'),
+    ('marketing', 'Special offer: 50% off this weekend only! 🛍️'),
+    ('alert', 'System maintenance scheduled for tonight at 2 AM'),
+    ('promotional', 'New product launch - be the first to try it!'),
+)
+
+# One client is shared by all examples so its connections stay warm between
+# them. Create it lazily and close it once when you're done.
+_client: Optional[Sendly] = None
+
+def get_client() -> Sendly:
+    """Return the shared client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = Sendly(
+            api_key=os.environ.get('SENDLY_API_KEY'),  # or pass directly: 'sl_test_...'
+            # base_url='https://api.sendly.dev'  # Optional: use for testing
+        )
+    return _client
+
+def close_client() -> None:
+    """Close the shared client if it was created."""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+
 def basic_sms_example():
     """Send a basic SMS message."""
     print("📱 Basic SMS Example")
     print("-" * 30)
     
-    # Initialize the client
-    client = Sendly(
-        api_key=os.environ.get('SENDLY_API_KEY'),  # or pass directly: 'sl_test_...'
-        # base_url='https://api.sendly.dev'  # Optional: use for testing
-    )
+    # Get the shared client
+    client = get_client()
     
     try:
         # Send a simple SMS
@@ -66,8 +95,6 @@ def basic_sms_example():
             print(f"   Status Code: {e.status_code}")
     except NetworkError as e:
         print(f"❌ Network Error: {e.message}")
-    finally:
-        client.close()
     
     print()
 
@@ -76,7 +103,7 @@ def mms_example():
     print("🖼️  MMS with Media Example")
     print("-" * 30)
     
-    client = Sendly(api_key=os.environ.get('SENDLY_API_KEY'))
+    client = get_client()
     
     try:
         response = client.sms.send(
@@ -101,8 +128,6 @@ def mms_example():
         # - Invalid media URLs (must be HTTPS)
         # - Too many media files (max 10)
         # - Invalid URL format
-    finally:
-        client.close()
     
     print()
 
@@ -111,7 +136,7 @@ def advanced_sms_example():
     print("⚙️  Advanced SMS Example")
     print("-" * 30)
     
-    client = Sendly(api_key=os.environ.get('SENDLY_API_KEY'))
+    client = get_client()
     
     try:
         response = client.sms.send(
@@ -138,8 +163,6 @@ def advanced_sms_example():
         
     except ValidationError as e:
         print(f"❌ Validation Error: {e.message}")
-    finally:
-        client.close()
     
     print()
 
@@ -148,17 +171,9 @@ def message_types_example():
     print("🎯 Message Types & Smart Routing Example")
     print("-" * 45)
     
-    client = Sendly(api_key=os.environ.get('SENDLY_API_KEY'))
-    
-    message_types = [
-        ('transactional', 'Your order #12345 has been shipped!'),
-        ('otp', 'Your verification code: 567890'),
-        ('marketing', 'Special offer: 50% off this weekend only! 🛍️'),
-        ('alert', 'System maintenance scheduled for tonight at 2 AM'),
-        ('promotional', 'New product launch - be the first to try it!')
-    ]
+    client = get_client()
     
-    for msg_type, text in message_types:
+    for msg_type, text in MESSAGE_TYPE_EXAMPLES:
         try:
             response = client.sms.send(
                 to='+14155552671',
@@ -175,15 +190,13 @@ def message_types_example():
         except Exception as e:
             print(f"❌ Failed to send {msg_type} message: {e}")
             print()
-    
-    client.close()
 
 def error_handling_example():
     """Comprehensive error handling demonstration."""
     print("🚨 Error Handling Example")
     print("-" * 30)
     
-    client = Sendly(api_key=os.environ.get('SENDLY_API_KEY'))
+    client = get_client()
     
     # Example 1: Validation Error
     print("1. Testing validation error...")
@@ -226,7 +239,6 @@ def error_handling_example():
     except ValidationError as e:
         print(f"   ✅ Caught validation error: {e.message}")
     
-    client.close()
     print()
 
 def context_manager_example():
@@ -255,7 +267,7 @@ def international_example():
     print("🌍 International Messages Example")
     print("-" * 35)
     
-    client = Sendly(api_key=os.environ.get('SENDLY_API_KEY'))
+    client = get_client()
     
     international_numbers = [
         ('+447700900123', '🇬🇧 UK'),
@@ -284,8 +296,6 @@ def international_example():
         except Exception as e:
             print(f"❌ Failed to send to {country}: {e}")
             print()
-    
-    client.close()
 
 def main():
     """Run all examples."""
@@ -300,13 +310,16 @@ def main():
         return
     
     # Run examples
-    basic_sms_example()
-    mms_example()
-    advanced_sms_example()
-    message_types_example()
-    error_handling_example()
-    context_manager_example()
-    international_example()
+    try:
+        basic_sms_example()
+        mms_example()
+        advanced_sms_example()
+        message_types_example()
+        error_handling_example()
+        context_manager_example()
+        international_example()
+    finally:
+        close_client()
     
     print("✨ All examples completed!")
 
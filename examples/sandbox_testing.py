@@ -4,11 +4,33 @@ Sendly Sandbox Testing Example
 This example demonstrates comprehensive testing using test numbers
 in the Sendly sandbox environment. Use this with test API keys (sl_test_*)
 to validate your integration without incurring charges.
+
+Set SENDLY_LOCAL=1 to run the scenarios against the SDK's in-process local
+transport instead of the API, e.g. in CI without network access.
 """
 
 import os
-import time
-from sendly import Sendly, MAGIC_NUMBERS, RateLimitError, ValidationError, APIError
+from concurrent.futures import ThreadPoolExecutor
+
+from sendly import Sendly, MAGIC_NUMBERS, MAGIC_NUMBER_INFO, RateLimitError, APIError, SMSRequest
+
+# Upper bound on concurrent sends within one scenario
+MAX_WORKERS = 16
+
+# Test numbers used by the scenarios, looked up once
+SUCCESS_INSTANT = MAGIC_NUMBERS['success']['instant']
+SUCCESS_DELAY_5S = MAGIC_NUMBERS['success']['delay_5s']
+SUCCESS_VERIZON = MAGIC_NUMBERS['success']['verizon_carrier']
+CARRIER_VERIZON = MAGIC_NUMBERS['carriers']['verizon']
+CARRIER_ATT = MAGIC_NUMBERS['carriers']['att']
+CARRIER_TMOBILE = MAGIC_NUMBERS['carriers']['tmobile']
+DELAY_10S = MAGIC_NUMBERS['delays']['10_seconds']
+DELAY_30S = MAGIC_NUMBERS['delays']['30_seconds']
+DELAY_60S = MAGIC_NUMBERS['delays']['60_seconds']
+WEBHOOK_SUCCESS = MAGIC_NUMBERS['webhooks']['success']
+WEBHOOK_TIMEOUT = MAGIC_NUMBERS['webhooks']['timeout']
+WEBHOOK_ERROR_500 = MAGIC_NUMBERS['webhooks']['error_500']
+ERROR_NUMBERS = MAGIC_NUMBERS['errors']
 
 
 def main():
@@ -34,125 +56,141 @@ def main():
     print("Sandbox tests completed")
 
 
+def send_all(client, cases):
+    """Send every case concurrently on one shared client.
+    
+    The sends are independent and I/O-bound, so a scenario takes about as
+    long as its slowest request rather than the sum of all of them. Sendly
+    clients are thread-safe, so every worker uses the same connection pool.
+    
+    Args:
+        client: Sendly client
+        cases: List of (label, send kwargs) tuples
+    
+    Returns:
+        Dict mapping each label to (response, error), in the order of cases
+    """
+    def send(kwargs):
+        try:
+            return client.sms.send(**kwargs), None
+        except Exception as e:
+            return None, e
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(cases))) as executor:
+        outcomes = executor.map(send, [kwargs for _, kwargs in cases])
+        return dict(zip([label for label, _ in cases], outcomes))
+
+
+def succeeded(results):
+    """Print the failed sends and yield the successful ones.
+    
+    Args:
+        results: Dict returned by send_all()
+    
+    Yields:
+        (label, response) for every send that did not raise
+    """
+    for label, (response, error) in results.items():
+        if error:
+            print(f"✗ {label} failed: {error}")
+        else:
+            yield label, response
+
+
 def test_success_scenarios(client):
     """Test successful delivery scenarios."""
     print("\n[SUCCESS SCENARIOS]\n")
     
-    # Test instant delivery
-    try:
-        response = client.sms.send(
-            to=MAGIC_NUMBERS['success']['instant'],
+    results = send_all(client, [
+        ('Instant delivery', dict(
+            to=SUCCESS_INSTANT,
             text='Testing instant delivery'
-        )
-        print(f"✓ Instant delivery: {response.status} (ID: {response.id})")
-    except Exception as e:
-        print(f"✗ Instant delivery failed: {e}")
-    
-    # Test delayed delivery
-    try:
-        response = client.sms.send(
-            to=MAGIC_NUMBERS['success']['delay_5s'],
+        )),
+        ('Delayed delivery', dict(
+            to=SUCCESS_DELAY_5S,
             text='Testing 5 second delay'
-        )
-        print(f"✓ Delayed delivery: queued (ID: {response.id})")
-        print("  Message will be delivered after 5 seconds")
-    except Exception as e:
-        print(f"✗ Delayed delivery failed: {e}")
-    
-    # Test carrier simulation
-    try:
-        response = client.sms.send(
-            to=MAGIC_NUMBERS['success']['verizon_carrier'],
+        )),
+        ('Verizon simulation', dict(
+            to=SUCCESS_VERIZON,
             text='Testing Verizon carrier simulation'
-        )
-        print(f"✓ Verizon simulation: {response.status}")
-        if hasattr(response, 'routing') and response.routing:
-            print(f"  Carrier: {response.routing.get('carrier', 'N/A')}")
-    except Exception as e:
-        print(f"✗ Verizon simulation failed: {e}")
+        )),
+    ])
+    
+    for label, response in succeeded(results):
+        print(f"✓ {label}: {response.status} (ID: {response.id})")
+        if label == 'Delayed delivery':
+            print("  Message will be delivered after 5 seconds")
+        if response.carrier:
+            print(f"  Carrier: {response.carrier}")
 
 
 def test_error_scenarios(client):
     """Test error handling scenarios."""
     print("\n[ERROR SCENARIOS]\n")
     
-    # Test invalid number error
-    try:
-        client.sms.send(
-            to=MAGIC_NUMBERS['errors']['invalid_number'],
-            text='Testing invalid number'
-        )
-        print("✗ Invalid number: Expected error but got success")
-    except ValidationError as e:
-        print(f"✓ Invalid number error caught: {e}")
-    except Exception as e:
-        print(f"✓ Invalid number error caught: {e}")
-    
-    # Test carrier rejection
-    try:
-        client.sms.send(
-            to=MAGIC_NUMBERS['errors']['carrier_rejection'],
-            text='Testing carrier rejection'
-        )
-        print("✗ Carrier rejection: Expected error but got success")
-    except Exception as e:
-        print(f"✓ Carrier rejection caught: {e}")
-    
-    # Test rate limit error
-    try:
-        client.sms.send(
-            to=MAGIC_NUMBERS['errors']['rate_limit'],
-            text='Testing rate limit'
-        )
-        print("✗ Rate limit: Expected error but got success")
-    except RateLimitError as e:
-        print(f"✓ Rate limit error caught: {e}")
-        if hasattr(e, 'retry_after'):
-            print(f"  Retry after: {e.retry_after} seconds")
-    except Exception as e:
-        print(f"✓ Rate limit error caught: {e}")
+    scenarios = [
+        ('invalid_number', 'Invalid number', 'Testing invalid number'),
+        ('carrier_rejection', 'Carrier rejection', 'Testing carrier rejection'),
+        ('rate_limit', 'Rate limit', 'Testing rate limit'),
+        ('timeout', 'Timeout', 'Testing timeout'),
+        ('insufficient_balance', 'Insufficient balance', 'Testing insufficient balance'),
+    ]
     
-    # Test timeout error
-    try:
-        client.sms.send(
-            to=MAGIC_NUMBERS['errors']['timeout'],
-            text='Testing timeout'
-        )
-        print("✗ Timeout: Expected error but got success")
-    except Exception as e:
-        print(f"✓ Timeout error caught: {e}")
+    results = send_all(client, [
+        (label, dict(to=ERROR_NUMBERS[key], text=text))
+        for key, label, text in scenarios
+    ])
     
-    # Test insufficient balance error
-    try:
-        client.sms.send(
-            to=MAGIC_NUMBERS['errors']['insufficient_balance'],
-            text='Testing insufficient balance'
-        )
-        print("✗ Insufficient balance: Expected error but got success")
-    except Exception as e:
-        print(f"✓ Insufficient balance caught: {e}")
+    for label, (response, error) in results.items():
+        if error is None:
+            print(f"✗ {label}: Expected error but got success")
+            continue
+        
+        print(f"✓ {label} error caught: {error}")
+        if isinstance(error, RateLimitError) and error.retry_after:
+            print(f"  Retry after: {error.retry_after} seconds")
 
 
 def test_delay_scenarios(client):
     """Test various delay scenarios."""
     print("\n[DELAY SCENARIOS]\n")
     
-    delays = [
-        (MAGIC_NUMBERS['delays']['10_seconds'], '10 seconds'),
-        (MAGIC_NUMBERS['delays']['30_seconds'], '30 seconds'),
-        (MAGIC_NUMBERS['delays']['60_seconds'], '60 seconds'),
-    ]
+    delays = {
+        '10 second delay': DELAY_10S,
+        '30 second delay': DELAY_30S,
+        '60 second delay': DELAY_60S,
+    }
+    
+    results = send_all(client, [
+        (label, dict(to=number, text=f'Testing {label}'))
+        for label, number in delays.items()
+    ])
+    
+    queued = []
+    for label, response in succeeded(results):
+        print(f"✓ {label}: Message queued (ID: {response.id})")
+        queued.append((label, response))
+    
+    if not queued:
+        return
     
-    for number, duration in delays:
+    # Wait for all of them at once. Each wait polls with a growing interval,
+    # so even the 60 second case takes only about a dozen status requests
+    def wait(item):
+        label, response = item
+        delay = MAGIC_NUMBER_INFO[delays[label]]['delay'] / 1000
         try:
-            response = client.sms.send(
-                to=number,
-                text=f'Testing {duration} delay'
-            )
-            print(f"✓ {duration} delay: Message queued (ID: {response.id})")
-            print(f"  Status progression will take {duration}")
+            return client.sms.wait_for_status(response.id, 'delivered', timeout=delay + 30)
         except Exception as e:
-            print(f"✗ {duration} delay failed: {e}")
+            return e
+    
+    print("  Waiting for delivery...")
+    with ThreadPoolExecutor(max_workers=len(queued)) as executor:
+        for (label, _), final in zip(queued, executor.map(wait, queued)):
+            if isinstance(final, Exception):
+                print(f"✗ {label}: status check failed: {final}")
+            else:
+                print(f"✓ {label}: {final.status}")
 
 
 def test_carrier_scenarios(client):
@@ -160,22 +198,20 @@ def test_carrier_scenarios(client):
     print("\n[CARRIER SCENARIOS]\n")
     
     carriers = [
-        (MAGIC_NUMBERS['carriers']['verizon'], 'Verizon'),
-        (MAGIC_NUMBERS['carriers']['att'], 'AT&T'),
-        (MAGIC_NUMBERS['carriers']['tmobile'], 'T-Mobile'),
+        (CARRIER_VERIZON, 'Verizon'),
+        (CARRIER_ATT, 'AT&T'),
+        (CARRIER_TMOBILE, 'T-Mobile'),
     ]
     
-    for number, carrier in carriers:
-        try:
-            response = client.sms.send(
-                to=number,
-                text=f'Testing {carrier} carrier behavior'
-            )
-            print(f"✓ {carrier}: Message sent (ID: {response.id})")
-            if hasattr(response, 'routing') and response.routing:
-                print(f"  Simulated carrier: {response.routing.get('carrier', 'N/A')}")
-        except Exception as e:
-            print(f"✗ {carrier} test failed: {e}")
+    results = send_all(client, [
+        (carrier, dict(to=number, text=f'Testing {carrier} carrier behavior'))
+        for number, carrier in carriers
+    ])
+    
+    for carrier, response in succeeded(results):
+        print(f"✓ {carrier}: Message sent (ID: {response.id})")
+        if response.carrier:
+            print(f"  Simulated carrier: {response.carrier}")
 
 
 def test_webhook_scenarios(client):
@@ -185,77 +221,71 @@ def test_webhook_scenarios(client):
     webhook_url = 'https://example.com/webhook'
     webhook_failover_url = 'https://example.com/webhook-failover'
     
-    # Test successful webhook
-    try:
-        response = client.sms.send(
-            to=MAGIC_NUMBERS['webhooks']['success'],
+    notes = {
+        'Webhook success': f'Webhook will be simulated to: {webhook_url}',
+        'Webhook timeout': 'Timeout simulation will trigger failover',
+        'Webhook error': '500 error will trigger retry logic',
+    }
+    
+    results = send_all(client, [
+        ('Webhook success', dict(
+            to=WEBHOOK_SUCCESS,
             text='Testing webhook success',
             webhook_url=webhook_url
-        )
-        print(f"✓ Webhook success: Message sent (ID: {response.id})")
-        print(f"  Webhook will be simulated to: {webhook_url}")
-    except Exception as e:
-        print(f"✗ Webhook success failed: {e}")
-    
-    # Test webhook timeout
-    try:
-        response = client.sms.send(
-            to=MAGIC_NUMBERS['webhooks']['timeout'],
+        )),
+        ('Webhook timeout', dict(
+            to=WEBHOOK_TIMEOUT,
             text='Testing webhook timeout',
             webhook_url=webhook_url,
             webhook_failover_url=webhook_failover_url
-        )
-        print(f"✓ Webhook timeout: Message sent (ID: {response.id})")
-        print(f"  Timeout simulation will trigger failover")
-    except Exception as e:
-        print(f"✗ Webhook timeout failed: {e}")
-    
-    # Test webhook error with retry
-    try:
-        response = client.sms.send(
-            to=MAGIC_NUMBERS['webhooks']['error_500'],
+        )),
+        ('Webhook error', dict(
+            to=WEBHOOK_ERROR_500,
             text='Testing webhook error',
             webhook_url=webhook_url
-        )
-        print(f"✓ Webhook error: Message sent (ID: {response.id})")
-        print(f"  500 error will trigger retry logic")
-    except Exception as e:
-        print(f"✗ Webhook error failed: {e}")
+        )),
+    ])
+    
+    for label, response in succeeded(results):
+        print(f"✓ {label}: Message sent (ID: {response.id})")
+        print(f"  {notes[label]}")
 
 
 def test_mms_functionality(client):
     """Test MMS functionality with test numbers."""
     print("\n[MMS SCENARIOS]\n")
     
-    try:
-        response = client.sms.send(
-            to=MAGIC_NUMBERS['success']['instant'],
+    results = send_all(client, [
+        ('MMS', dict(
+            to=SUCCESS_INSTANT,
             text='Testing MMS with media',
             media_urls=['https://example.com/image.jpg'],
             subject='MMS Test'
-        )
-        print(f"✓ MMS sent: {response.status} (ID: {response.id})")
-        if hasattr(response, 'media_type'):
+        )),
+    ])
+    
+    for label, response in succeeded(results):
+        print(f"✓ {label} sent: {response.status} (ID: {response.id})")
+        if response.media_type:
             print(f"  Media type: {response.media_type}")
-    except Exception as e:
-        print(f"✗ MMS failed: {e}")
 
 
 def test_message_tagging(client):
     """Test message tagging and analytics."""
     print("\n[TAGGING SCENARIOS]\n")
     
-    try:
-        response = client.sms.send(
-            to=MAGIC_NUMBERS['success']['instant'],
+    results = send_all(client, [
+        ('Tagged message', dict(
+            to=SUCCESS_INSTANT,
             text='Testing message tags',
             tags=['test', 'sandbox', 'automated', 'v1.0']
-        )
-        print(f"✓ Tagged message sent (ID: {response.id})")
-        if hasattr(response, 'tags') and response.tags:
+        )),
+    ])
+    
+    for label, response in succeeded(results):
+        print(f"✓ {label} sent (ID: {response.id})")
+        if response.tags:
             print(f"  Tags: {', '.join(response.tags)}")
-    except Exception as e:
-        print(f"✗ Tagged message failed: {e}")
 
 
 def test_batch_processing(client):
@@ -263,31 +293,31 @@ def test_batch_processing(client):
     print("\n[BATCH PROCESSING]\n")
     
     recipients = [
-        MAGIC_NUMBERS['success']['instant'],
-        MAGIC_NUMBERS['success']['delay_5s'],
-        MAGIC_NUMBERS['carriers']['verizon'],
+        SUCCESS_INSTANT,
+        SUCCESS_DELAY_5S,
+        CARRIER_VERIZON,
     ]
     
-    success_count = 0
-    error_count = 0
+    messages = [
+        SMSRequest(
+            to=recipient,
+            text=f'Batch message #{idx}',
+            tags=['batch', f'message-{idx}']
+        )
+        for idx, recipient in enumerate(recipients, 1)
+    ]
     
-    for idx, recipient in enumerate(recipients, 1):
-        try:
-            response = client.sms.send(
-                to=recipient,
-                text=f'Batch message #{idx}',
-                tags=['batch', f'message-{idx}']
-            )
-            print(f"✓ Message {idx}: Sent to {recipient}")
-            success_count += 1
-            
-            # Small delay between messages
-            time.sleep(0.1)
-        except Exception as e:
-            print(f"✗ Message {idx}: Failed - {e}")
-            error_count += 1
+    # All messages go out in a single bulk request
+    try:
+        responses = client.sms.send_many(messages)
+    except Exception as e:
+        print(f"✗ Batch failed - {e}")
+        return
+    
+    for idx, response in enumerate(responses, 1):
+        print(f"✓ Message {idx}: Sent to {response.to} ({response.status})")
     
-    print(f"\nBatch results: {success_count} success, {error_count} failures")
+    print(f"\nBatch results: {len(responses)} sent")
 
 
 def test_comprehensive_flow(client):
@@ -297,43 +327,38 @@ def test_comprehensive_flow(client):
     # Simulate a user verification flow
     print("Simulating user verification flow:")
     
-    # Step 1: Send OTP
-    try:
-        otp = "123456"
-        response = client.sms.send(
-            to=MAGIC_NUMBERS['success']['instant'],
+    otp = "123456"
+    steps = [
+        ('OTP', dict(
+            to=SUCCESS_INSTANT,
             text=f'Your verification code is: {otp}',
             message_type='otp',
             tags=['verification', 'otp']
-        )
-        print(f"1. OTP sent: {response.id}")
-    except Exception as e:
-        print(f"1. OTP failed: {e}")
-        return
-    
-    # Step 2: Send welcome message after verification
-    try:
-        response = client.sms.send(
-            to=MAGIC_NUMBERS['success']['instant'],
+        )),
+        ('Welcome message', dict(
+            to=SUCCESS_INSTANT,
             text='Welcome to Sendly! Your account is now verified.',
             message_type='transactional',
             tags=['onboarding', 'welcome']
-        )
-        print(f"2. Welcome message sent: {response.id}")
-    except Exception as e:
-        print(f"2. Welcome message failed: {e}")
-    
-    # Step 3: Send promotional offer
-    try:
-        response = client.sms.send(
-            to=MAGIC_NUMBERS['success']['instant'],
+        )),
+        ('Promotional offer', dict(
+            to=SUCCESS_INSTANT,
             text='Get 50% off your first month! Use code: WELCOME50',
             message_type='marketing',
             tags=['promotion', 'new-user']
-        )
-        print(f"3. Promotional offer sent: {response.id}")
-    except Exception as e:
-        print(f"3. Promotional offer failed: {e}")
+        )),
+    ]
+    
+    # Steps run in order: each message only makes sense after the previous one
+    for step, (label, kwargs) in enumerate(steps, 1):
+        try:
+            response = client.sms.send(**kwargs)
+        except Exception as e:
+            print(f"{step}. {label} failed: {e}")
+            if step == 1:
+                return  # Nothing to welcome without a verified user
+            continue
+        print(f"{step}. {label} sent: {response.id}")
     
     print("\nUser verification flow completed")
 
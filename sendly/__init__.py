@@ -4,6 +4,7 @@ The official Python SDK for the Sendly SMS API.
 """
 
 from .client import Sendly
+from .async_client import AsyncSendly
 from .errors import (
     SendlyError,
     ValidationError,
@@ -42,6 +43,7 @@ __email__ = "support@sendly.live"
 __all__ = [
     # Main client
     'Sendly',
+    'AsyncSendly',
 
     # Exceptions
     'SendlyError',
@@ -0,0 +1,90 @@
+"""Async Sendly client"""
+
+from typing import Optional
+
+from .client import _resolve_api_key, _resolve_transport
+from .resources.async_sms import AsyncSMS
+from .utils.async_http_client import AsyncHttpClient
+from .utils.circuit_breaker import CircuitBreaker
+from .utils.local_transport import AsyncLocalTransport, _AsyncTransport
+from .utils.rate_limiter import TokenBucket
+
+
+class AsyncSendly:
+    """Sendly client for sending SMS/MMS from asyncio code.
+
+    Requires the optional httpx dependency (``pip install sendly[async]``).
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = "https://sendly.live/api",
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        user_agent: Optional[str] = None,
+        max_concurrent: int = 64,
+        rate_limit: Optional[float] = None,
+        http2: bool = False,
+        transport: Optional[str] = None,
+        circuit_breaker: bool = False
+    ):
+        """Initialize async Sendly client.
+
+        Args:
+            api_key: API key (sl_live_* or sl_test_*). Falls back to SENDLY_API_KEY env var,
+                which is read once per process.
+            base_url: API base URL
+            timeout: Request timeout in seconds
+            max_retries: Maximum retry attempts
+            user_agent: Custom user agent
+            max_concurrent: Maximum number of requests in flight at once
+            rate_limit: Maximum requests per second to send. Requests beyond the
+                rate wait client-side instead of being rejected by the API. No
+                limit by default.
+            http2: Multiplex concurrent sends over one HTTP/2 connection
+                (requires ``pip install sendly[http2]``)
+            transport: ``'http'`` to call the API, or ``'local'`` to answer
+                sandbox requests in-process without any network I/O (test
+                keys only). Defaults to ``'local'`` when SENDLY_LOCAL is ``1``.
+            circuit_breaker: Fail requests fast, without sending them, after 5
+                consecutive connection errors, timeouts or 5xx responses, until
+                a trial request succeeds 30 seconds later. Off by default.
+
+        Raises:
+            ValidationError: If API key is missing or invalid, or the local
+                transport is used with a live key
+            ValueError: If transport is not ``'http'`` or ``'local'``
+            ImportError: If httpx is not installed (http transport only)
+        """
+        api_key = _resolve_api_key(api_key)
+
+        self._http_client: _AsyncTransport
+        if _resolve_transport(transport, api_key) == 'local':
+            self._http_client = AsyncLocalTransport(base_url, api_key)
+        else:
+            self._http_client = AsyncHttpClient(
+                base_url=base_url,
+                api_key=api_key,
+                timeout=timeout,
+                max_retries=max_retries,
+                user_agent=user_agent or "sendly-python/0.1.0",
+                max_concurrent=max_concurrent,
+                rate_limiter=TokenBucket(rate_limit) if rate_limit else None,
+                circuit_breaker=CircuitBreaker() if circuit_breaker else None,
+                http2=http2
+            )
+
+        self.sms = AsyncSMS(self._http_client)
+
+    async def close(self) -> None:
+        """Close the HTTP connections."""
+        await self._http_client.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
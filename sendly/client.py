@@ -4,11 +4,100 @@ import os
 from typing import Optional
 
 from .errors import ValidationError
+from .resources.async_sms import AsyncSMS
 from .resources.sms import SMS
+from .utils.async_http_client import AsyncHttpClient
+from .utils.circuit_breaker import CircuitBreaker
 from .utils.http_client import HttpClient
+from .utils.httpx_client import HttpxClient
+from .utils.local_transport import (
+    AsyncLocalTransport,
+    LocalTransport,
+    _AsyncTransport,
+    _SyncTransport,
+)
+from .utils.rate_limiter import TokenBucket
 from .utils.validation import is_valid_api_key
 
 
+# SENDLY_API_KEY as first seen; None until a non-empty value is read
+_cached_api_key: Optional[str] = None
+
+
+def _default_api_key() -> Optional[str]:
+    """Read SENDLY_API_KEY, caching it once it has been set.
+
+    A missing or empty variable is not cached, so a key exported after the
+    first client was created is still picked up. Call
+    ``_clear_default_api_key()`` after changing the variable at runtime.
+    """
+    global _cached_api_key
+    if _cached_api_key is None:
+        _cached_api_key = os.getenv('SENDLY_API_KEY') or None
+    return _cached_api_key
+
+
+def _clear_default_api_key() -> None:
+    """Forget the cached SENDLY_API_KEY value."""
+    global _cached_api_key
+    _cached_api_key = None
+
+
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    """Fall back to SENDLY_API_KEY and check the key's format.
+
+    Args:
+        api_key: API key passed by the caller, if any
+
+    Returns:
+        The API key to use
+
+    Raises:
+        ValidationError: If API key is missing or invalid
+    """
+    if api_key is None:
+        api_key = _default_api_key()
+
+    if not api_key:
+        raise ValidationError(
+            'API key is required. Provide it as a parameter or set SENDLY_API_KEY environment variable.'
+        )
+
+    if not is_valid_api_key(api_key):
+        raise ValidationError(
+            'Invalid API key format. Expected: sl_test_*** or sl_live_***'
+        )
+
+    return api_key
+
+
+def _resolve_transport(transport: Optional[str], api_key: str) -> str:
+    """Fall back to SENDLY_LOCAL and check the transport can be used.
+
+    Args:
+        transport: Transport passed by the caller, if any
+        api_key: Resolved API key
+
+    Returns:
+        ``'http'`` or ``'local'``
+
+    Raises:
+        ValueError: If transport is not a known transport
+        ValidationError: If the local transport is requested with a live key
+    """
+    if transport is None:
+        transport = 'local' if os.environ.get('SENDLY_LOCAL') == '1' else 'http'
+
+    if transport not in ('http', 'local'):
+        raise ValueError(f"transport must be 'http' or 'local', got {transport!r}")
+
+    # A live key means real messages are expected; never drop them silently
+    if transport == 'local' and not api_key.startswith('sl_test_'):
+        raise ValidationError('The local transport requires a test API key (sl_test_***)')
+
+    return transport
+
+
 class Sendly:
     """Sendly client for sending SMS/MMS."""
 
@@ -18,47 +107,124 @@ class Sendly:
         base_url: str = "https://sendly.live/api",
         timeout: float = 30.0,
         max_retries: int = 3,
-        user_agent: Optional[str] = None
+        user_agent: Optional[str] = None,
+        pool_size: int = 32,
+        rate_limit: Optional[float] = None,
+        http2: bool = False,
+        transport: Optional[str] = None,
+        circuit_breaker: bool = False
     ):
         """Initialize Sendly client.
 
         Args:
-            api_key: API key (sl_live_* or sl_test_*). Falls back to SENDLY_API_KEY env var.
+            api_key: API key (sl_live_* or sl_test_*). Falls back to SENDLY_API_KEY env var,
+                which is read once per process.
             base_url: API base URL
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
             user_agent: Custom user agent
+            pool_size: Maximum number of pooled HTTP connections
+            rate_limit: Maximum requests per second to send, shared by sms and
+                async_sms. Requests beyond the rate wait client-side instead of
+                being rejected by the API. No limit by default.
+            http2: Use HTTP/2 for sms and async_sms so concurrent sends share
+                one connection (requires ``pip install sendly[http2]``)
+            transport: ``'http'`` to call the API, or ``'local'`` to answer
+                sandbox requests in-process from the magic number table
+                without any network I/O (test keys only). Defaults to
+                ``'local'`` when the SENDLY_LOCAL env var is ``1``.
+            circuit_breaker: Fail requests fast, without sending them, after 5
+                consecutive connection errors, timeouts or 5xx responses, until
+                a trial request succeeds 30 seconds later. Shared by sms and
+                async_sms. Off by default.
 
         Raises:
-            ValidationError: If API key is missing or invalid
+            ValidationError: If API key is missing or invalid, or the local
+                transport is used with a live key
+            ValueError: If transport is not ``'http'`` or ``'local'``
+            ImportError: If http2 is set and httpx or h2 is not installed
         """
-        if api_key is None:
-            api_key = os.getenv('SENDLY_API_KEY')
+        api_key = _resolve_api_key(api_key)
+        self._transport = _resolve_transport(transport, api_key)
+        breaker = CircuitBreaker() if circuit_breaker else None
+        self._user_agent = user_agent or "sendly-python/0.1.0"
 
-        if not api_key:
-            raise ValidationError(
-                'API key is required. Provide it as a parameter or set SENDLY_API_KEY environment variable.'
+        self._http_client: _SyncTransport
+        if self._transport == 'local':
+            self._http_client = LocalTransport(base_url, api_key)
+        elif http2:
+            self._http_client = HttpxClient(
+                base_url=base_url,
+                api_key=api_key,
+                timeout=timeout,
+                max_retries=max_retries,
+                user_agent=self._user_agent,
+                pool_size=pool_size,
+                rate_limiter=TokenBucket(rate_limit) if rate_limit else None,
+                circuit_breaker=breaker,
+                http2=True
             )
-
-        if not is_valid_api_key(api_key):
-            raise ValidationError(
-                'Invalid API key format. Expected: sl_test_*** or sl_live_***'
+        else:
+            self._http_client = HttpClient(
+                base_url=base_url,
+                api_key=api_key,
+                timeout=timeout,
+                max_retries=max_retries,
+                user_agent=self._user_agent,
+                pool_size=pool_size,
+                rate_limiter=TokenBucket(rate_limit) if rate_limit else None,
+                circuit_breaker=breaker
             )
 
-        self._http_client = HttpClient(
-            base_url=base_url,
-            api_key=api_key,
-            timeout=timeout,
-            max_retries=max_retries,
-            user_agent=user_agent or "sendly-python/0.1.0"
-        )
-
         self.sms = SMS(self._http_client)
 
+        self._http2 = http2
+        self._async_http_client: Optional[_AsyncTransport] = None
+        self._async_sms: Optional[AsyncSMS] = None
+
+    @property
+    def async_sms(self) -> AsyncSMS:
+        """Async SMS resource sharing this client's configuration.
+
+        Created on first access. Requires the optional httpx dependency.
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if self._async_sms is not None:
+            return self._async_sms
+
+        async_http_client: _AsyncTransport
+        if self._transport == 'local':
+            async_http_client = AsyncLocalTransport(
+                self._http_client.base_url,
+                self._http_client.api_key
+            )
+        else:
+            async_http_client = AsyncHttpClient(
+                base_url=self._http_client.base_url,
+                api_key=self._http_client.api_key,
+                timeout=self._http_client.timeout,
+                max_retries=self._http_client.max_retries,
+                user_agent=self._user_agent,
+                rate_limiter=self._http_client.rate_limiter,
+                circuit_breaker=self._http_client.circuit_breaker,
+                http2=self._http2
+            )
+        self._async_http_client = async_http_client
+        self._async_sms = AsyncSMS(async_http_client)
+        return self._async_sms
+
     def close(self) -> None:
         """Close the HTTP client session."""
         self._http_client.close()
 
+    async def aclose(self) -> None:
+        """Close the HTTP client session and any async connections."""
+        self._http_client.close()
+        if self._async_http_client is not None:
+            await self._async_http_client.aclose()
+
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -66,3 +232,11 @@ class Sendly:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
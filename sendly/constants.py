@@ -4,10 +4,15 @@ Sendly Sandbox Magic Numbers
 These phone numbers provide predictable behaviors for testing
 with test API keys (sl_test_*). Use these constants to ensure
 consistent testing across your application.
+
+MAGIC_NUMBERS and MAGIC_NUMBER_INFO are read-only mappings.
 """
 
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
 # Test numbers organized by category
-MAGIC_NUMBERS = {
+_RAW_MAGIC_NUMBERS = {
     # Success scenarios - Messages that will be delivered successfully
     'success': {
         'instant': '+15550001234',  # Instant delivery success
@@ -46,118 +51,93 @@ MAGIC_NUMBERS = {
     }
 }
 
-# Test number metadata for documentation
-MAGIC_NUMBER_INFO = {
+MAGIC_NUMBERS = MappingProxyType({
+    group: MappingProxyType(numbers)
+    for group, numbers in _RAW_MAGIC_NUMBERS.items()
+})
+
+# Singular category names used in MAGIC_NUMBER_INFO
+_CATEGORY_NAMES = {
+    'success': 'success',
+    'errors': 'error',
+    'delays': 'delay',
+    'carriers': 'carrier',
+    'webhooks': 'webhook',
+}
+
+# Per-number documentation details (description, delays, expected errors)
+_DETAILS: Mapping[str, Mapping[str, Union[str, int]]] = {
     # Success scenarios
-    '+15550001234': {
-        'number': '+15550001234',
-        'category': 'success',
-        'description': 'Instant delivery success',
-    },
-    '+15550001235': {
-        'number': '+15550001235',
-        'category': 'success',
-        'description': 'Success with 5 second delay',
-        'delay': 5000,
-    },
-    '+15550001236': {
-        'number': '+15550001236',
-        'category': 'success',
-        'description': 'Verizon carrier simulation',
-    },
-    
+    '+15550001234': {'description': 'Instant delivery success'},
+    '+15550001235': {'description': 'Success with 5 second delay', 'delay': 5000},
+    '+15550001236': {'description': 'Verizon carrier simulation'},
+
     # Error scenarios
     '+15550001001': {
-        'number': '+15550001001',
-        'category': 'error',
         'description': 'Invalid phone number format',
         'http_status': 400,
         'error': 'invalid_number',
     },
     '+15550001002': {
-        'number': '+15550001002',
-        'category': 'error',
         'description': 'Carrier content rejection',
         'http_status': 400,
         'error': 'carrier_rejection',
     },
     '+15550001003': {
-        'number': '+15550001003',
-        'category': 'error',
         'description': 'Rate limit exceeded',
         'http_status': 429,
         'error': 'rate_limit_exceeded',
     },
     '+15550001004': {
-        'number': '+15550001004',
-        'category': 'error',
         'description': 'Request timeout',
         'http_status': 500,
         'error': 'timeout_error',
     },
     '+15550001005': {
-        'number': '+15550001005',
-        'category': 'error',
         'description': 'Insufficient account balance',
         'http_status': 402,
         'error': 'insufficient_balance',
     },
-    
+
     # Delay scenarios
-    '+15550001010': {
-        'number': '+15550001010',
-        'category': 'delay',
-        'description': '10 second delivery delay',
-        'delay': 10000,
-    },
-    '+15550001030': {
-        'number': '+15550001030',
-        'category': 'delay',
-        'description': '30 second delivery delay',
-        'delay': 30000,
-    },
-    '+15550001060': {
-        'number': '+15550001060',
-        'category': 'delay',
-        'description': '60 second delivery delay',
-        'delay': 60000,
-    },
-    
+    '+15550001010': {'description': '10 second delivery delay', 'delay': 10000},
+    '+15550001030': {'description': '30 second delivery delay', 'delay': 30000},
+    '+15550001060': {'description': '60 second delivery delay', 'delay': 60000},
+
     # Carrier scenarios
-    '+15550002001': {
-        'number': '+15550002001',
-        'category': 'carrier',
-        'description': 'Verizon network simulation',
-    },
-    '+15550002002': {
-        'number': '+15550002002',
-        'category': 'carrier',
-        'description': 'AT&T network simulation',
-    },
-    '+15550002003': {
-        'number': '+15550002003',
-        'category': 'carrier',
-        'description': 'T-Mobile network simulation',
-    },
-    
+    '+15550002001': {'description': 'Verizon network simulation'},
+    '+15550002002': {'description': 'AT&T network simulation'},
+    '+15550002003': {'description': 'T-Mobile network simulation'},
+
     # Webhook scenarios
-    '+15550003001': {
-        'number': '+15550003001',
-        'category': 'webhook',
-        'description': 'Successful webhook delivery',
-    },
-    '+15550003002': {
-        'number': '+15550003002',
-        'category': 'webhook',
-        'description': 'Webhook timeout simulation',
-    },
-    '+15550003003': {
-        'number': '+15550003003',
-        'category': 'webhook',
-        'description': 'Webhook 500 error with retry',
-    },
+    '+15550003001': {'description': 'Successful webhook delivery'},
+    '+15550003002': {'description': 'Webhook timeout simulation'},
+    '+15550003003': {'description': 'Webhook 500 error with retry'},
 }
 
+# Test number metadata for documentation, derived from MAGIC_NUMBERS
+MAGIC_NUMBER_INFO = MappingProxyType({
+    number: MappingProxyType({
+        'number': number,
+        'category': _CATEGORY_NAMES[group],
+        **_DETAILS[number],
+    })
+    for group, numbers in MAGIC_NUMBERS.items()
+    for number in numbers.values()
+})
+
+# Reverse index: category -> numbers, in MAGIC_NUMBER_INFO order
+_numbers_by_category: Dict[str, List[str]] = {}
+for _group, _numbers in MAGIC_NUMBERS.items():
+    _numbers_by_category.setdefault(_CATEGORY_NAMES[_group], []).extend(_numbers.values())
+
+_BY_CATEGORY: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    category: tuple(numbers) for category, numbers in _numbers_by_category.items()
+})
+del _group, _numbers, _numbers_by_category
+
+_MAGIC_NUMBER_SET = frozenset(MAGIC_NUMBER_INFO)
+
 
 def is_magic_number(phone_number: str) -> bool:
     """
@@ -169,10 +149,10 @@ def is_magic_number(phone_number: str) -> bool:
     Returns:
         True if the number is a test number, False otherwise
     """
-    return phone_number in MAGIC_NUMBER_INFO
+    return phone_number in _MAGIC_NUMBER_SET
 
 
-def get_magic_number_info(phone_number: str) -> dict:
+def get_magic_number_info(phone_number: str) -> Optional[Mapping[str, object]]:
     """
     Get test number information.
     
@@ -180,12 +160,12 @@ def get_magic_number_info(phone_number: str) -> dict:
         phone_number: The test number to get info for
         
     Returns:
-        Test number information dictionary or None if not found
+        Read-only test number information mapping or None if not found
     """
     return MAGIC_NUMBER_INFO.get(phone_number)
 
 
-def get_magic_numbers_by_category(category: str) -> list:
+def get_magic_numbers_by_category(category: str) -> List[str]:
     """
     Get all test numbers by category.
     
@@ -195,14 +175,10 @@ def get_magic_numbers_by_category(category: str) -> list:
     Returns:
         List of test numbers in the specified category
     """
-    return [
-        info['number'] 
-        for info in MAGIC_NUMBER_INFO.values() 
-        if info.get('category') == category
-    ]
+    return list(_BY_CATEGORY.get(category, ()))
 
 
-def get_error_magic_numbers() -> list:
+def get_error_magic_numbers() -> List[str]:
     """
     Get all test numbers that produce errors.
     
@@ -212,7 +188,7 @@ def get_error_magic_numbers() -> list:
     return get_magic_numbers_by_category('error')
 
 
-def get_success_magic_numbers() -> list:
+def get_success_magic_numbers() -> List[str]:
     """
     Get all test numbers that succeed.
     
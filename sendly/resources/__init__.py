@@ -1,5 +1,6 @@
 """Resource modules for the Sendly Python SDK."""
 
+from .async_sms import AsyncSMS
 from .sms import SMS
 
-__all__ = ['SMS']
\ No newline at end of file
+__all__ = ['SMS', 'AsyncSMS']
\ No newline at end of file
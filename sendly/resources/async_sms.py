@@ -0,0 +1,239 @@
+"""Async SMS resource for the Sendly Python SDK."""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+from ..types import SMSRequest, SMSResponse
+from ..utils.batcher import _unpack_bulk_response
+from ..utils.validation import validate_sms_fields
+from ..utils.local_transport import _AsyncTransport
+from .sms import _SMSBase, _build_sms_payload, _is_settled, _message_path
+
+
+class AsyncSMS(_SMSBase):
+    """SMS resource for sending messages from asyncio code.
+
+    Requests share the client's concurrency limit, so many sends can be
+    awaited together, e.g. with ``asyncio.gather``.
+    """
+
+    def __init__(self, http_client: _AsyncTransport):
+        """Initialize async SMS resource.
+
+        Args:
+            http_client: Async HTTP client or async local transport instance
+        """
+        self._http_client = http_client
+
+    async def send(
+        self,
+        to: str,
+        text: Optional[str] = None,
+        from_: Optional[str] = None,
+        message_type: Optional[str] = None,
+        media_urls: Optional[List[str]] = None,
+        subject: Optional[str] = None,
+        webhook_url: Optional[str] = None,
+        webhook_failover_url: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        idempotency_key: Optional[str] = None
+    ) -> SMSResponse:
+        """Send an SMS/MMS message.
+
+        Args:
+            to: Destination phone number in E.164 format
+            text: Message text (optional for MMS-only messages)
+            from_: Sender phone number (optional - auto-selected if not provided)
+            message_type: Message type for routing priority
+            media_urls: HTTPS URLs for MMS media (max 10)
+            subject: MMS subject line
+            webhook_url: HTTPS webhook URL for delivery notifications
+            webhook_failover_url: HTTPS backup webhook URL
+            tags: Message tags for analytics (max 20, 50 chars each)
+            idempotency_key: Unique key for this logical message. Reuse it when
+                retrying the same send so the API delivers and bills it once.
+
+        Returns:
+            SMS response with message details and routing info
+
+        Raises:
+            ValidationError: If request validation fails
+            AuthenticationError: If API key is invalid
+            RateLimitError: If rate limits are exceeded
+            APIError: For other API errors
+            NetworkError: For network-related errors
+        """
+        validate_sms_fields(
+            to,
+            text=text,
+            from_=from_,
+            message_type=message_type,
+            media_urls=media_urls,
+            webhook_url=webhook_url,
+            webhook_failover_url=webhook_failover_url,
+            tags=tags
+        )
+        payload = _build_sms_payload(
+            to,
+            text=text,
+            from_=from_,
+            message_type=message_type,
+            media_urls=media_urls,
+            subject=subject,
+            webhook_url=webhook_url,
+            webhook_failover_url=webhook_failover_url,
+            tags=tags,
+            idempotency_key=idempotency_key
+        )
+
+        return await self._send_payload(payload)
+
+    def submit(
+        self,
+        to: str,
+        text: Optional[str] = None,
+        from_: Optional[str] = None,
+        message_type: Optional[str] = None,
+        media_urls: Optional[List[str]] = None,
+        subject: Optional[str] = None,
+        webhook_url: Optional[str] = None,
+        webhook_failover_url: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        idempotency_key: Optional[str] = None
+    ) -> 'asyncio.Future[SMSResponse]':
+        """Start sending an SMS/MMS message without waiting for it.
+
+        The message is validated immediately and sent by a task on the
+        running event loop. Takes the same arguments as send().
+
+        Returns:
+            Task resolving to the SMS response. It raises the same API and
+            network errors as send().
+
+        Raises:
+            ValidationError: If request validation fails
+            RuntimeError: If called without a running event loop
+        """
+        validate_sms_fields(
+            to,
+            text=text,
+            from_=from_,
+            message_type=message_type,
+            media_urls=media_urls,
+            webhook_url=webhook_url,
+            webhook_failover_url=webhook_failover_url,
+            tags=tags
+        )
+        payload = _build_sms_payload(
+            to,
+            text=text,
+            from_=from_,
+            message_type=message_type,
+            media_urls=media_urls,
+            subject=subject,
+            webhook_url=webhook_url,
+            webhook_failover_url=webhook_failover_url,
+            tags=tags,
+            idempotency_key=idempotency_key
+        )
+
+        loop = asyncio.get_running_loop()
+        return loop.create_task(self._send_payload(payload))
+
+    async def send_many(
+        self,
+        messages: List[SMSRequest],
+        chunk_size: int = 100
+    ) -> List[SMSResponse]:
+        """Send several SMS/MMS messages in as few requests as possible.
+
+        Every message is validated before anything is sent, then the messages
+        are posted to the bulk endpoint ``chunk_size`` at a time.
+
+        Args:
+            messages: Messages to send
+            chunk_size: Maximum number of messages per request
+
+        Returns:
+            SMS responses in the same order as ``messages``
+
+        Raises:
+            ValueError: If chunk_size is less than 1
+            ValidationError: If any message fails validation
+            AuthenticationError: If API key is invalid
+            RateLimitError: If rate limits are exceeded
+            APIError: For other API errors, or a bulk response that doesn't
+                match the request
+            NetworkError: For network-related errors
+        """
+        responses: List[SMSResponse] = []
+        for chunk in self._bulk_chunks(messages, chunk_size):
+            data = await self._http_client.post('/v1/send/bulk', {'messages': chunk})
+            responses.extend(
+                self._transform_response(item)
+                for item in _unpack_bulk_response(data, len(chunk))
+            )
+        return responses
+
+    async def _send_payload(self, payload: Dict[str, Any]) -> SMSResponse:
+        """Post one message payload and transform the response.
+
+        Args:
+            payload: API payload built by ``_build_sms_payload``
+
+        Returns:
+            SMS response with message details and routing info
+        """
+        response_data = await self._http_client.post('/v1/send', payload)
+        return self._transform_response(response_data)
+
+    async def get(self, message_id: str) -> SMSResponse:
+        """Fetch the current state of a message.
+
+        Args:
+            message_id: ID returned when the message was sent
+
+        Returns:
+            SMS response with the message's latest status
+
+        Raises:
+            ValidationError: If message_id is empty
+            AuthenticationError: If API key is invalid
+            RateLimitError: If rate limits are exceeded
+            APIError: For other API errors, including unknown messages
+            NetworkError: For network-related errors
+        """
+        response_data = await self._http_client.get(_message_path(message_id))
+        return self._transform_response(response_data)
+
+    async def wait_for_status(
+        self,
+        message_id: str,
+        target: str = 'delivered',
+        timeout: float = 90.0,
+        initial: float = 0.5,
+        factor: float = 2.0,
+        max_interval: float = 8.0
+    ) -> SMSResponse:
+        """Poll a message until it reaches ``target`` or a final status.
+
+        Takes the same arguments as ``SMS.wait_for_status()``.
+
+        Returns:
+            The latest SMS response. Its status is ``target`` unless the
+            message settled on another final status or the timeout expired.
+
+        Raises:
+            Same exceptions as get()
+        """
+        deadline = time.monotonic() + timeout
+        interval = initial
+
+        while True:
+            response = await self.get(message_id)
+            remaining = deadline - time.monotonic()
+            if _is_settled(response.status, target) or remaining <= 0:
+                return response
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * factor, max_interval)
@@ -1,20 +1,267 @@
 """SMS resource for the Sendly Python SDK."""
 
-from typing import Dict, List, Optional
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import quote
 
+from ..errors import ValidationError
 from ..types import SMSRequest, SMSResponse, CostInfo, RoutingInfo
-from ..utils.validation import validate_sms_request
-from ..utils.http_client import HttpClient
+from ..utils.validation import validate_sms_fields, validate_sms_request
+from ..utils.batcher import _unpack_bulk_response
+from ..utils.local_transport import _SyncTransport
 
 
-class SMS:
+# Statuses a message never leaves, so waiting for any other is pointless
+_FINAL_STATUSES = frozenset({'delivered', 'failed', 'undelivered'})
+
+
+def _message_path(message_id: str) -> str:
+    """Return the API path of a message.
+
+    Args:
+        message_id: Message ID
+
+    Returns:
+        Endpoint for the message
+
+    Raises:
+        ValidationError: If message_id is empty
+    """
+    if not message_id:
+        raise ValidationError('message_id is required')
+    return f"/v1/messages/{quote(message_id, safe='')}"
+
+
+def _is_settled(status: str, target: str) -> bool:
+    """Check whether waiting for ``target`` is over.
+
+    Args:
+        status: Current message status
+        target: Status being waited for
+
+    Returns:
+        True if the message reached ``target`` or a final status
+    """
+    return status == target or status in _FINAL_STATUSES
+
+
+def _build_sms_payload(
+    to: str,
+    text: Optional[str] = None,
+    from_: Optional[str] = None,
+    message_type: Optional[str] = None,
+    media_urls: Optional[List[str]] = None,
+    subject: Optional[str] = None,
+    webhook_url: Optional[str] = None,
+    webhook_failover_url: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+    idempotency_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build the API payload for one message, omitting unset fields.
+
+    Args:
+        to: Destination phone number
+        text: Message text
+        from_: Sender phone number
+        message_type: Message type (defaults to ``transactional``)
+        media_urls: MMS media URLs
+        subject: MMS subject line
+        webhook_url: Delivery webhook URL
+        webhook_failover_url: Backup webhook URL
+        tags: Message tags
+        idempotency_key: Idempotency key for the send
+
+    Returns:
+        Dictionary payload for API request
+    """
+    payload: Dict[str, Any] = {
+        'to': to,
+        'messageType': message_type or 'transactional'
+    }
+
+    if text:
+        payload['text'] = text
+
+    if from_:
+        payload['from'] = from_
+
+    if media_urls:
+        payload['media_urls'] = media_urls
+
+    if subject:
+        payload['subject'] = subject
+
+    if webhook_url:
+        payload['webhook_url'] = webhook_url
+
+    if webhook_failover_url:
+        payload['webhook_failover_url'] = webhook_failover_url
+
+    if tags:
+        payload['tags'] = tags
+
+    if idempotency_key:
+        payload['idempotencyKey'] = idempotency_key
+
+    return payload
+
+
+def _parse_cost_string(cost: str) -> CostInfo:
+    """Parse a cost string (e.g., "$0.00" -> 0.0)."""
+    return CostInfo(amount=float(cost.replace('$', '').replace(',', '')), currency='USD')
+
+
+def _parse_cost_number(cost: float) -> CostInfo:
+    """Handle a numeric cost (e.g., 0 or 0.01)."""
+    return CostInfo(amount=float(cost), currency='USD')
+
+
+def _parse_cost_dict(cost: Dict[str, Any]) -> CostInfo:
+    """Handle a cost object with amount and currency."""
+    return CostInfo(
+        amount=cost.get('amount', 0.0),
+        currency=cost.get('currency', 'USD')
+    )
+
+
+# Cost parsers keyed by the exact type the API returned
+_COST_PARSERS: Dict[type, Callable[[Any], CostInfo]] = {
+    str: _parse_cost_string,
+    int: _parse_cost_number,
+    float: _parse_cost_number,
+    dict: _parse_cost_dict,
+}
+
+
+class _SMSBase:
+    """Validation and payload/response handling shared by SMS and AsyncSMS.
+
+    Subclasses set ``_http_client`` and provide the methods that talk to it.
+    """
+
+    def _bulk_chunks(
+        self,
+        messages: List[SMSRequest],
+        chunk_size: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Validate messages and split their payloads into bulk chunks.
+
+        Args:
+            messages: Messages to send
+            chunk_size: Maximum number of messages per chunk
+
+        Returns:
+            Iterator over lists of API payloads
+
+        Raises:
+            ValueError: If chunk_size is less than 1
+            ValidationError: If any message fails validation
+        """
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+
+        for request in messages:
+            validate_sms_request(request)
+        payloads = [self._build_payload(request) for request in messages]
+
+        return (
+            payloads[start:start + chunk_size]
+            for start in range(0, len(payloads), chunk_size)
+        )
+
+    def _build_payload(self, request: SMSRequest) -> Dict[str, Any]:
+        """Build API payload from request.
+
+        Args:
+            request: SMS request object
+
+        Returns:
+            Dictionary payload for API request
+        """
+        return _build_sms_payload(
+            request.to,
+            text=request.text,
+            from_=request.from_,
+            message_type=request.message_type,
+            media_urls=request.media_urls,
+            subject=request.subject,
+            webhook_url=request.webhook_url,
+            webhook_failover_url=request.webhook_failover_url,
+            tags=request.tags,
+            idempotency_key=request.idempotency_key
+        )
+
+    def _transform_response(self, data: Dict[str, Any]) -> SMSResponse:
+        """Transform API response to SMSResponse object.
+
+        Args:
+            data: Raw API response data
+
+        Returns:
+            Structured SMS response object
+        """
+        get = data.get
+
+        # Extract routing info (if present)
+        routing_data = get('routing', {})
+        routing = None
+        if routing_data:
+            routing = RoutingInfo(
+                number_type=routing_data.get('numberType', ''),
+                rate_limit=routing_data.get('rateLimit', 0),
+                coverage=routing_data.get('coverage', ''),
+                reason=routing_data.get('reason', ''),
+                country_code=routing_data.get('countryCode', '')
+            )
+
+        # Extract cost (API can return string "$0.00", number 0, or dict)
+        cost_data = get('cost', 0)
+        parse_cost = _COST_PARSERS.get(type(cost_data))
+        if parse_cost is None:
+            # Subclasses (bool, OrderedDict, ...) take the slow path
+            parse_cost = next(
+                (parser for cls, parser in _COST_PARSERS.items()
+                 if isinstance(cost_data, cls)),
+                None
+            )
+        cost = parse_cost(cost_data) if parse_cost is not None else None
+
+        # Create response object
+        return SMSResponse(
+            id=get('id', get('messageId', '')),
+            status=get('status', ''),
+            from_=get('from', ''),
+            to=get('to', ''),
+            text=get('text'),
+            created_at=get('created_at', get('timestamp', '')),
+            segments=get('segments', 1),
+            cost=cost,
+            direction=get('direction', 'outbound'),
+            routing=routing,
+            message_type=get('messageType'),
+            media_type=get('mediaType'),
+            media_urls=get('media_urls'),
+            subject=get('subject'),
+            webhook_url=get('webhook_url'),
+            webhook_failover_url=get('webhook_failover_url'),
+            tags=get('tags'),
+            carrier=get('carrier'),
+            line_type=get('lineType'),
+            parts=get('parts'),
+            encoding=get('encoding'),
+            media=get('media')
+        )
+
+
+class SMS(_SMSBase):
     """SMS resource for sending messages."""
 
-    def __init__(self, http_client: HttpClient):
+    def __init__(self, http_client: _SyncTransport):
         """Initialize SMS resource.
 
         Args:
-            http_client: HTTP client instance
+            http_client: HTTP client or local transport instance
         """
         self._http_client = http_client
 
@@ -28,7 +275,8 @@ class SMS:
         subject: Optional[str] = None,
         webhook_url: Optional[str] = None,
         webhook_failover_url: Optional[str] = None,
-        tags: Optional[List[str]] = None
+        tags: Optional[List[str]] = None,
+        idempotency_key: Optional[str] = None
     ) -> SMSResponse:
         """Send an SMS/MMS message.
 
@@ -42,6 +290,8 @@ class SMS:
             webhook_url: HTTPS webhook URL for delivery notifications
             webhook_failover_url: HTTPS backup webhook URL
             tags: Message tags for analytics (max 20, 50 chars each)
+            idempotency_key: Unique key for this logical message. Reuse it when
+                retrying the same send so the API delivers and bills it once.
 
         Returns:
             SMS response with message details and routing info
@@ -53,24 +303,31 @@ class SMS:
             APIError: For other API errors
             NetworkError: For network-related errors
         """
-        # Create request object
-        request = SMSRequest(
-            to=to,
+        # Validate request
+        validate_sms_fields(
+            to,
             text=text,
             from_=from_,
             message_type=message_type,
             media_urls=media_urls,
-            subject=subject,
             webhook_url=webhook_url,
             webhook_failover_url=webhook_failover_url,
             tags=tags
         )
 
-        # Validate request
-        validate_sms_request(request)
-
         # Prepare payload for API
-        payload = self._build_payload(request)
+        payload = _build_sms_payload(
+            to,
+            text=text,
+            from_=from_,
+            message_type=message_type,
+            media_urls=media_urls,
+            subject=subject,
+            webhook_url=webhook_url,
+            webhook_failover_url=webhook_failover_url,
+            tags=tags,
+            idempotency_key=idempotency_key
+        )
 
         # Make API request
         response_data = self._http_client.post('/v1/send', payload)
@@ -78,103 +335,158 @@ class SMS:
         # Transform response
         return self._transform_response(response_data)
 
-    def _build_payload(self, request: SMSRequest) -> Dict[str, any]:
-        """Build API payload from request.
+    def submit(
+        self,
+        to: str,
+        text: Optional[str] = None,
+        from_: Optional[str] = None,
+        message_type: Optional[str] = None,
+        media_urls: Optional[List[str]] = None,
+        subject: Optional[str] = None,
+        webhook_url: Optional[str] = None,
+        webhook_failover_url: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        idempotency_key: Optional[str] = None
+    ) -> 'Future[SMSResponse]':
+        """Queue an SMS/MMS message for batched sending.
 
-        Args:
-            request: SMS request object
+        Messages submitted close together (from one or many threads) are
+        coalesced into a single bulk request. Takes the same arguments as
+        send().
 
         Returns:
-            Dictionary payload for API request
+            Future resolving to the SMS response. It raises the same API and
+            network errors as send().
+
+        Raises:
+            ValidationError: If request validation fails
         """
-        payload = {
-            'to': request.to,
-            'messageType': request.message_type or 'transactional'
-        }
+        validate_sms_fields(
+            to,
+            text=text,
+            from_=from_,
+            message_type=message_type,
+            media_urls=media_urls,
+            webhook_url=webhook_url,
+            webhook_failover_url=webhook_failover_url,
+            tags=tags
+        )
+        payload = _build_sms_payload(
+            to,
+            text=text,
+            from_=from_,
+            message_type=message_type,
+            media_urls=media_urls,
+            subject=subject,
+            webhook_url=webhook_url,
+            webhook_failover_url=webhook_failover_url,
+            tags=tags,
+            idempotency_key=idempotency_key
+        )
 
-        if request.text:
-            payload['text'] = request.text
+        future: 'Future[SMSResponse]' = Future()
 
-        if request.from_:
-            payload['from'] = request.from_
+        def _resolve(raw: 'Future[Dict[str, Any]]') -> None:
+            try:
+                future.set_result(self._transform_response(raw.result()))
+            except Exception as e:
+                future.set_exception(e)
 
-        if request.media_urls:
-            payload['media_urls'] = request.media_urls
+        self._http_client.post_batched('/v1/send', payload).add_done_callback(_resolve)
+        return future
 
-        if request.subject:
-            payload['subject'] = request.subject
+    def send_many(
+        self,
+        messages: List[SMSRequest],
+        chunk_size: int = 100
+    ) -> List[SMSResponse]:
+        """Send several SMS/MMS messages in as few requests as possible.
 
-        if request.webhook_url:
-            payload['webhook_url'] = request.webhook_url
+        Every message is validated before anything is sent, then the messages
+        are posted to the bulk endpoint ``chunk_size`` at a time.
 
-        if request.webhook_failover_url:
-            payload['webhook_failover_url'] = request.webhook_failover_url
+        Args:
+            messages: Messages to send
+            chunk_size: Maximum number of messages per request
 
-        if request.tags:
-            payload['tags'] = request.tags
+        Returns:
+            SMS responses in the same order as ``messages``
 
-        return payload
+        Raises:
+            ValueError: If chunk_size is less than 1
+            ValidationError: If any message fails validation
+            AuthenticationError: If API key is invalid
+            RateLimitError: If rate limits are exceeded
+            APIError: For other API errors, or a bulk response that doesn't
+                match the request
+            NetworkError: For network-related errors
+        """
+        responses: List[SMSResponse] = []
+        for chunk in self._bulk_chunks(messages, chunk_size):
+            data = self._http_client.post('/v1/send/bulk', {'messages': chunk})
+            responses.extend(
+                self._transform_response(item)
+                for item in _unpack_bulk_response(data, len(chunk))
+            )
+        return responses
 
-    def _transform_response(self, data: Dict[str, any]) -> SMSResponse:
-        """Transform API response to SMSResponse object.
+    def get(self, message_id: str) -> SMSResponse:
+        """Fetch the current state of a message.
 
         Args:
-            data: Raw API response data
+            message_id: ID returned when the message was sent
 
         Returns:
-            Structured SMS response object
+            SMS response with the message's latest status
+
+        Raises:
+            ValidationError: If message_id is empty
+            AuthenticationError: If API key is invalid
+            RateLimitError: If rate limits are exceeded
+            APIError: For other API errors, including unknown messages
+            NetworkError: For network-related errors
         """
-        # Extract routing info (if present)
-        routing_data = data.get('routing', {})
-        routing = None
-        if routing_data:
-            routing = RoutingInfo(
-                number_type=routing_data.get('numberType', ''),
-                rate_limit=routing_data.get('rateLimit', 0),
-                coverage=routing_data.get('coverage', ''),
-                reason=routing_data.get('reason', ''),
-                country_code=routing_data.get('countryCode', '')
-            )
+        response_data = self._http_client.get(_message_path(message_id))
+        return self._transform_response(response_data)
 
-        # Extract cost (API can return string "$0.00", number 0, or dict)
-        cost_data = data.get('cost', 0)
-        cost = None
-        if isinstance(cost_data, str):
-            # Parse cost string (e.g., "$0.00" -> 0.0)
-            cost_value = float(cost_data.replace('$', '').replace(',', ''))
-            cost = CostInfo(amount=cost_value, currency='USD')
-        elif isinstance(cost_data, (int, float)):
-            # Handle numeric cost (e.g., 0 or 0.01)
-            cost = CostInfo(amount=float(cost_data), currency='USD')
-        elif isinstance(cost_data, dict):
-            # Handle dict format
-            cost = CostInfo(
-                amount=cost_data.get('amount', 0.0),
-                currency=cost_data.get('currency', 'USD')
-            )
+    def wait_for_status(
+        self,
+        message_id: str,
+        target: str = 'delivered',
+        timeout: float = 90.0,
+        initial: float = 0.5,
+        factor: float = 2.0,
+        max_interval: float = 8.0
+    ) -> SMSResponse:
+        """Poll a message until it reaches ``target`` or a final status.
 
-        # Create response object
-        return SMSResponse(
-            id=data.get('id', data.get('messageId', '')),
-            status=data.get('status', ''),
-            from_=data.get('from', ''),
-            to=data.get('to', ''),
-            text=data.get('text'),
-            created_at=data.get('created_at', data.get('timestamp', '')),
-            segments=data.get('segments', 1),
-            cost=cost,
-            direction=data.get('direction', 'outbound'),
-            routing=routing,
-            message_type=data.get('messageType'),
-            media_type=data.get('mediaType'),
-            media_urls=data.get('media_urls'),
-            subject=data.get('subject'),
-            webhook_url=data.get('webhook_url'),
-            webhook_failover_url=data.get('webhook_failover_url'),
-            tags=data.get('tags'),
-            carrier=data.get('carrier'),
-            line_type=data.get('lineType'),
-            parts=data.get('parts'),
-            encoding=data.get('encoding'),
-            media=data.get('media')
-        )
+        The poll interval starts at ``initial`` seconds and grows by
+        ``factor`` up to ``max_interval``, so a long wait costs a handful of
+        requests rather than one per interval. Waiting stops early if the
+        message reaches a final status (delivered, failed, undelivered).
+
+        Args:
+            message_id: ID returned when the message was sent
+            target: Status to wait for
+            timeout: Maximum seconds to wait
+            initial: First poll interval in seconds
+            factor: Multiplier applied to the interval after each poll
+            max_interval: Upper bound for the poll interval in seconds
+
+        Returns:
+            The latest SMS response. Its status is ``target`` unless the
+            message settled on another final status or the timeout expired.
+
+        Raises:
+            Same exceptions as get()
+        """
+        deadline = time.monotonic() + timeout
+        interval = initial
+
+        while True:
+            response = self.get(message_id)
+            remaining = deadline - time.monotonic()
+            if _is_settled(response.status, target) or remaining <= 0:
+                return response
+            time.sleep(min(interval, remaining))
+            interval = min(interval * factor, max_interval)
@@ -1,13 +1,22 @@
 """Type definitions for the Sendly Python SDK."""
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Literal, Optional, Dict, Any
+from typing import List, Optional, Dict, Any
+
+if sys.version_info >= (3, 8):
+    from typing import Literal
+else:  # pragma: no cover - Python 3.7
+    from typing_extensions import Literal
+
+# Use __slots__ instead of a per-instance __dict__ where supported (3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 # Message type enumeration
 MessageType = Literal['transactional', 'marketing', 'otp', 'alert', 'promotional']
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SMSRequest:
     """Request parameters for sending an SMS/MMS message."""
     
@@ -20,9 +29,10 @@ class SMSRequest:
     webhook_url: Optional[str] = None
     webhook_failover_url: Optional[str] = None
     tags: Optional[List[str]] = None
+    idempotency_key: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class RoutingInfo:
     """Smart routing information for a message."""
     
@@ -33,7 +43,7 @@ class RoutingInfo:
     country_code: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CostInfo:
     """Cost information for a message."""
     
@@ -41,7 +51,7 @@ class CostInfo:
     currency: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SMSResponse:
     """Response from sending an SMS/MMS message."""
     
@@ -54,7 +64,7 @@ class SMSResponse:
     segments: int
     cost: Optional[CostInfo]
     direction: str
-    routing: RoutingInfo
+    routing: Optional[RoutingInfo]
     message_type: Optional[str] = None
     media_type: Optional[str] = None
     media_urls: Optional[List[str]] = None
@@ -69,7 +79,7 @@ class SMSResponse:
     media: Optional[List[Dict[str, Any]]] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MessageSummary:
     """Summary information for a message."""
     
@@ -86,7 +96,7 @@ class MessageSummary:
     updated_at: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PaginationInfo:
     """Pagination information for list responses."""
     
@@ -98,7 +108,7 @@ class PaginationInfo:
     has_prev: bool
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MessageListResponse:
     """Response from listing messages."""
     
@@ -107,7 +117,7 @@ class MessageListResponse:
     pagination: PaginationInfo
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class StatsResponse:
     """Response from getting usage statistics."""
     
@@ -115,7 +125,7 @@ class StatsResponse:
     data: Dict[str, Any]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class LiveStatsResponse:
     """Response from getting live statistics."""
     
@@ -123,7 +133,7 @@ class LiveStatsResponse:
     data: Dict[str, Any]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class RateLimitStatusResponse:
     """Response from getting rate limit status."""
     
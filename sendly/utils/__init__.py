@@ -8,7 +8,12 @@ from .validation import (
     is_toll_free,
     validate_toll_free_routing,
     validate_sms_request,
+    validate_sms_fields,
 )
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .httpx_client import HttpxClient
+from .local_transport import AsyncLocalTransport, LocalTransport
+from .rate_limiter import TokenBucket
 
 __all__ = [
     'is_valid_phone_number',
@@ -18,4 +23,11 @@ __all__ = [
     'is_toll_free',
     'validate_toll_free_routing',
     'validate_sms_request',
+    'validate_sms_fields',
+    'TokenBucket',
+    'CircuitBreaker',
+    'CircuitState',
+    'HttpxClient',
+    'LocalTransport',
+    'AsyncLocalTransport',
 ]
\ No newline at end of file
@@ -0,0 +1,261 @@
+"""Async HTTP client with retry logic for the Sendly Python SDK."""
+
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from .http_client import BaseHttpClient, _RetryDecision, _dumps
+from .httpx_client import (
+    _HTTPX_CONNECTION_ERRORS,
+    _HTTPX_REQUEST_ERRORS,
+    _HTTPX_TIMEOUT_ERRORS,
+    _httpx_response_status,
+)
+from .circuit_breaker import CircuitBreaker
+from .rate_limiter import TokenBucket
+
+
+class AsyncHttpClient(BaseHttpClient):
+    """Async HTTP client with exponential backoff retry logic.
+
+    Requires the optional ``httpx`` dependency (``pip install sendly[async]``).
+    """
+
+    _REQUEST_ERRORS = _HTTPX_REQUEST_ERRORS
+    _TIMEOUT_ERRORS = _HTTPX_TIMEOUT_ERRORS
+    _CONNECTION_ERRORS = _HTTPX_CONNECTION_ERRORS
+    _response_status = staticmethod(_httpx_response_status)
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        user_agent: str = "sendly-python/0.1.0",
+        max_concurrent: int = 64,
+        rate_limiter: Optional[TokenBucket] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        http2: bool = False
+    ):
+        """Initialize async HTTP client.
+
+        Args:
+            base_url: Base URL for API requests
+            api_key: Sendly API key
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retry attempts
+            user_agent: User agent string
+            max_concurrent: Maximum number of requests in flight at once
+            rate_limiter: Token bucket each request attempt must take a token from
+            circuit_breaker: Breaker that fails requests fast while the API is down
+            http2: Multiplex concurrent requests over one HTTP/2 connection
+                (requires ``pip install sendly[http2]``)
+
+        Raises:
+            ImportError: If httpx, or h2 when http2 is set, is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                'The async client requires httpx. '
+                'Install it with: pip install sendly[async]'
+            )
+
+        super().__init__(
+            base_url,
+            api_key,
+            timeout=timeout,
+            max_retries=max_retries,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker
+        )
+        self.max_concurrent = max_concurrent
+
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_concurrent,
+                max_keepalive_connections=max_concurrent
+            ),
+            headers={
+                'Authorization': f'Bearer {api_key}',
+                'Content-Type': 'application/json',
+                'User-Agent': user_agent,
+            }
+        )
+
+        # Created on first use so it binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def post(self, endpoint: str, data: Any) -> Dict[str, Any]:
+        """Make a POST request.
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            data: Request data to send as JSON
+
+        Returns:
+            Response data as dictionary
+
+        Raises:
+            ValidationError: For 400 status codes
+            AuthenticationError: For 401 status codes
+            RateLimitError: For 429 status codes
+            APIError: For other HTTP errors
+            NetworkError: For network-related errors
+        """
+        return await self._make_request('POST', endpoint, json=data)
+
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Make a GET request.
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            params: Query parameters
+
+        Returns:
+            Response data as dictionary
+
+        Raises:
+            ValidationError: For 400 status codes
+            AuthenticationError: For 401 status codes
+            RateLimitError: For 429 status codes
+            APIError: For other HTTP errors
+            NetworkError: For network-related errors
+        """
+        return await self._make_request('GET', endpoint, params=params)
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        json: Optional[Any] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Make an HTTP request with retry logic.
+
+        The concurrency limit is held only while a request is in flight, not
+        while waiting to retry.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            json: JSON data for request body
+            params: Query parameters
+
+        Returns:
+            Response data as dictionary
+
+        Raises:
+            Various Sendly exceptions based on error type
+        """
+        if params:
+            params = self._serialize_params(params)
+
+        # Encode the body once, not on every retry
+        body = _dumps(json) if json is not None else None
+
+        attempt = 0
+        while True:
+            decision, value = await self._attempt(method, endpoint, body, params, attempt)
+            if decision is _RetryDecision.RETURN:
+                return value
+            if decision is _RetryDecision.RAISE:
+                raise value
+            await asyncio.sleep(value)
+            attempt += 1
+
+    async def _attempt(
+        self,
+        method: str,
+        endpoint: str,
+        body: Optional[bytes],
+        params: Optional[Dict[str, Any]],
+        attempt: int
+    ) -> Tuple[_RetryDecision, Any]:
+        """Make a single request attempt and decide what happens next.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            body: Encoded JSON request body
+            params: Serialized query parameters
+            attempt: Current attempt number (0-based)
+
+        Returns:
+            Tuple of the decision and its value (response data, retry delay
+            or exception)
+        """
+        rejection, wait = self._open_attempt()
+        if rejection is not None:
+            return _RetryDecision.RAISE, rejection
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        try:
+            response = await self._send(method, endpoint, body, params)
+        except self._REQUEST_ERRORS as e:
+            return self._request_failure(e, attempt)
+
+        return self._decide_response(response, attempt)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        body: Optional[bytes],
+        params: Optional[Dict[str, Any]]
+    ) -> 'httpx.Response':
+        """Send one request, holding a concurrency slot while it is in flight.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            body: Encoded JSON request body
+            params: Serialized query parameters
+
+        Returns:
+            The HTTP response
+
+        Raises:
+            httpx.HTTPError: If no response was received
+        """
+        async with self._concurrency_limit():
+            return await self.client.request(
+                method,
+                endpoint,
+                content=body,
+                params=params
+            )
+
+    def _concurrency_limit(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding requests in flight, creating it if needed.
+
+        Returns:
+            Semaphore with ``max_concurrent`` slots
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphore
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
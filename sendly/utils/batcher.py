@@ -0,0 +1,169 @@
+"""Request batching for the Sendly Python SDK."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..errors import APIError
+
+# Sentinel that tells the worker thread to flush and exit
+_STOP = object()
+
+
+def _unpack_bulk_response(data: Any, count: int) -> List[Dict[str, Any]]:
+    """Return the per-item results of a bulk request.
+
+    Args:
+        data: Parsed bulk response body
+        count: Number of items that were sent
+
+    Returns:
+        One result per item, in request order
+
+    Raises:
+        APIError: If the response doesn't contain exactly ``count`` results
+    """
+    results = data.get('messages') if isinstance(data, dict) else None
+    if not isinstance(results, list) or len(results) != count:
+        raise APIError(f'Bulk response did not contain {count} messages')
+    return results
+
+
+class RequestBatcher:
+    """Coalesces single-item POSTs into bulk requests.
+
+    Items submitted from any thread are queued and a background worker
+    flushes them either once ``max_batch`` items are waiting or after
+    ``max_wait_ms`` milliseconds, whichever comes first. A batch of several
+    items is sent as ``{'messages': [...]}`` to the bulk endpoint and the
+    ``messages`` array of the response is handed back to the callers'
+    futures in order. A batch of one is sent to the single-item endpoint.
+    """
+
+    def __init__(
+        self,
+        post: Callable[[str, Any], Dict[str, Any]],
+        endpoint: str,
+        batch_endpoint: Optional[str] = None,
+        max_batch: int = 32,
+        max_wait_ms: float = 25
+    ):
+        """Initialize request batcher.
+
+        Args:
+            post: Function used to POST a JSON payload to an endpoint
+            endpoint: Endpoint for single items
+            batch_endpoint: Endpoint for bulk requests (defaults to ``{endpoint}/bulk``)
+            max_batch: Maximum number of items per bulk request
+            max_wait_ms: Maximum time an item waits for others to join its batch
+        """
+        self._post = post
+        self.endpoint = endpoint
+        self.batch_endpoint = batch_endpoint or f'{endpoint}/bulk'
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._queue: 'queue.Queue[Any]' = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(self, item: Any) -> 'Future[Dict[str, Any]]':
+        """Queue an item for the next batch.
+
+        Args:
+            item: JSON payload for a single item
+
+        Returns:
+            Future resolving to the item's response data
+
+        Raises:
+            RuntimeError: If the batcher has been closed
+        """
+        future: 'Future[Dict[str, Any]]' = Future()
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('Cannot submit to a closed batcher')
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name='sendly-batcher',
+                    daemon=True
+                )
+                self._worker.start()
+            self._queue.put((item, future))
+
+        return future
+
+    def close(self) -> None:
+        """Flush pending items and stop the worker thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+
+        if worker is not None:
+            self._queue.put(_STOP)
+            worker.join()
+
+    def _run(self) -> None:
+        """Worker loop: collect batches and flush them."""
+        stopping = False
+
+        while not stopping:
+            entry = self._queue.get()
+            if entry is _STOP:
+                break
+
+            batch = [entry]
+            deadline = time.monotonic() + self.max_wait
+
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if entry is _STOP:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            self._flush(batch)
+
+    def _flush(self, batch: List[Tuple[Any, 'Future[Dict[str, Any]]']]) -> None:
+        """Send a batch and resolve its futures.
+
+        Args:
+            batch: Queued (item, future) pairs
+        """
+        # Drop items whose callers cancelled while they were queued
+        live = [
+            (item, future) for item, future in batch
+            if future.set_running_or_notify_cancel()
+        ]
+        if not live:
+            return
+
+        try:
+            if len(live) == 1:
+                results = [self._post(self.endpoint, live[0][0])]
+            else:
+                data = self._post(
+                    self.batch_endpoint,
+                    {'messages': [item for item, _ in live]}
+                )
+                results = _unpack_bulk_response(data, len(live))
+        except Exception as e:
+            for _, future in live:
+                future.set_exception(e)
+            return
+
+        for (_, future), result in zip(live, results):
+            future.set_result(result)
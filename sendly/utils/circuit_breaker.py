@@ -0,0 +1,96 @@
+"""Client-side circuit breaker for the Sendly Python SDK."""
+
+import enum
+import threading
+import time
+from typing import Callable
+
+
+class CircuitState(enum.Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = 'closed'  # Requests flow normally
+    OPEN = 'open'  # Requests fail fast without being sent
+    HALF_OPEN = 'half_open'  # One trial request is let through
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker that fails fast while the API is down.
+
+    After ``failure_threshold`` consecutive failures (connection errors,
+    timeouts and 5xx responses) the circuit opens and requests are rejected
+    without touching the network. Once ``reset_timeout`` seconds have passed
+    a single trial request is let through: if it succeeds the circuit closes
+    again, otherwise it stays open for another ``reset_timeout``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before a trial request
+            clock: Monotonic clock returning seconds
+
+        Raises:
+            ValueError: If failure_threshold is less than 1
+        """
+        if failure_threshold < 1:
+            raise ValueError('failure_threshold must be at least 1')
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = float(reset_timeout)
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the circuit."""
+        with self._lock:
+            return self._state
+
+    def allow(self) -> bool:
+        """Check whether a request may be sent.
+
+        Returns:
+            True if the request may be sent, False if it must fail fast
+        """
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return True
+
+            now = self._clock()
+            if now - self._opened_at < self.reset_timeout:
+                return False
+
+            # Let one trial through and restart the timer, so a trial whose
+            # outcome is never recorded only holds the circuit for one period
+            self._state = CircuitState.HALF_OPEN
+            self._opened_at = now
+            return True
+
+    def record_success(self) -> None:
+        """Record a request the API answered, closing the circuit."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit past the threshold."""
+        with self._lock:
+            self._failures += 1
+            if (
+                self._state is CircuitState.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
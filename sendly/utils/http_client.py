@@ -1,48 +1,440 @@
 """HTTP client with retry logic for the Sendly Python SDK."""
 
+import enum
+import math
+import random
+import threading
 import time
-from typing import Any, Dict, Optional, TypeVar
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar, Union
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from ..errors import APIError, NetworkError, RateLimitError
+# JSON codec: orjson when installed, otherwise an equivalent json wrapper
+_dumps: Callable[[Any], bytes]
+_loads: Callable[[Union[bytes, str]], Any]
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    import json
+    _loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Encode JSON the way orjson does: compact, UTF-8 bytes."""
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    _dumps = _json_dumps
+
+from ..errors import (
+    APIError,
+    AuthenticationError,
+    NetworkError,
+    RateLimitError,
+    SendlyError,
+    ValidationError,
+)
+from .batcher import RequestBatcher
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .rate_limiter import TokenBucket
 
 T = TypeVar('T')
 
+# Request timeout, rate limiting and transient server/gateway errors
+_RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[int]:
+    """Parse a Retry-After header.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+
+    Returns:
+        Seconds to wait (0 for dates in the past), or None if the header is
+        missing or malformed
+    """
+    if value is None:
+        return None
+
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        pass
+
+    # parsedate_to_datetime raises TypeError instead of ValueError on 3.9
+    # and earlier when the date can't be parsed
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+
+    seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    return max(0, math.ceil(seconds))
+
+
+class _RetryDecision(enum.Enum):
+    """Outcome of a single request attempt."""
+
+    RETURN = 'return'  # Value is the parsed response body
+    RETRY = 'retry'  # Value is the delay before the next attempt
+    RAISE = 'raise'  # Value is the exception to raise
+
+
+class BaseHttpClient:
+    """Retry policy and error mapping shared by the sync and async clients.
+
+    Subclasses only perform the I/O of an attempt. They set the exception
+    types their HTTP library raises and implement ``_response_status``.
+    """
+
+    # Every request failure the HTTP library raises, and the timeouts and
+    # connection errors among them, which are retried
+    _REQUEST_ERRORS: Tuple[Type[Exception], ...] = ()
+    _TIMEOUT_ERRORS: Tuple[Type[Exception], ...] = ()
+    _CONNECTION_ERRORS: Tuple[Type[Exception], ...] = ()
 
-class HttpClient:
-    """HTTP client with exponential backoff retry logic."""
-    
     def __init__(
         self,
         base_url: str,
         api_key: str,
         timeout: float = 30.0,
         max_retries: int = 3,
-        user_agent: str = "sendly-python/0.1.0"
+        rate_limiter: Optional[TokenBucket] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
     ):
-        """Initialize HTTP client.
-        
+        """Initialize shared client configuration.
+
         Args:
             base_url: Base URL for API requests
             api_key: Sendly API key
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
-            user_agent: User agent string
+            rate_limiter: Token bucket each request attempt must take a token from
+            circuit_breaker: Breaker that fails requests fast while the API is down
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
         self.base_delay = 1.0  # Base delay for exponential backoff
+        self.max_delay = 30.0  # Upper bound for any single retry delay
+        self.jitter = 0.5  # Fraction of each backoff delay that is randomized
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+
+    def _build_error(
+        self,
+        status_code: int,
+        error_data: Dict[str, Any],
+        reason: Optional[str] = None
+    ) -> SendlyError:
+        """Build the Sendly exception matching an error response.
+
+        Args:
+            status_code: HTTP status code
+            error_data: Parsed error body
+            reason: HTTP reason phrase
+
+        Returns:
+            Exception for the caller to raise
+        """
+        # Handle specific error types
+        if status_code == 400:
+            return ValidationError(error_data.get('message', 'Validation error'))
+        elif status_code == 401:
+            return AuthenticationError(error_data.get('message', 'Authentication failed'))
+        elif status_code == 429:
+            return RateLimitError(
+                error_data.get('message', 'Rate limit exceeded'),
+                retry_after=error_data.get('retry_after')
+            )
+        else:
+            return APIError(
+                error_data.get('message', f'HTTP {status_code}: {reason}'),
+                status_code=status_code,
+                code=error_data.get('error')
+            )
+
+    def _open_attempt(self) -> Tuple[Optional[NetworkError], float]:
+        """Check the circuit breaker, then take a rate limit token.
+
+        Returns:
+            Error to raise instead of sending (or None if the attempt may go),
+            and seconds to wait before sending
+        """
+        rejection = self._circuit_rejection()
+        if rejection is not None or self.rate_limiter is None:
+            return rejection, 0.0
+        return None, self.rate_limiter.reserve()
+
+    def _request_failure(self, error: Exception, attempt: int) -> Tuple[_RetryDecision, Any]:
+        """Decide what to do after the HTTP library raised ``error``.
+
+        Args:
+            error: One of the ``_REQUEST_ERRORS`` exceptions
+            attempt: Current attempt number (0-based)
+
+        Returns:
+            Tuple of the decision and its value (retry delay or exception)
+        """
+        if isinstance(error, self._TIMEOUT_ERRORS):
+            return self._network_failure(attempt, "Request timed out")
+        if isinstance(error, self._CONNECTION_ERRORS):
+            return self._network_failure(attempt, "Connection error")
+        return _RetryDecision.RAISE, NetworkError(f"Request failed: {error}")
+
+    @staticmethod
+    def _response_status(response: Any) -> Tuple[bool, Optional[str]]:
+        """Read the outcome of a response from the HTTP library.
+
+        Args:
+            response: Response object returned by the HTTP library
+
+        Returns:
+            Whether the response has a success status, and its reason phrase
+        """
+        raise NotImplementedError
+
+    def _circuit_rejection(self) -> Optional[NetworkError]:
+        """Ask the circuit breaker whether an attempt may be sent.
+
+        Returns:
+            Error to raise instead of sending, or None if the attempt may go
+        """
+        if self.circuit_breaker is None or self.circuit_breaker.allow():
+            return None
+        return NetworkError('Circuit breaker is open; not sending the request')
+
+    def _circuit_open(self) -> bool:
+        """Check whether the circuit breaker has opened.
+
+        Returns:
+            True if further attempts would be rejected
+        """
+        return (
+            self.circuit_breaker is not None
+            and self.circuit_breaker.state is CircuitState.OPEN
+        )
+
+    def _network_failure(self, attempt: int, message: str) -> Tuple[_RetryDecision, Any]:
+        """Decide what to do after an attempt timed out or could not connect.
+
+        Args:
+            attempt: Current attempt number (0-based)
+            message: Message of the error raised if the attempt isn't retried
+
+        Returns:
+            Tuple of the decision and its value (retry delay or exception)
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_failure()
+
+        if attempt < self.max_retries and not self._circuit_open():
+            return _RetryDecision.RETRY, self._calculate_delay(attempt)
+        return _RetryDecision.RAISE, NetworkError(message)
+
+    def _decide_response(self, response: Any, attempt: int) -> Tuple[_RetryDecision, Any]:
+        """Decide what to do with a received HTTP response.
+
+        Args:
+            response: requests or httpx response object
+            attempt: Current attempt number (0-based)
+
+        Returns:
+            Tuple of the decision and its value (response data, retry delay
+            or exception)
+        """
+        ok, reason = self._response_status(response)
+
+        # Only server errors count against the circuit; anything else shows
+        # the API is up, even if it rejected this particular request
+        if self.circuit_breaker is not None:
+            if response.status_code >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+
+        # Handle successful response. Bodies are parsed straight from bytes;
+        # orjson.JSONDecodeError subclasses ValueError like json's does
+        if ok:
+            try:
+                return _RetryDecision.RETURN, _loads(response.content)
+            except ValueError as e:
+                return _RetryDecision.RAISE, APIError(f"Invalid JSON in response: {e}")
+
+        # Handle error responses
+        try:
+            error_data = _loads(response.content)
+        except ValueError:
+            error_data = {
+                'error': 'unknown',
+                'message': response.text or reason
+            }
+
+        # Client errors such as 400 and 401 are raised as they are, without
+        # looking at retry hints
+        if not self._is_retryable_error(response.status_code):
+            return _RetryDecision.RAISE, self._build_error(
+                response.status_code, error_data, reason
+            )
+
+        # The body's retry_after wins; otherwise fall back to the header
+        if error_data.get('retry_after') is None:
+            retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                error_data['retry_after'] = retry_after
+
+        # Slow every sender sharing the bucket down, not just this one
+        if response.status_code == 429 and self.rate_limiter is not None:
+            self.rate_limiter.backoff(
+                float(error_data.get('retry_after') or self.base_delay)
+            )
+
+        if attempt < self.max_retries and not self._circuit_open():
+            delay = self._calculate_delay(attempt, error_data.get('retry_after'))
+            return _RetryDecision.RETRY, delay
+
+        return _RetryDecision.RAISE, self._build_error(
+            response.status_code, error_data, reason
+        )
+
+    @staticmethod
+    def _is_retryable_error(status_code: int) -> bool:
+        """Check if error is retryable.
+
+        Args:
+            status_code: HTTP status code
+
+        Returns:
+            True if error should be retried
+        """
+        return status_code in _RETRYABLE_STATUSES
+
+    def _calculate_delay(self, attempt: int, retry_after: Optional[int] = None) -> float:
+        """Calculate delay for exponential backoff.
+
+        Args:
+            attempt: Current attempt number (0-based)
+            retry_after: Server-specified minimum retry delay in seconds
+
+        Returns:
+            Delay in seconds, never more than max_delay
+        """
+        # Exponential backoff (1s, 2s, 4s, ... capped at max_delay) with equal
+        # jitter, so clients that failed together don't all retry at once
+        delay = min(self.base_delay * (2 ** attempt), self.max_delay)
+        delay = random.uniform(delay * (1 - self.jitter), delay)
+
+        # The server's hint is a minimum, not a replacement for backing off
+        if retry_after:
+            return min(max(float(retry_after), delay), self.max_delay)
+        return delay
+
+    def _serialize_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Serialize parameters, handling arrays properly.
+
+        Args:
+            params: Parameters to serialize
+
+        Returns:
+            Serialized parameters (``params`` itself if every value is
+            already a string)
+        """
+        # Common case: nothing to drop or convert, so skip the copy
+        if all(type(value) is str for value in params.values()):
+            return params
+
+        return {
+            key: value if isinstance(value, list) else str(value)
+            for key, value in params.items()
+            if value is not None
+        }
+
+
+class HttpClient(BaseHttpClient):
+    """HTTP client with exponential backoff retry logic."""
+
+    _REQUEST_ERRORS: Tuple[Type[Exception], ...] = (
+        requests.exceptions.RequestException,
+    )
+    _TIMEOUT_ERRORS: Tuple[Type[Exception], ...] = (requests.exceptions.Timeout,)
+    _CONNECTION_ERRORS: Tuple[Type[Exception], ...] = (
+        requests.exceptions.ConnectionError,
+    )
+    
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        user_agent: str = "sendly-python/0.1.0",
+        pool_size: int = 32,
+        rate_limiter: Optional[TokenBucket] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        sleep: Optional[Callable[[float], None]] = None
+    ):
+        """Initialize HTTP client.
         
+        Args:
+            base_url: Base URL for API requests
+            api_key: Sendly API key
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retry attempts
+            user_agent: User agent string
+            pool_size: Number of keep-alive connections to keep per host
+            rate_limiter: Token bucket each request attempt must take a token from
+            circuit_breaker: Breaker that fails requests fast while the API is down
+            sleep: Function used to wait between retries and for rate limit
+                tokens (defaults to ``time.sleep``)
+        """
+        super().__init__(
+            base_url,
+            api_key,
+            timeout=timeout,
+            max_retries=max_retries,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker
+        )
+        self.user_agent = user_agent
+        self._sleep = sleep
+
+        self._open_session(pool_size)
+
+        self._batchers: Dict[Tuple[str, int, float], RequestBatcher] = {}
+        self._batchers_lock = threading.Lock()
+
+    def _open_session(self, pool_size: int) -> None:
+        """Create the pooled session requests are sent through.
+
+        Args:
+            pool_size: Number of keep-alive connections to keep per host
+        """
         self.session = requests.Session()
         self.session.headers.update({
-            'Authorization': f'Bearer {api_key}',
+            'Authorization': f'Bearer {self.api_key}',
             'Content-Type': 'application/json',
-            'User-Agent': user_agent,
+            'User-Agent': self.user_agent,
         })
+
+        # Size the connection pool for concurrent senders so sockets are
+        # reused instead of being opened and discarded under load
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=False
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def post(self, endpoint: str, data: Any) -> Dict[str, Any]:
         """Make a POST request.
@@ -81,6 +473,43 @@ class HttpClient:
             NetworkError: For network-related errors
         """
         return self._make_request('GET', endpoint, params=params)
+
+    def post_batched(
+        self,
+        endpoint: str,
+        item: Any,
+        *,
+        max_batch: int = 32,
+        max_wait_ms: float = 25
+    ) -> 'Future[Dict[str, Any]]':
+        """Queue a POST that may be coalesced with concurrent ones.
+
+        Items posted to the same endpoint within ``max_wait_ms`` of each
+        other are sent together as ``{'messages': [...]}`` to
+        ``{endpoint}/bulk``; a lone item is posted to ``endpoint`` as-is.
+
+        Args:
+            endpoint: API endpoint for a single item (without base URL)
+            item: Request data to send as JSON
+            max_batch: Maximum number of items per bulk request
+            max_wait_ms: Maximum time to wait for other items to join a batch
+
+        Returns:
+            Future resolving to the item's response data. It raises the same
+            exceptions as post() if the request fails.
+        """
+        key = (endpoint, max_batch, max_wait_ms)
+        with self._batchers_lock:
+            batcher = self._batchers.get(key)
+            if batcher is None:
+                batcher = RequestBatcher(
+                    self.post,
+                    endpoint,
+                    max_batch=max_batch,
+                    max_wait_ms=max_wait_ms
+                )
+                self._batchers[key] = batcher
+        return batcher.submit(item)
     
     def _make_request(
         self,
@@ -108,144 +537,114 @@ class HttpClient:
         # Build query string for array parameters
         if params:
             params = self._serialize_params(params)
+
+        # Encode the body once, not on every retry
+        body = _dumps(json) if json is not None else None
         
-        for attempt in range(self.max_retries + 1):
-            try:
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    json=json,
-                    params=params,
-                    timeout=self.timeout
-                )
-                
-                # Handle successful response
-                if response.ok:
-                    try:
-                        return response.json()
-                    except ValueError as e:
-                        raise APIError(f"Invalid JSON in response: {e}")
-                
-                # Handle error responses
-                self._handle_error_response(response, attempt)
-                
-            except requests.exceptions.Timeout:
-                if attempt < self.max_retries:
-                    delay = self._calculate_delay(attempt)
-                    time.sleep(delay)
-                    continue
-                raise NetworkError("Request timed out")
-            
-            except requests.exceptions.ConnectionError:
-                if attempt < self.max_retries:
-                    delay = self._calculate_delay(attempt)
-                    time.sleep(delay)
-                    continue
-                raise NetworkError("Connection error")
-            
-            except requests.exceptions.RequestException as e:
-                raise NetworkError(f"Request failed: {e}")
-        
-        # This should never be reached
-        raise RateLimitError("Max retry attempts exceeded")
-    
-    def _handle_error_response(self, response: requests.Response, attempt: int) -> None:
-        """Handle error responses with retry logic.
-        
-        Args:
-            response: HTTP response object
-            attempt: Current attempt number
-            
-        Raises:
-            Various Sendly exceptions based on error type
-        """
-        try:
-            error_data = response.json()
-        except ValueError:
-            error_data = {
-                'error': 'unknown',
-                'message': response.text or response.reason
-            }
-        
-        # Check if this is a retryable error
-        if self._is_retryable_error(response.status_code) and attempt < self.max_retries:
-            delay = self._calculate_delay(attempt, error_data.get('retry_after'))
-            time.sleep(delay)
-            return
-        
-        # Import here to avoid circular imports
-        from ..errors import AuthenticationError, ValidationError
-        
-        # Handle specific error types
-        if response.status_code == 400:
-            raise ValidationError(error_data.get('message', 'Validation error'))
-        elif response.status_code == 401:
-            raise AuthenticationError(error_data.get('message', 'Authentication failed'))
-        elif response.status_code == 429:
-            raise RateLimitError(
-                error_data.get('message', 'Rate limit exceeded'),
-                retry_after=error_data.get('retry_after')
-            )
-        else:
-            raise APIError(
-                error_data.get('message', f'HTTP {response.status_code}: {response.reason}'),
-                status_code=response.status_code,
-                code=error_data.get('error')
-            )
+        attempt = 0
+        while True:
+            decision, value = self._attempt(method, url, body, params, attempt)
+            if decision is _RetryDecision.RETURN:
+                return value
+            if decision is _RetryDecision.RAISE:
+                raise value
+            self._wait(value)
+            attempt += 1
     
-    def _is_retryable_error(self, status_code: int) -> bool:
-        """Check if error is retryable.
+    def _attempt(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        params: Optional[Dict[str, Any]],
+        attempt: int
+    ) -> Tuple[_RetryDecision, Any]:
+        """Make a single request attempt and decide what happens next.
         
         Args:
-            status_code: HTTP status code
+            method: HTTP method
+            url: Full request URL
+            body: Encoded JSON request body
+            params: Serialized query parameters
+            attempt: Current attempt number (0-based)
             
         Returns:
-            True if error should be retried
+            Tuple of the decision and its value (response data, retry delay
+            or exception)
         """
-        # Retry on rate limits (429) and server errors (5xx)
-        return status_code == 429 or (500 <= status_code < 600)
-    
-    def _calculate_delay(self, attempt: int, retry_after: Optional[int] = None) -> float:
-        """Calculate delay for exponential backoff.
-        
+        rejection, wait = self._open_attempt()
+        if rejection is not None:
+            return _RetryDecision.RAISE, rejection
+        if wait > 0:
+            self._wait(wait)
+
+        try:
+            response = self._send(method, url, body, params)
+        except self._REQUEST_ERRORS as e:
+            return self._request_failure(e, attempt)
+
+        return self._decide_response(response, attempt)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        params: Optional[Dict[str, Any]]
+    ) -> Any:
+        """Send one request over the session.
+
         Args:
-            attempt: Current attempt number (0-based)
-            retry_after: Server-specified retry delay in seconds
-            
+            method: HTTP method
+            url: Full request URL
+            body: Encoded JSON request body
+            params: Serialized query parameters
+
         Returns:
-            Delay in seconds
+            The HTTP response
+
+        Raises:
+            requests.exceptions.RequestException: If no response was received
         """
-        if retry_after:
-            return float(retry_after)
-        
-        # Exponential backoff: 1s, 2s, 4s
-        return self.base_delay * (2 ** attempt)
+        return self.session.request(
+            method=method,
+            url=url,
+            data=body,
+            params=params,
+            timeout=self.timeout
+        )
+
+    @staticmethod
+    def _response_status(response: requests.Response) -> Tuple[bool, Optional[str]]:
+        """Read the outcome of a requests response. See ``BaseHttpClient``."""
+        return response.ok, response.reason
     
-    def _serialize_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Serialize parameters, handling arrays properly.
-        
+    def _wait(self, seconds: float) -> None:
+        """Block for ``seconds`` with the configured sleep function.
+
+        ``time.sleep`` is looked up on every call rather than bound at
+        construction, so patching it still takes effect.
+
         Args:
-            params: Parameters to serialize
-            
-        Returns:
-            Serialized parameters
+            seconds: Time to wait
         """
-        serialized = {}
-        
-        for key, value in params.items():
-            if value is None:
-                continue
-            elif isinstance(value, list):
-                # Handle array parameters (e.g., tags)
-                serialized[key] = value
-            else:
-                serialized[key] = str(value)
-        
-        return serialized
-    
+        if self._sleep is not None:
+            self._sleep(seconds)
+        else:
+            time.sleep(seconds)
+
     def close(self) -> None:
-        """Close the HTTP session."""
+        """Flush any batched requests and close the HTTP session."""
+        self._close_batchers()
         self.session.close()
+
+    def _close_batchers(self) -> None:
+        """Flush and stop every request batcher."""
+        with self._batchers_lock:
+            batchers = list(self._batchers.values())
+            self._batchers.clear()
+        for batcher in batchers:
+            batcher.close()
     
     def __enter__(self):
         """Context manager entry."""
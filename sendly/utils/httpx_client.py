@@ -0,0 +1,142 @@
+"""httpx-backed sync HTTP client for the Sendly Python SDK."""
+
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from .http_client import HttpClient
+from .circuit_breaker import CircuitBreaker
+from .rate_limiter import TokenBucket
+
+# httpx exceptions for HttpxClient and AsyncHttpClient; see BaseHttpClient
+_HTTPX_REQUEST_ERRORS: Tuple[Type[Exception], ...] = (
+    (httpx.HTTPError,) if httpx is not None else ()
+)
+_HTTPX_TIMEOUT_ERRORS: Tuple[Type[Exception], ...] = (
+    (httpx.TimeoutException,) if httpx is not None else ()
+)
+_HTTPX_CONNECTION_ERRORS: Tuple[Type[Exception], ...] = (
+    (httpx.NetworkError,) if httpx is not None else ()
+)
+
+
+def _httpx_response_status(response: Any) -> Tuple[bool, Optional[str]]:
+    """Read the outcome of an httpx response. See ``BaseHttpClient``."""
+    return response.is_success, response.reason_phrase
+
+
+class HttpxClient(HttpClient):
+    """``HttpClient`` that sends through ``httpx`` so it can speak HTTP/2.
+
+    Over HTTP/2, concurrent requests from many threads are multiplexed on one
+    connection instead of each taking a pooled HTTP/1.1 connection of its
+    own. Retries, rate limiting and batching behave exactly as in
+    ``HttpClient``. Requires the optional ``httpx`` dependency, plus ``h2``
+    for HTTP/2 (``pip install sendly[http2]``).
+    """
+
+    _REQUEST_ERRORS = _HTTPX_REQUEST_ERRORS
+    _TIMEOUT_ERRORS = _HTTPX_TIMEOUT_ERRORS
+    _CONNECTION_ERRORS = _HTTPX_CONNECTION_ERRORS
+    _response_status = staticmethod(_httpx_response_status)
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        user_agent: str = "sendly-python/0.1.0",
+        pool_size: int = 32,
+        rate_limiter: Optional[TokenBucket] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        http2: bool = False,
+        sleep: Optional[Callable[[float], None]] = None
+    ):
+        """Initialize httpx HTTP client.
+
+        Args:
+            base_url: Base URL for API requests
+            api_key: Sendly API key
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retry attempts
+            user_agent: User agent string
+            pool_size: Maximum number of connections to keep open
+            rate_limiter: Token bucket each request attempt must take a token from
+            circuit_breaker: Breaker that fails requests fast while the API is down
+            http2: Multiplex requests over HTTP/2 connections
+            sleep: Function used to wait between retries and for rate limit
+                tokens (defaults to ``time.sleep``)
+
+        Raises:
+            ImportError: If httpx, or h2 when http2 is set, is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                'HTTP/2 support requires httpx. '
+                'Install it with: pip install sendly[http2]'
+            )
+
+        self.http2 = http2
+        super().__init__(
+            base_url,
+            api_key,
+            timeout=timeout,
+            max_retries=max_retries,
+            user_agent=user_agent,
+            pool_size=pool_size,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            sleep=sleep
+        )
+
+    def _open_session(self, pool_size: int) -> None:
+        """Create the httpx client requests are sent through.
+
+        Args:
+            pool_size: Maximum number of connections to keep open
+        """
+        self.client = httpx.Client(
+            timeout=self.timeout,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size
+            ),
+            headers={
+                'Authorization': f'Bearer {self.api_key}',
+                'Content-Type': 'application/json',
+                'User-Agent': self.user_agent,
+            }
+        )
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        params: Optional[Dict[str, Any]]
+    ) -> 'httpx.Response':
+        """Send one request over the httpx client.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            body: Encoded JSON request body
+            params: Serialized query parameters
+
+        Returns:
+            The HTTP response
+
+        Raises:
+            httpx.HTTPError: If no response was received
+        """
+        return self.client.request(method, url, content=body, params=params)
+
+    def close(self) -> None:
+        """Flush any batched requests and close the HTTP connections."""
+        self._close_batchers()
+        self.client.close()
@@ -0,0 +1,227 @@
+"""In-process transport that answers sandbox requests without the network."""
+
+import itertools
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from typing import Any, Dict, Mapping, Optional, Union
+
+from ..constants import MAGIC_NUMBERS, MAGIC_NUMBER_INFO
+from .async_http_client import AsyncHttpClient
+from .http_client import BaseHttpClient, HttpClient
+
+# Carrier reported for numbers that simulate one
+_CARRIERS = {
+    MAGIC_NUMBERS['success']['verizon_carrier']: 'verizon',
+    **{number: carrier for carrier, number in MAGIC_NUMBERS['carriers'].items()},
+}
+
+_MESSAGES_PREFIX = '/v1/messages/'
+
+# Sent messages each transport remembers for lookups; the oldest are dropped
+_MAX_STORED_MESSAGES = 10000
+
+
+class _LocalTransportBase(BaseHttpClient):
+    """Request handling shared by LocalTransport and AsyncLocalTransport."""
+
+    def __init__(self, base_url: str, api_key: str, **kwargs: Any):
+        """Initialize local transport.
+
+        Args:
+            base_url: Base URL the client was configured with (unused)
+            api_key: Sendly test API key
+            **kwargs: Other ``HttpClient`` options, accepted and ignored
+        """
+        super().__init__(base_url, api_key)
+        self._ids = itertools.count(1)
+        self._messages: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+
+    def _answer_post(self, endpoint: str, data: Any) -> Dict[str, Any]:
+        """Build the response to a POST request. See ``LocalTransport.post``."""
+        if endpoint == '/v1/send':
+            return self._send(data)
+        if endpoint == '/v1/send/bulk':
+            return {'messages': [self._send(message) for message in data['messages']]}
+        raise self._not_found('POST', endpoint)
+
+    def _answer_get(self, endpoint: str) -> Dict[str, Any]:
+        """Build the response to a GET request. See ``LocalTransport.get``."""
+        if endpoint.startswith(_MESSAGES_PREFIX):
+            message = self._messages.get(endpoint[len(_MESSAGES_PREFIX):])
+            if message is not None:
+                return {**message, 'status': 'delivered'}
+        raise self._not_found('GET', endpoint)
+
+    def _send(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the response for a single message.
+
+        Args:
+            message: API payload for one message
+
+        Returns:
+            Response data in the API's format
+
+        Raises:
+            SendlyError: If the destination is an error magic number
+        """
+        to = message.get('to', '')
+        info: Mapping[str, Union[str, int]] = MAGIC_NUMBER_INFO.get(to, {})
+
+        status_code = info.get('http_status')
+        if isinstance(status_code, int):
+            raise self._build_error(
+                status_code,
+                {'error': info['error'], 'message': info['description']}
+            )
+
+        message_id = f'msg_local_{next(self._ids)}'
+        response = {
+            **message,
+            'messageId': message_id,
+            'status': 'queued',
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'segments': 1,
+            'direction': 'outbound',
+            'carrier': _CARRIERS.get(to),
+            'cost': {'amount': 0.0, 'currency': 'USD'},
+        }
+        self._messages[message_id] = response
+        if len(self._messages) > _MAX_STORED_MESSAGES:
+            self._messages.popitem(last=False)
+        return response
+
+    def _not_found(self, method: str, endpoint: str) -> Exception:
+        """Build the error for an endpoint with no local handler.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+
+        Returns:
+            APIError with a 404 status
+        """
+        return self._build_error(
+            404,
+            {'error': 'not_found', 'message': f'No local handler for {method} {endpoint}'}
+        )
+
+
+class LocalTransport(_LocalTransportBase):
+    """Drop-in replacement for ``HttpClient`` that never leaves the process.
+
+    Sends are answered from the sandbox magic number table: error numbers
+    raise the same exception the API would produce for them, and every other
+    number gets a canned ``queued`` response echoing the request. Looking a
+    sent message up reports it as ``delivered``; each transport remembers its
+    last 10,000 messages for this. Nothing is retried, rate limited or
+    delayed, so a sandbox test suite runs in milliseconds and works offline.
+
+    A bulk request fails as a whole if any of its messages uses an error
+    number.
+    """
+
+    def post(self, endpoint: str, data: Any) -> Dict[str, Any]:
+        """Answer a POST request.
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            data: Request data
+
+        Returns:
+            Canned response data
+
+        Raises:
+            ValidationError: For magic numbers that produce a 400
+            RateLimitError: For the rate limit magic number
+            APIError: For other error magic numbers and unknown endpoints
+        """
+        return self._answer_post(endpoint, data)
+
+    def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Answer a GET request.
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            params: Query parameters
+
+        Returns:
+            The message sent with that ID, reported as delivered
+
+        Raises:
+            APIError: For unknown messages and endpoints
+        """
+        return self._answer_get(endpoint)
+
+    def post_batched(
+        self,
+        endpoint: str,
+        item: Any,
+        *,
+        max_batch: int = 32,
+        max_wait_ms: float = 25
+    ) -> 'Future[Dict[str, Any]]':
+        """Answer a POST immediately, returning a completed future.
+
+        Args:
+            endpoint: API endpoint for a single item (without base URL)
+            item: Request data
+            max_batch: Accepted for compatibility with ``HttpClient``
+            max_wait_ms: Accepted for compatibility with ``HttpClient``
+
+        Returns:
+            Future holding the response data or the error post() raised
+        """
+        future: 'Future[Dict[str, Any]]' = Future()
+        try:
+            future.set_result(self.post(endpoint, item))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def close(self) -> None:
+        """Nothing to release; present for parity with ``HttpClient``."""
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
+class AsyncLocalTransport(_LocalTransportBase):
+    """``LocalTransport`` with the awaitable interface of ``AsyncHttpClient``."""
+
+    async def post(self, endpoint: str, data: Any) -> Dict[str, Any]:
+        """Answer a POST request. See ``LocalTransport.post``."""
+        return self._answer_post(endpoint, data)
+
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Answer a GET request. See ``LocalTransport.get``."""
+        return self._answer_get(endpoint)
+
+    async def aclose(self) -> None:
+        """Nothing to release; present for parity with ``AsyncHttpClient``."""
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
+
+
+# Clients a sync or async resource may be given, selected by ``transport``
+_SyncTransport = Union[HttpClient, LocalTransport]
+_AsyncTransport = Union[AsyncHttpClient, AsyncLocalTransport]
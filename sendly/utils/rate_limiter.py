@@ -0,0 +1,135 @@
+"""Client-side rate limiting for the Sendly Python SDK."""
+
+import threading
+import time
+from typing import Callable, Optional
+
+# Lowest fraction of the configured rate that backoff() slows the bucket to
+_MIN_BACKOFF_FACTOR = 1 / 8
+
+
+class TokenBucket:
+    """Thread-safe token bucket for pacing requests.
+
+    Each request takes one token. Tokens refill continuously at ``rate`` per
+    second up to ``capacity``, so short bursts are allowed while the long-run
+    rate stays at ``rate``. When the server rate limits us anyway,
+    ``backoff()`` halves the refill rate for a while instead of every caller
+    finding out from a 429 of its own.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second (requests per second)
+            capacity: Maximum burst size (defaults to ``rate``, minimum 1)
+            clock: Monotonic clock returning seconds
+
+        Raises:
+            ValueError: If rate is not positive
+        """
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(self.rate, 1.0)
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._factor = 1.0
+        self._backoff_until = 0.0
+
+    @property
+    def current_rate(self) -> float:
+        """Refill rate in effect right now, including any backoff."""
+        with self._lock:
+            return self._rate_at(self._clock())
+
+    def reserve(self) -> float:
+        """Take a token.
+
+        The token is always granted; when the bucket is empty it is borrowed
+        against future refills and the caller must wait before using it.
+
+        Returns:
+            Seconds to wait before sending (0 if a token was available)
+        """
+        with self._lock:
+            now = self._clock()
+            rate = self._rate_at(now)
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * rate
+            )
+            self._updated = now
+            self._tokens -= 1
+
+            if self._tokens >= 0:
+                return 0.0
+            return self._wait_for(-self._tokens, now, rate)
+
+    def acquire(self) -> None:
+        """Take a token, sleeping until it may be used."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def backoff(self, duration: float) -> None:
+        """Halve the refill rate for ``duration`` seconds.
+
+        Repeated calls while a backoff is active halve the rate again, down
+        to 1/8 of the configured rate, and extend the backoff window.
+
+        Args:
+            duration: Seconds before the full rate is restored
+        """
+        with self._lock:
+            now = self._clock()
+            # Bank tokens earned at the old rate before changing it
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self._rate_at(now)
+            )
+            self._updated = now
+            self._factor = max(self._factor / 2, _MIN_BACKOFF_FACTOR)
+            self._backoff_until = max(self._backoff_until, now + duration)
+
+    def _wait_for(self, deficit: float, now: float, rate: float) -> float:
+        """Return how long refilling ``deficit`` tokens takes from ``now``.
+
+        Tokens refill at ``rate`` until the backoff window ends and at the
+        full rate after it.
+
+        Args:
+            deficit: Tokens owed
+            now: Current clock reading
+            rate: Refill rate in effect at ``now``
+
+        Returns:
+            Seconds until the deficit is paid off
+        """
+        window = self._backoff_until - now
+        if rate == self.rate or deficit <= rate * window:
+            return deficit / rate
+        return window + (deficit - rate * window) / self.rate
+
+    def _rate_at(self, now: float) -> float:
+        """Return the refill rate at ``now``, ending expired backoffs.
+
+        Args:
+            now: Current clock reading
+
+        Returns:
+            Tokens per second
+        """
+        if self._factor != 1.0 and now >= self._backoff_until:
+            self._factor = 1.0
+        return self.rate * self._factor
@@ -1,12 +1,40 @@
 """Validation utilities for the Sendly Python SDK."""
 
 import re
-from typing import List, Optional
-from urllib.parse import urlparse
+import sys
+from typing import Any, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 from ..errors import ValidationError
 from ..types import SMSRequest, MessageType
 
+if sys.version_info >= (3, 8):
+    from typing import get_args as _get_args
+else:  # pragma: no cover - Python 3.7
+    def _get_args(tp: Any) -> Tuple[Any, ...]:
+        """Return the arguments of a subscripted type, like typing.get_args."""
+        return getattr(tp, '__args__', ())
+
+_API_KEY_RE = re.compile(r'sl_(?:test|live)_[a-zA-Z0-9_-]{24,50}')
+_VALID_MESSAGE_TYPES = frozenset(_get_args(MessageType))
+_VALID_MESSAGE_TYPES_STR = ', '.join(_get_args(MessageType))
+_NONDIGIT_RE = re.compile(r'\D')
+_URL_SCHEMES = frozenset({'http', 'https'})
+
+# Two-digit country codes -> minimum digit count (including the code) required
+# before the prefix is trusted
+_TWO_DIGIT_COUNTRY_CODES = {
+    '44': 0,  # UK
+    '33': 0,  # France
+    '86': 0,  # China
+    **dict.fromkeys(
+        ['27', '34', '39', '41', '43', '45', '46', '47', '48',
+         '81', '82', '91', '92', '93', '94', '95'],
+        10
+    ),
+}
+_TOLLFREE_PREFIXES = frozenset({'1800', '1833', '1844', '1855', '1866', '1877', '1888'})
+
 
 def is_valid_phone_number(phone: str) -> bool:
     """Validate E.164 phone number format.
@@ -17,8 +45,13 @@ def is_valid_phone_number(phone: str) -> bool:
     Returns:
         True if phone number is valid E.164 format
     """
-    pattern = r'^\+[1-9]\d{1,14}$'
-    return bool(re.match(pattern, phone))
+    # Equivalent to ^\+[1-9]\d{1,14}$ without going through the regex engine
+    return (
+        3 <= len(phone) <= 16
+        and phone[0] == '+'
+        and '1' <= phone[1] <= '9'
+        and phone[2:].isdecimal()
+    )
 
 
 def is_valid_api_key(api_key: str) -> bool:
@@ -30,8 +63,8 @@ def is_valid_api_key(api_key: str) -> bool:
     Returns:
         True if API key has valid format
     """
-    pattern = r'^sl_(test|live)_[a-zA-Z0-9_-]{24,50}$'
-    return bool(re.match(pattern, api_key))
+    # fullmatch rather than match + '$', which would accept a trailing newline
+    return _API_KEY_RE.fullmatch(api_key) is not None
 
 
 def is_valid_url(url: str) -> bool:
@@ -41,13 +74,47 @@ def is_valid_url(url: str) -> bool:
         url: URL to validate
 
     Returns:
-        True if URL is valid
+        True if URL is an http or https URL with a host
     """
     try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except Exception:
+        result = urlsplit(url)
+    except ValueError:
+        return False
+    return result.scheme in _URL_SCHEMES and bool(result.netloc)
+
+
+def _is_https_url(url: str) -> bool:
+    """Check for a well-formed HTTPS URL in a single pass.
+
+    Equivalent to ``is_valid_url(url) and url.startswith('https://')``.
+
+    Args:
+        url: URL to check
+
+    Returns:
+        True if URL uses HTTPS and has a host
+    """
+    if not url.startswith('https://'):
         return False
+    try:
+        return bool(urlsplit(url).netloc)
+    except ValueError:
+        return False
+
+
+def _digits(phone_number: str) -> str:
+    """Strip everything but digits, skipping the regex for E.164 input.
+
+    Args:
+        phone_number: Phone number in any format
+
+    Returns:
+        The digits of the phone number
+    """
+    digits = phone_number[1:] if phone_number[:1] == '+' else phone_number
+    if digits.isdecimal():
+        return digits
+    return _NONDIGIT_RE.sub('', phone_number)
 
 
 def get_country_code(phone_number: str) -> str:
@@ -59,27 +126,15 @@ def get_country_code(phone_number: str) -> str:
     Returns:
         Country code as string
     """
-    clean_number = re.sub(r'[^\d]', '', phone_number)
+    clean_number = _digits(phone_number)
 
-    if clean_number.startswith('1'):
+    if clean_number[:1] == '1':
         return '1'  # US/Canada
-    elif clean_number.startswith('44'):
-        return '44'  # UK
-    elif clean_number.startswith('33'):
-        return '33'  # France
-    elif clean_number.startswith('86'):
-        return '86'  # China
-
-    # Common two-digit country codes
-    two_digit_codes = [
-        '27', '34', '39', '41', '43', '45', '46', '47', '48',
-        '81', '82', '91', '92', '93', '94', '95'
-    ]
-
-    if len(clean_number) >= 10:
-        two_digit = clean_number[:2]
-        if two_digit in two_digit_codes:
-            return two_digit
+
+    two_digit = clean_number[:2]
+    min_length = _TWO_DIGIT_COUNTRY_CODES.get(two_digit)
+    if min_length is not None and len(clean_number) >= min_length:
+        return two_digit
 
     return 'unknown'
 
@@ -93,8 +148,8 @@ def is_toll_free(phone_number: str) -> bool:
     Returns:
         True if number is toll-free
     """
-    clean_number = re.sub(r'[^\d]', '', phone_number)
-    return bool(re.match(r'^1(800|833|844|855|866|877|888)', clean_number))
+    # Every toll-free prefix is four digits, so one set lookup covers them all
+    return _digits(phone_number)[:4] in _TOLLFREE_PREFIXES
 
 
 def validate_toll_free_routing(from_number: str, to_number: str) -> None:
@@ -125,70 +180,100 @@ def validate_sms_request(request: SMSRequest) -> None:
     Raises:
         ValidationError: If any validation fails
     """
-    # Validate required fields
-    if not request.to:
+    validate_sms_fields(
+        request.to,
+        text=request.text,
+        from_=request.from_,
+        message_type=request.message_type,
+        media_urls=request.media_urls,
+        webhook_url=request.webhook_url,
+        webhook_failover_url=request.webhook_failover_url,
+        tags=request.tags
+    )
+
+
+def validate_sms_fields(
+    to: str,
+    text: Optional[str] = None,
+    from_: Optional[str] = None,
+    message_type: Optional[str] = None,
+    media_urls: Optional[List[str]] = None,
+    webhook_url: Optional[str] = None,
+    webhook_failover_url: Optional[str] = None,
+    tags: Optional[List[str]] = None
+) -> None:
+    """Validate SMS parameters without building an SMSRequest first.
+
+    Args:
+        to: Destination phone number
+        text: Message text
+        from_: Sender phone number
+        message_type: Message type for routing priority
+        media_urls: MMS media URLs
+        webhook_url: Delivery webhook URL
+        webhook_failover_url: Backup webhook URL
+        tags: Message tags
+
+    Raises:
+        ValidationError: If any validation fails
+    """
+    # Cheap presence and size checks first, so the common rejections never
+    # reach the per-string format checks below
+    if not to:
         raise ValidationError('to is required')
 
-    if not request.text and not request.media_urls:
+    if not text and not media_urls:
         raise ValidationError('Either text or media_urls must be provided')
 
+    if media_urls and len(media_urls) > 10:
+        raise ValidationError('Maximum 10 media URLs allowed')
+
+    if tags and len(tags) > 20:
+        raise ValidationError('Maximum 20 tags allowed')
+
+    if message_type and message_type not in _VALID_MESSAGE_TYPES:
+        raise ValidationError(
+            f'Invalid message_type. Must be one of: {_VALID_MESSAGE_TYPES_STR}'
+        )
+
     # Validate phone numbers
-    if not is_valid_phone_number(request.to):
+    if not is_valid_phone_number(to):
         raise ValidationError('Invalid phone number format for to')
 
-    if request.from_ and not is_valid_phone_number(request.from_):
-        raise ValidationError('Invalid phone number format for from_')
+    if from_:
+        if not is_valid_phone_number(from_):
+            raise ValidationError('Invalid phone number format for from_')
 
-    # Validate toll-free routing if from_ is specified
-    if request.from_:
-        validate_toll_free_routing(request.from_, request.to)
+        # Validate toll-free routing
+        validate_toll_free_routing(from_, to)
 
     # Validate media URLs
-    if request.media_urls:
-        if len(request.media_urls) > 10:
-            raise ValidationError('Maximum 10 media URLs allowed')
-
-        for url in request.media_urls:
+    if media_urls:
+        for url in media_urls:
             if not url or not url.strip():
                 raise ValidationError('Media URLs cannot be empty')
 
-            if not is_valid_url(url):
-                raise ValidationError('Invalid URL format in media_urls')
-
-            if not url.startswith('https://'):
+            if not _is_https_url(url):
+                if not is_valid_url(url):
+                    raise ValidationError('Invalid URL format in media_urls')
                 raise ValidationError('Media URLs must use HTTPS')
 
     # Validate webhook URLs
-    if request.webhook_url:
-        if not is_valid_url(request.webhook_url):
+    if webhook_url and not _is_https_url(webhook_url):
+        if not is_valid_url(webhook_url):
             raise ValidationError('Invalid webhook URL format')
+        raise ValidationError('Webhook URL must use HTTPS')
 
-        if not request.webhook_url.startswith('https://'):
-            raise ValidationError('Webhook URL must use HTTPS')
-
-    if request.webhook_failover_url:
-        if not is_valid_url(request.webhook_failover_url):
+    if webhook_failover_url and not _is_https_url(webhook_failover_url):
+        if not is_valid_url(webhook_failover_url):
             raise ValidationError('Invalid webhook failover URL format')
-
-        if not request.webhook_failover_url.startswith('https://'):
-            raise ValidationError('Webhook failover URL must use HTTPS')
+        raise ValidationError('Webhook failover URL must use HTTPS')
 
     # Validate tags
-    if request.tags:
-        if len(request.tags) > 20:
-            raise ValidationError('Maximum 20 tags allowed')
-
-        for tag in request.tags:
+    if tags:
+        for tag in tags:
             if not tag or not tag.strip():
                 raise ValidationError('Tags cannot be empty')
 
             if len(tag) > 50:
                 raise ValidationError('Tag length cannot exceed 50 characters')
-
-    # Validate message type
-    if request.message_type:
-        valid_types = ['transactional', 'marketing', 'otp', 'alert', 'promotional']
-        if request.message_type not in valid_types:
-            raise ValidationError(
-                f'Invalid message_type. Must be one of: {", ".join(valid_types)}'
-            )
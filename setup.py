@@ -40,7 +40,10 @@ extras_require = {
         "pytest>=6.0.0",
         "pytest-cov>=2.10.0",
         "pytest-mock>=3.6.0",
+        "pytest-xdist>=2.0.0",  # Run tests in parallel (make test-parallel)
+        "pytest-benchmark>=3.4.0",  # Performance regression checks (make benchmark)
         "responses>=0.18.0",  # For mocking HTTP responses in tests
+        "httpx>=0.23.0",      # Async client tests
         
         # Code quality and formatting
         "black>=22.0.0",      # Code formatter
@@ -66,8 +69,19 @@ extras_require = {
         "pytest>=6.0.0",
         "pytest-cov>=2.10.0",
         "pytest-mock>=3.6.0",
+        "pytest-xdist>=2.0.0",
         "responses>=0.18.0",
-    ]
+        "httpx>=0.23.0",
+    ],
+    "async": [
+        "httpx>=0.23.0",  # Async HTTP client for Sendly.async_sms
+    ],
+    "http2": [
+        "httpx[http2]>=0.23.0",  # HTTP/2 for Sendly(http2=True)
+    ],
+    "fast": [
+        "orjson>=3.6.0",  # Faster JSON encoding and decoding
+    ],
 }
 
 # Add an 'all' extra that includes everything
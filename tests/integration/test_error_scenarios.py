@@ -1,9 +1,12 @@
 """Integration tests for error scenarios and edge cases."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 import pytest
 import responses
-from unittest.mock import patch
+from unittest.mock import Mock
 import requests
 
 from sendly import Sendly
@@ -15,6 +18,18 @@ from sendly.errors import (
     ValidationError
 )
 
+BASE_URL = 'https://api.sendly.test'
+SEND_URL = f'{BASE_URL}/v1/send'
+
+
+def _success(message_id):
+    """Build the body of a successful send response.
+
+    Args:
+        message_id: ID of the queued message
+    """
+    return {'messageId': message_id, 'status': 'queued', 'routing': {}}
+
 
 class TestErrorScenarios:
     """Integration tests for various error scenarios."""
@@ -22,24 +37,34 @@ class TestErrorScenarios:
     def setup_method(self):
         """Set up test fixtures."""
         self.api_key = 'sl_test_1234567890123456789012345678901234567890'
-        self.base_url = 'https://api.sendly.test'
+        self.base_url = BASE_URL
         self.client = Sendly(
             api_key=self.api_key,
             base_url=self.base_url,
             timeout=5.0,
             max_retries=2
         )
+        self.sleep = Mock()
+        self.client._http_client._sleep = self.sleep
     
     def teardown_method(self):
         """Clean up after tests."""
         self.client.close()
+
+    def _add_send(self, *, count=1, **kwargs):
+        """Register ``count`` mocked responses for POST /v1/send.
+
+        Args:
+            count: Number of identical responses to register
+            **kwargs: Response options passed to ``responses.add``
+        """
+        for _ in range(count):
+            responses.add(responses.POST, SEND_URL, **kwargs)
     
     @responses.activate
     def test_malformed_json_response(self):
         """Test handling of malformed JSON response."""
-        responses.add(
-            responses.POST,
-            f'{self.base_url}/v1/send',
+        self._add_send(
             body='{"invalid": json malformed',  # Invalid JSON
             status=200,
             content_type='application/json'
@@ -54,9 +79,7 @@ class TestErrorScenarios:
     @responses.activate
     def test_empty_response_body(self):
         """Test handling of empty response body."""
-        responses.add(
-            responses.POST,
-            f'{self.base_url}/v1/send',
+        self._add_send(
             body='',
             status=200,
             content_type='application/json'
@@ -71,9 +94,7 @@ class TestErrorScenarios:
     @responses.activate
     def test_non_json_error_response(self):
         """Test handling of non-JSON error response."""
-        responses.add(
-            responses.POST,
-            f'{self.base_url}/v1/send',
+        self._add_send(
             body='Internal Server Error',
             status=500,
             content_type='text/html'
@@ -92,9 +113,7 @@ class TestErrorScenarios:
     @responses.activate
     def test_rate_limit_without_retry_after_header(self):
         """Test rate limit error without retry-after header."""
-        responses.add(
-            responses.POST,
-            f'{self.base_url}/v1/send',
+        self._add_send(
             json={
                 'error': 'rate_limit_exceeded',
                 'message': 'Too many requests'
@@ -103,34 +122,64 @@ class TestErrorScenarios:
         )
         
         # Add success response for retry
-        responses.add(
-            responses.POST,
-            f'{self.base_url}/v1/send',
-            json={
-                'messageId': 'msg_after_rate_limit',
-                'status': 'queued',
-                'routing': {}
-            },
+        self._add_send(
+            json=_success('msg_after_rate_limit'),
             status=200
         )
         
-        with patch('sendly.utils.http_client.time.sleep') as mock_sleep:
-            response = self.client.sms.send(
-                to='+14155552671',
-                text='Rate limit without retry-after'
-            )
+        response = self.client.sms.send(
+            to='+14155552671',
+            text='Rate limit without retry-after'
+        )
             
-            # Should use exponential backoff when no retry-after provided
-            mock_sleep.assert_called_once_with(1.0)  # First retry delay
-            assert response.id == 'msg_after_rate_limit'
+        # Should use exponential backoff when no retry-after provided
+        self.sleep.assert_called_once()
+        assert 0.5 <= self.sleep.call_args[0][0] <= 1.0  # First retry delay
+        assert response.id == 'msg_after_rate_limit'
+    
+    @responses.activate
+    def test_rate_limit_with_retry_after_seconds(self):
+        """Test that a Retry-After header in seconds sets the retry delay."""
+        self._add_send(
+            json={'error': 'rate_limit_exceeded', 'message': 'Too many requests'},
+            headers={'Retry-After': '3'},
+            status=429
+        )
+        self._add_send(
+            json=_success('msg_retry_after'),
+            status=200
+        )
+        
+        response = self.client.sms.send(to='+14155552671', text='Retry-After test')
+        
+        self.sleep.assert_called_once_with(3.0)
+        assert response.id == 'msg_retry_after'
+    
+    @responses.activate
+    def test_rate_limit_with_retry_after_httpdate(self):
+        """Test that a Retry-After HTTP-date sets the retry delay."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=5)
+        self._add_send(
+            json={'error': 'rate_limit_exceeded', 'message': 'Too many requests'},
+            headers={'Retry-After': format_datetime(retry_at, usegmt=True)},
+            status=429
+        )
+        self._add_send(
+            json=_success('msg_retry_after'),
+            status=200
+        )
+        
+        response = self.client.sms.send(to='+14155552671', text='Retry-After test')
+        
+        self.sleep.assert_called_once()
+        assert 4.0 <= self.sleep.call_args[0][0] <= 5.0
+        assert response.id == 'msg_retry_after'
     
     @responses.activate
     def test_mixed_error_responses_in_retries(self):
         """Test different error types across retry attempts."""
         # First attempt: rate limit
-        responses.add(
-            responses.POST,
-            f'{self.base_url}/v1/send',
+        self._add_send(
             json={
                 'error': 'rate_limit_exceeded',
                 'message': 'Rate limit exceeded'
@@ -139,9 +188,7 @@ class TestErrorScenarios:
         )
         
         # Second attempt: server error
-        responses.add(
-            responses.POST,
-            f'{self.base_url}/v1/send',
+        self._add_send(
             json={
                 'error': 'internal_server_error',
                 'message': 'Database connection failed'
@@ -150,34 +197,25 @@ class TestErrorScenarios:
         )
         
         # Third attempt: success
-        responses.add(
-            responses.POST,
-            f'{self.base_url}/v1/send',
-            json={
-                'messageId': 'msg_mixed_errors',
-                'status': 'queued',
-                'routing': {}
-            },
+        self._add_send(
+            json=_success('msg_mixed_errors'),
             status=200
         )
         
-        with patch('sendly.utils.http_client.time.sleep') as mock_sleep:
-            response = self.client.sms.send(
-                to='+14155552671',
-                text='Mixed errors test'
-            )
+        response = self.client.sms.send(
+            to='+14155552671',
+            text='Mixed errors test'
+        )
             
-            # Should retry through different error types
-            assert mock_sleep.call_count == 2
-            assert response.id == 'msg_mixed_errors'
-            assert len(responses.calls) == 3
+        # Should retry through different error types
+        assert self.sleep.call_count == 2
+        assert response.id == 'msg_mixed_errors'
+        assert len(responses.calls) == 3
     
     @responses.activate
     def test_authentication_error_no_retry(self):
         """Test that authentication errors are not retried."""
-        responses.add(
-            responses.POST,
-            f'{self.base_url}/v1/send',
+        self._add_send(
             json={
                 'error': 'authentication_error',
                 'message': 'Invalid API key'
@@ -197,9 +235,7 @@ class TestErrorScenarios:
     @responses.activate
     def test_validation_error_no_retry(self):
         """Test that validation errors are not retried."""
-        responses.add(
-            responses.POST,
-            f'{self.base_url}/v1/send',
+        self._add_send(
             json={
                 'error': 'validation_error',
                 'message': 'Invalid message format'
@@ -225,39 +261,35 @@ class TestErrorScenarios:
             # First two attempts timeout
             rsps.add_callback(
                 responses.POST,
-                f'{self.base_url}/v1/send',
+                SEND_URL,
                 callback=timeout_callback
             )
             rsps.add_callback(
                 responses.POST,
-                f'{self.base_url}/v1/send',
+                SEND_URL,
                 callback=timeout_callback
             )
             
             # Third attempt succeeds
             rsps.add(
                 responses.POST,
-                f'{self.base_url}/v1/send',
-                json={
-                    'messageId': 'msg_timeout_recovery',
-                    'status': 'queued',
-                    'routing': {}
-                },
+                SEND_URL,
+                json=_success('msg_timeout_recovery'),
                 status=200
             )
             
-            with patch('sendly.utils.http_client.time.sleep') as mock_sleep:
-                response = self.client.sms.send(
-                    to='+14155552671',
-                    text='Timeout recovery test'
-                )
+            response = self.client.sms.send(
+                to='+14155552671',
+                text='Timeout recovery test'
+            )
                 
-                # Verify retries with exponential backoff
-                assert mock_sleep.call_count == 2
-                mock_sleep.assert_any_call(1.0)  # First retry
-                mock_sleep.assert_any_call(2.0)  # Second retry
+            # Verify retries with exponential backoff
+            assert self.sleep.call_count == 2
+            first, second = [args[0] for args, _ in self.sleep.call_args_list]
+            assert 0.5 <= first <= 1.0  # First retry
+            assert 1.0 <= second <= 2.0  # Second retry
                 
-                assert response.id == 'msg_timeout_recovery'
+            assert response.id == 'msg_timeout_recovery'
     
     def test_connection_error_max_retries(self):
         """Test connection error exceeding max retries."""
@@ -265,30 +297,58 @@ class TestErrorScenarios:
             raise requests.exceptions.ConnectionError('Connection refused')
         
         with responses.RequestsMock() as rsps:
-            # All attempts fail with connection error
-            for _ in range(3):  # max_retries + 1
-                rsps.add_callback(
-                    responses.POST,
-                    f'{self.base_url}/v1/send',
-                    callback=connection_error_callback
-                )
+            # All attempts (max_retries + 1) fail with connection error
+            rsps.add_callback(
+                responses.POST,
+                SEND_URL,
+                callback=connection_error_callback
+            )
             
-            with patch('sendly.utils.http_client.time.sleep') as mock_sleep:
-                with pytest.raises(NetworkError, match='Connection error'):
-                    self.client.sms.send(
-                        to='+14155552671',
-                        text='Connection error test'
-                    )
+            with pytest.raises(NetworkError, match='Connection error'):
+                self.client.sms.send(
+                    to='+14155552671',
+                    text='Connection error test'
+                )
                 
-                # Should attempt all retries
-                assert mock_sleep.call_count == 2  # max_retries
+            # Should attempt all retries
+            assert self.sleep.call_count == 2  # max_retries
+            assert len(rsps.calls) == 3
+
+    def test_circuit_breaker_short_circuits(self):
+        """Test that requests fail fast once the circuit breaker trips."""
+        def connection_error_callback(request):
+            raise requests.exceptions.ConnectionError('Connection refused')
+
+        client = Sendly(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            max_retries=0,
+            circuit_breaker=True
+        )
+
+        with responses.RequestsMock() as rsps:
+            rsps.add_callback(
+                responses.POST,
+                SEND_URL,
+                callback=connection_error_callback
+            )
+
+            # The default threshold is five consecutive failures
+            for _ in range(5):
+                with pytest.raises(NetworkError, match='Connection error'):
+                    client.sms.send(to='+14155552671', text='Outage test')
+
+            with pytest.raises(NetworkError, match='Circuit breaker is open'):
+                client.sms.send(to='+14155552671', text='Outage test')
+
+            assert len(rsps.calls) == 5
+
+        client.close()
     
     @responses.activate
     def test_partial_success_response(self):
         """Test handling of partial/incomplete success response."""
-        responses.add(
-            responses.POST,
-            f'{self.base_url}/v1/send',
+        self._add_send(
             json={
                 'messageId': 'msg_partial',
                 # Missing most fields that would normally be present
@@ -314,9 +374,7 @@ class TestErrorScenarios:
     @responses.activate
     def test_unexpected_success_status_code(self):
         """Test handling of unexpected success status codes."""
-        responses.add(
-            responses.POST,
-            f'{self.base_url}/v1/send',
+        self._add_send(
             json={
                 'messageId': 'msg_202',
                 'status': 'accepted',
@@ -337,9 +395,7 @@ class TestErrorScenarios:
     @responses.activate
     def test_error_response_with_extra_fields(self):
         """Test error response with additional fields."""
-        responses.add(
-            responses.POST,
-            f'{self.base_url}/v1/send',
+        self._add_send(
             json={
                 'error': 'validation_error',
                 'message': 'Phone number validation failed',
@@ -364,9 +420,7 @@ class TestErrorScenarios:
     @responses.activate
     def test_api_error_with_custom_code(self):
         """Test API error with custom error code."""
-        responses.add(
-            responses.POST,
-            f'{self.base_url}/v1/send',
+        self._add_send(
             json={
                 'error': 'insufficient_credits',
                 'message': 'Account has insufficient credits to send message'
@@ -401,47 +455,39 @@ class TestErrorScenarios:
         finally:
             client.close()
     
-    @responses.activate
     def test_concurrent_requests_independence(self):
         """Test that concurrent requests don't interfere with each other."""
-        # Add multiple identical responses
-        for i in range(3):
-            responses.add(
-                responses.POST,
-                f'{self.base_url}/v1/send',
-                json={
-                    'messageId': f'msg_concurrent_{i}',
-                    'status': 'queued',
-                    'routing': {}
-                },
-                status=200
-            )
+        def echo_key_callback(request):
+            # Answer with the API key the request was made with
+            key = request.headers['Authorization'][len('Bearer '):]
+            return 200, {}, json.dumps(_success(f'msg_{key}'))
         
-        # Create multiple clients to simulate concurrent usage
-        client1 = Sendly(api_key='sl_test_key1', base_url=self.base_url)
-        client2 = Sendly(api_key='sl_test_key2', base_url=self.base_url)
-        client3 = Sendly(api_key='sl_test_key3', base_url=self.base_url)
+        # Create multiple clients to send from concurrently
+        keys = [f'sl_test_concurrent{i}_1234567890123456' for i in range(1, 4)]
+        clients = [Sendly(api_key=key, base_url=self.base_url) for key in keys]
         
         try:
-            # Send messages concurrently (simulated)
-            response1 = client1.sms.send(to='+14155552671', text='Message 1')
-            response2 = client2.sms.send(to='+14155552672', text='Message 2')
-            response3 = client3.sms.send(to='+14155552673', text='Message 3')
-            
-            # Each should get their own response
-            assert response1.id == 'msg_concurrent_0'
-            assert response2.id == 'msg_concurrent_1'
-            assert response3.id == 'msg_concurrent_2'
-            
-            # Verify different API keys were used
-            assert 'sl_test_key1' in responses.calls[0].request.headers['Authorization']
-            assert 'sl_test_key2' in responses.calls[1].request.headers['Authorization']
-            assert 'sl_test_key3' in responses.calls[2].request.headers['Authorization']
-            
+            with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+                rsps.add_callback(responses.POST, SEND_URL, callback=echo_key_callback)
+                
+                with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+                    futures = {
+                        executor.submit(
+                            client.sms.send,
+                            to=f'+1415555267{i}',
+                            text=f'Message {i}'
+                        ): key
+                        for i, (client, key) in enumerate(zip(clients, keys), start=1)
+                    }
+                    
+                    # Each should get their own response
+                    for future in as_completed(futures):
+                        assert future.result().id == f'msg_{futures[future]}'
+                
+                assert len(rsps.calls) == len(clients)
         finally:
-            client1.close()
-            client2.close()
-            client3.close()
+            for client in clients:
+                client.close()
     
     def test_memory_cleanup_after_multiple_requests(self):
         """Test that memory is properly managed across multiple requests."""
@@ -1,9 +1,9 @@
 """Integration tests for SMS functionality."""
 
-import json
 import pytest
 import responses
-from unittest.mock import patch
+from responses import matchers
+from unittest.mock import Mock
 
 from sendly import Sendly
 from sendly.errors import (
@@ -28,6 +28,8 @@ class TestSMSIntegration:
             timeout=10.0,
             max_retries=2
         )
+        self.sleep = Mock()
+        self.client._http_client._sleep = self.sleep
     
     def teardown_method(self):
         """Clean up after tests."""
@@ -61,7 +63,13 @@ class TestSMSIntegration:
                     'currency': 'USD'
                 }
             },
-            status=200
+            status=200,
+            # Only answers if the request body is exactly this
+            match=[matchers.json_params_matcher({
+                'to': '+14155552671',
+                'messageType': 'transactional',
+                'text': 'Hello from Sendly!'
+            })]
         )
         
         # Send SMS
@@ -81,11 +89,6 @@ class TestSMSIntegration:
         assert request.headers['Content-Type'] == 'application/json'
         assert 'sendly-python' in request.headers['User-Agent']
         
-        # Verify request body
-        request_data = json.loads(request.body)
-        assert request_data['to'] == '+14155552671'
-        assert request_data['text'] == 'Hello from Sendly!'
-        
         # Verify response
         assert response.id == 'msg_abc123'
         assert response.status == 'queued'
@@ -126,7 +129,19 @@ class TestSMSIntegration:
                     'countryCode': '44'
                 }
             },
-            status=200
+            status=200,
+            # Only answers if the request body carries every parameter
+            match=[matchers.json_params_matcher({
+                'to': '+447700900123',
+                'text': 'Check this out!',
+                'from': '+14155551234',
+                'messageType': 'marketing',
+                'media_urls': ['https://example.com/image.jpg'],
+                'subject': 'Marketing Image',
+                'webhook_url': 'https://myapp.com/webhook',
+                'webhook_failover_url': 'https://myapp.com/webhook-backup',
+                'tags': ['campaign-spring', 'promo']
+            })]
         )
         
         # Send MMS with all parameters
@@ -142,18 +157,6 @@ class TestSMSIntegration:
             tags=['campaign-spring', 'promo']
         )
         
-        # Verify request body includes all parameters
-        request_data = json.loads(responses.calls[0].request.body)
-        assert request_data['to'] == '+447700900123'
-        assert request_data['text'] == 'Check this out!'
-        assert request_data['from'] == '+14155551234'
-        assert request_data['messageType'] == 'marketing'
-        assert request_data['media_urls'] == ['https://example.com/image.jpg']
-        assert request_data['subject'] == 'Marketing Image'
-        assert request_data['webhook_url'] == 'https://myapp.com/webhook'
-        assert request_data['webhook_failover_url'] == 'https://myapp.com/webhook-backup'
-        assert request_data['tags'] == ['campaign-spring', 'promo']
-        
         # Verify response
         assert response.id == 'msg_mms456'
         assert response.message_type == 'marketing'
@@ -161,42 +164,29 @@ class TestSMSIntegration:
         assert response.tags == ['campaign-spring', 'promo']
     
     @responses.activate
-    def test_validation_error_from_api(self):
-        """Test validation error returned by API."""
-        responses.add(
-            responses.POST,
-            f'{self.base_url}/v1/send',
-            json={
-                'error': 'validation_error',
-                'message': 'Invalid phone number format for to field'
-            },
-            status=400
-        )
-        
-        with pytest.raises(ValidationError, match='Invalid phone number format for to field'):
-            self.client.sms.send(
-                to='invalid-phone',
-                text='Hello'
-            )
-    
-    @responses.activate
-    def test_authentication_error_from_api(self):
-        """Test authentication error from API."""
+    @pytest.mark.parametrize('status, code, message, error', [
+        (400, 'validation_error', 'Invalid phone number format for to field', ValidationError),
+        (401, 'authentication_error', 'Invalid API key provided', AuthenticationError),
+        (404, 'not_found', 'Resource not found', APIError),
+    ])
+    def test_api_error_not_retried(self, status, code, message, error):
+        """Test that API client errors raise the matching exception without retrying."""
         responses.add(
             responses.POST,
             f'{self.base_url}/v1/send',
-            json={
-                'error': 'authentication_error',
-                'message': 'Invalid API key provided'
-            },
-            status=401
+            json={'error': code, 'message': message},
+            status=status
         )
         
-        with pytest.raises(AuthenticationError, match='Invalid API key provided'):
+        with pytest.raises(error) as exc_info:
             self.client.sms.send(
                 to='+14155552671',
                 text='Hello'
             )
+        
+        assert exc_info.value.message == message
+        assert exc_info.value.code == code
+        assert len(responses.calls) == 1
     
     @responses.activate
     def test_rate_limit_with_retry_success(self):
@@ -234,47 +224,44 @@ class TestSMSIntegration:
             status=200
         )
         
-        with patch('sendly.utils.http_client.time.sleep') as mock_sleep:
-            # Should succeed after retry
-            response = self.client.sms.send(
-                to='+14155552671',
-                text='Retry success!'
-            )
-            
-            # Verify retry delay
-            mock_sleep.assert_called_once_with(2.0)
-            
-            # Verify success response
-            assert response.id == 'msg_retry_success'
-            assert response.text == 'Retry success!'
-            
-            # Verify two API calls were made
-            assert len(responses.calls) == 2
+        # Should succeed after retry
+        response = self.client.sms.send(
+            to='+14155552671',
+            text='Retry success!'
+        )
+        
+        # Verify retry delay
+        self.sleep.assert_called_once_with(2.0)
+        
+        # Verify success response
+        assert response.id == 'msg_retry_success'
+        assert response.text == 'Retry success!'
+        
+        # Verify two API calls were made
+        assert len(responses.calls) == 2
     
     @responses.activate
     def test_rate_limit_max_retries_exceeded(self):
         """Test rate limit error exceeding max retries."""
-        # Mock multiple rate limit responses
-        for _ in range(3):  # max_retries + 1
-            responses.add(
-                responses.POST,
-                f'{self.base_url}/v1/send',
-                json={
-                    'error': 'rate_limit_exceeded',
-                    'message': 'Rate limit exceeded'
-                },
-                status=429
+        # One registration answers every attempt (max_retries + 1)
+        responses.add(
+            responses.POST,
+            f'{self.base_url}/v1/send',
+            json={
+                'error': 'rate_limit_exceeded',
+                'message': 'Rate limit exceeded'
+            },
+            status=429
+        )
+        
+        with pytest.raises(RateLimitError, match='Rate limit exceeded'):
+            self.client.sms.send(
+                to='+14155552671',
+                text='Will fail'
             )
         
-        with patch('sendly.utils.http_client.time.sleep'):
-            with pytest.raises(RateLimitError, match='Rate limit exceeded'):
-                self.client.sms.send(
-                    to='+14155552671',
-                    text='Will fail'
-                )
-            
-            # Verify all retry attempts were made
-            assert len(responses.calls) == 3
+        # Verify all retry attempts were made
+        assert len(responses.calls) == 3
     
     @responses.activate
     def test_server_error_with_retry_success(self):
@@ -302,45 +289,18 @@ class TestSMSIntegration:
             status=200
         )
         
-        with patch('sendly.utils.http_client.time.sleep') as mock_sleep:
-            response = self.client.sms.send(
-                to='+14155552671',
-                text='Server retry test'
-            )
-            
-            # Verify exponential backoff delay
-            mock_sleep.assert_called_once_with(1.0)
-            
-            # Verify success
-            assert response.id == 'msg_server_retry'
-            assert len(responses.calls) == 2
-    
-    @responses.activate
-    def test_api_error_non_retryable(self):
-        """Test non-retryable API error."""
-        responses.add(
-            responses.POST,
-            f'{self.base_url}/v1/send',
-            json={
-                'error': 'not_found',
-                'message': 'Resource not found'
-            },
-            status=404
+        response = self.client.sms.send(
+            to='+14155552671',
+            text='Server retry test'
         )
         
-        with pytest.raises(APIError) as exc_info:
-            self.client.sms.send(
-                to='+14155552671',
-                text='Will fail'
-            )
+        # Verify exponential backoff delay
+        self.sleep.assert_called_once()
+        assert 0.5 <= self.sleep.call_args[0][0] <= 1.0
         
-        # Verify error details
-        assert exc_info.value.message == 'Resource not found'
-        assert exc_info.value.status_code == 404
-        assert exc_info.value.code == 'not_found'
-        
-        # Verify no retries for non-retryable error
-        assert len(responses.calls) == 1
+        # Verify success
+        assert response.id == 'msg_server_retry'
+        assert len(responses.calls) == 2
     
     def test_client_validation_before_api_call(self):
         """Test that client-side validation prevents invalid API calls."""
@@ -380,39 +340,21 @@ class TestSMSIntegration:
                 text='Network error test'
             )
     
-    def test_client_context_manager(self):
-        """Test client as context manager."""
-        with Sendly(api_key=self.api_key, base_url=self.base_url) as client:
-            assert client.sms is not None
-            assert client._http_client is not None
-        
-        # Client should be properly closed after context exit
-        # (We can't easily verify session closure without exposing internals)
-    
     def test_multiple_clients_independence(self):
         """Test that multiple client instances are independent."""
-        client1 = Sendly(
-            api_key='sl_test_key1',
-            base_url='https://api1.example.com'
-        )
-        client2 = Sendly(
-            api_key='sl_test_key2', 
-            base_url='https://api2.example.com'
-        )
+        key1 = 'sl_test_client1_123456789012345678'
+        key2 = 'sl_test_client2_123456789012345678'
         
-        try:
+        with Sendly(api_key=key1, base_url='https://api1.example.com') as client1, \
+                Sendly(api_key=key2, base_url='https://api2.example.com') as client2:
             # Verify clients have different configurations
-            assert client1._http_client.api_key == 'sl_test_key1'
-            assert client2._http_client.api_key == 'sl_test_key2'
+            assert client1._http_client.api_key == key1
+            assert client2._http_client.api_key == key2
             assert client1._http_client.base_url == 'https://api1.example.com'
             assert client2._http_client.base_url == 'https://api2.example.com'
             
             # Verify they have independent sessions
             assert client1._http_client.session is not client2._http_client.session
-            
-        finally:
-            client1.close()
-            client2.close()
     
     @responses.activate
     def test_large_message_segmentation(self):
@@ -439,7 +381,13 @@ class TestSMSIntegration:
                     'currency': 'USD'
                 }
             },
-            status=200
+            status=200,
+            # The full text is sent in one request; the API does the segmenting
+            match=[matchers.json_params_matcher({
+                'to': '+14155552671',
+                'messageType': 'transactional',
+                'text': large_text
+            })]
         )
         
         response = self.client.sms.send(
@@ -488,13 +436,20 @@ class TestSMSIntegration:
         assert response.routing.reason == 'international-routing'
         assert response.cost.amount == 0.045
     
-    def test_client_configuration_immutability(self):
-        """Test that client configuration cannot be accidentally modified."""
-        original_base_url = self.client._http_client.base_url
-        original_api_key = self.client._http_client.api_key
-        original_timeout = self.client._http_client.timeout
+    @responses.activate
+    def test_client_configuration_unchanged_by_requests(self):
+        """Test that constructor settings reach the HTTP client and survive a send."""
+        responses.add(
+            responses.POST,
+            f'{self.base_url}/v1/send',
+            json={'messageId': 'msg_config', 'status': 'queued', 'routing': {}},
+            status=200
+        )
+        
+        self.client.sms.send(to='+14155552671', text='Config test')
         
-        # These should remain unchanged regardless of what we try to do
-        assert self.client._http_client.base_url == original_base_url
-        assert self.client._http_client.api_key == original_api_key  
-        assert self.client._http_client.timeout == original_timeout
\ No newline at end of file
+        http_client = self.client._http_client
+        assert http_client.base_url == self.base_url
+        assert http_client.api_key == self.api_key
+        assert http_client.timeout == 10.0
+        assert http_client.max_retries == 2
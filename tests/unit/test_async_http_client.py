@@ -0,0 +1,425 @@
+"""Tests for the async HTTP client."""
+
+import asyncio
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+httpx = pytest.importorskip('httpx')
+
+from sendly import AsyncSendly, Sendly
+from sendly.errors import (
+    APIError,
+    AuthenticationError,
+    NetworkError,
+    RateLimitError,
+    ValidationError,
+)
+from sendly.resources.async_sms import AsyncSMS
+from sendly.types import SMSRequest
+from sendly.utils.async_http_client import AsyncHttpClient
+
+
+def make_client(handler, **kwargs):
+    """Create an AsyncHttpClient whose requests are served by ``handler``."""
+    client = AsyncHttpClient('https://api.sendly.example.com', 'test-key', **kwargs)
+    client.client = httpx.AsyncClient(
+        base_url=client.base_url,
+        headers=client.client.headers,
+        transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def run(coro):
+    """Run a coroutine to completion."""
+    return asyncio.run(coro)
+
+
+async def _no_sleep(delay):
+    """Return at once instead of sleeping."""
+
+
+def sleep_mock():
+    """Create a mock for asyncio.sleep (AsyncMock needs Python 3.8)."""
+    return Mock(side_effect=_no_sleep)
+
+
+class TestAsyncHttpClient:
+    """Test cases for AsyncHttpClient."""
+
+    def test_client_initialization(self):
+        """Test async client configuration and headers."""
+        client = AsyncHttpClient(
+            base_url='https://api.example.com/',
+            api_key='test-key',
+            timeout=60.0,
+            max_retries=5,
+            user_agent='custom-agent/1.0',
+            max_concurrent=8
+        )
+
+        assert client.base_url == 'https://api.example.com'
+        assert client.timeout == 60.0
+        assert client.max_retries == 5
+        assert client.max_concurrent == 8
+        assert client.client.headers['Authorization'] == 'Bearer test-key'
+        assert client.client.headers['User-Agent'] == 'custom-agent/1.0'
+
+    def test_successful_post_request(self):
+        """Test successful POST request."""
+        seen = {}
+
+        def handler(request):
+            seen['url'] = str(request.url)
+            seen['body'] = json.loads(request.content)
+            return httpx.Response(200, json={'id': 'msg_123'})
+
+        client = make_client(handler)
+        result = run(client.post('/v1/send', {'to': '+14155552671'}))
+
+        assert result == {'id': 'msg_123'}
+        assert seen['url'] == 'https://api.sendly.example.com/v1/send'
+        assert seen['body'] == {'to': '+14155552671'}
+
+    def test_successful_get_request(self):
+        """Test successful GET request with serialized params."""
+        seen = {}
+
+        def handler(request):
+            seen['params'] = dict(request.url.params)
+            return httpx.Response(200, json={'messages': []})
+
+        client = make_client(handler)
+        result = run(client.get('/v1/messages', {'limit': 10, 'status': None}))
+
+        assert result == {'messages': []}
+        assert seen['params'] == {'limit': '10'}
+
+    @pytest.mark.parametrize("status,error_class", [
+        (400, ValidationError),
+        (401, AuthenticationError),
+        (404, APIError),
+    ])
+    def test_error_status_mapping(self, status, error_class):
+        """Test that error statuses map to Sendly exceptions."""
+        def handler(request):
+            return httpx.Response(status, json={'error': 'bad', 'message': 'Nope'})
+
+        client = make_client(handler)
+
+        with pytest.raises(error_class, match='Nope'):
+            run(client.post('/v1/send', {}))
+
+    @patch('sendly.utils.async_http_client.asyncio.sleep', new_callable=sleep_mock)
+    def test_rate_limit_retry_uses_retry_after(self, mock_sleep):
+        """Test 429 retry honours retry_after."""
+        replies = [
+            httpx.Response(429, json={'error': 'rate_limit_exceeded', 'retry_after': 2}),
+            httpx.Response(200, json={'id': 'msg_123'}),
+        ]
+
+        client = make_client(lambda request: replies.pop(0))
+        result = run(client.post('/v1/send', {}))
+
+        assert result == {'id': 'msg_123'}
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch('sendly.utils.async_http_client.asyncio.sleep', new_callable=sleep_mock)
+    def test_rate_limit_max_retries(self, mock_sleep):
+        """Test 429 raises RateLimitError after exhausting retries."""
+        def handler(request):
+            return httpx.Response(429, json={'message': 'Slow down', 'retry_after': 1})
+
+        client = make_client(handler, max_retries=2)
+
+        with pytest.raises(RateLimitError, match='Slow down') as exc_info:
+            run(client.post('/v1/send', {}))
+
+        assert exc_info.value.retry_after == 1
+        assert mock_sleep.call_count == 2
+
+    @patch('sendly.utils.async_http_client.asyncio.sleep', new_callable=sleep_mock)
+    def test_waits_for_rate_limiter_token(self, mock_sleep):
+        """Test that an empty token bucket delays the attempt like the sync client."""
+        limiter = Mock()
+        limiter.reserve.return_value = 0.25
+        client = make_client(
+            lambda request: httpx.Response(200, json={'id': 'msg_123'}),
+            rate_limiter=limiter
+        )
+
+        assert run(client.post('/v1/send', {})) == {'id': 'msg_123'}
+        limiter.reserve.assert_called_once_with()
+        mock_sleep.assert_called_once_with(0.25)
+
+    @patch('sendly.utils.async_http_client.asyncio.sleep', new_callable=sleep_mock)
+    def test_timeout_retry(self, mock_sleep):
+        """Test timeouts are retried and finally raise NetworkError."""
+        def handler(request):
+            raise httpx.ReadTimeout('timed out', request=request)
+
+        client = make_client(handler, max_retries=1)
+
+        with pytest.raises(NetworkError, match='Request timed out'):
+            run(client.post('/v1/send', {}))
+
+        assert mock_sleep.call_count == 1
+
+    @patch('sendly.utils.async_http_client.asyncio.sleep', new_callable=sleep_mock)
+    def test_connection_error_retry(self, mock_sleep):
+        """Test connection errors are retried."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ConnectError('refused', request=request)
+            return httpx.Response(200, json={'status': 'success'})
+
+        client = make_client(handler, max_retries=1)
+        result = run(client.post('/v1/send', {}))
+
+        assert result == {'status': 'success'}
+        assert len(calls) == 2
+
+    def test_invalid_json_response(self):
+        """Test that a non-JSON success body raises APIError."""
+        def handler(request):
+            return httpx.Response(200, content=b'not json')
+
+        client = make_client(handler)
+
+        with pytest.raises(APIError, match='Invalid JSON in response'):
+            run(client.post('/v1/send', {}))
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrent requests are in flight."""
+        state = {'active': 0, 'peak': 0}
+
+        async def handler(request):
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+            await asyncio.sleep(0.01)
+            state['active'] -= 1
+            return httpx.Response(200, json={})
+
+        client = make_client(handler, max_concurrent=3)
+
+        async def send_all():
+            await asyncio.gather(*(client.post('/v1/send', {}) for _ in range(10)))
+
+        run(send_all())
+
+        assert state['peak'] == 3
+
+
+class TestSendlyAsyncSMS:
+    """Test cases for Sendly.async_sms."""
+
+    API_KEY = 'sl_test_1234567890123456789012345678901234567890'
+
+    def test_async_sms_is_lazy(self):
+        """Test that the async client is only created on first access."""
+        client = Sendly(self.API_KEY, timeout=10.0, max_retries=2)
+
+        assert client._async_http_client is None
+        assert isinstance(client.async_sms, AsyncSMS)
+        assert client.async_sms is client.async_sms
+        assert client._async_http_client.timeout == 10.0
+        assert client._async_http_client.max_retries == 2
+
+    def test_async_sms_shares_rate_limiter(self):
+        """Test that sync and async sends draw from the same token bucket."""
+        client = Sendly(self.API_KEY, rate_limit=5)
+        client.async_sms
+
+        assert client._async_http_client.rate_limiter is client._http_client.rate_limiter
+
+    def test_async_sms_shares_user_agent(self):
+        """Test that a custom user agent reaches the async client."""
+        client = Sendly(self.API_KEY, user_agent='custom-agent/1.0')
+
+        headers = client.async_sms._http_client.client.headers
+        assert headers['User-Agent'] == 'custom-agent/1.0'
+
+    def test_async_sms_uses_http2_when_requested(self):
+        """Test that http2=True is passed on to httpx."""
+        with patch('sendly.utils.httpx_client.httpx.Client'):
+            client = Sendly(self.API_KEY, http2=True)
+
+        with patch('sendly.utils.async_http_client.httpx.AsyncClient') as mock_client:
+            client.async_sms
+
+        assert mock_client.call_args.kwargs['http2'] is True
+
+    def test_async_sms_http1_by_default(self):
+        """Test that HTTP/2 is opt-in."""
+        client = Sendly(self.API_KEY)
+
+        with patch('sendly.utils.async_http_client.httpx.AsyncClient') as mock_client:
+            client.async_sms
+
+        assert mock_client.call_args.kwargs['http2'] is False
+
+    def test_async_send(self):
+        """Test sending a message through async_sms."""
+        client = Sendly(self.API_KEY)
+
+        def handler(request):
+            assert json.loads(request.content)['to'] == '+14155552671'
+            return httpx.Response(200, json={'id': 'msg_async', 'status': 'queued'})
+
+        sms = client.async_sms
+        sms._http_client.client = httpx.AsyncClient(
+            base_url=sms._http_client.base_url,
+            transport=httpx.MockTransport(handler)
+        )
+
+        async def send():
+            async with client:
+                return await client.async_sms.send(to='+14155552671', text='Hello')
+
+        response = run(send())
+
+        assert response.id == 'msg_async'
+        assert response.status == 'queued'
+
+    def test_async_send_many(self):
+        """Test bulk sending through async_sms."""
+        client = Sendly(self.API_KEY)
+
+        def handler(request):
+            assert request.url.path.endswith('/v1/send/bulk')
+            messages = json.loads(request.content)['messages']
+            return httpx.Response(200, json={
+                'messages': [{'id': m['to']} for m in messages]
+            })
+
+        sms = client.async_sms
+        sms._http_client.client = httpx.AsyncClient(
+            base_url=sms._http_client.base_url,
+            transport=httpx.MockTransport(handler)
+        )
+
+        responses = run(sms.send_many([
+            SMSRequest(to='+14155552671', text='One'),
+            SMSRequest(to='+14155552672', text='Two'),
+        ]))
+
+        assert [r.id for r in responses] == ['+14155552671', '+14155552672']
+
+    def test_async_wait_for_status(self):
+        """Test polling a message through async_sms."""
+        client = Sendly(self.API_KEY)
+        statuses = iter(['queued', 'sent', 'delivered'])
+
+        def handler(request):
+            assert request.url.path.endswith('/v1/messages/msg_1')
+            return httpx.Response(200, json={'id': 'msg_1', 'status': next(statuses)})
+
+        sms = client.async_sms
+        sms._http_client.client = httpx.AsyncClient(
+            base_url=sms._http_client.base_url,
+            transport=httpx.MockTransport(handler)
+        )
+
+        response = run(sms.wait_for_status('msg_1', initial=0.001))
+
+        assert response.status == 'delivered'
+
+    def test_async_send_validates_request(self):
+        """Test that async sends run the same validation."""
+        client = Sendly(self.API_KEY)
+
+        with pytest.raises(ValidationError, match='Invalid phone number format'):
+            run(client.async_sms.send(to='invalid', text='Hello'))
+
+    def test_async_submit(self):
+        """Test that submit schedules a send on the running loop."""
+        client = Sendly(self.API_KEY)
+
+        def handler(request):
+            assert request.url.path.endswith('/v1/send')
+            return httpx.Response(200, json={'id': 'msg_submit', 'status': 'queued'})
+
+        sms = client.async_sms
+        sms._http_client.client = httpx.AsyncClient(
+            base_url=sms._http_client.base_url,
+            transport=httpx.MockTransport(handler)
+        )
+
+        async def submit():
+            task = sms.submit(to='+14155552671', text='Hello')
+            assert isinstance(task, asyncio.Task)
+            return await task
+
+        response = run(submit())
+
+        assert response.id == 'msg_submit'
+
+    def test_async_submit_validates_request(self):
+        """Test that submit rejects invalid messages before scheduling."""
+        client = Sendly(self.API_KEY)
+
+        async def submit():
+            client.async_sms.submit(to='invalid', text='Hello')
+
+        with pytest.raises(ValidationError, match='Invalid phone number format'):
+            run(submit())
+
+    def test_async_submit_requires_running_loop(self):
+        """Test that submit outside an event loop fails clearly."""
+        client = Sendly(self.API_KEY)
+
+        with pytest.raises(RuntimeError):
+            client.async_sms.submit(to='+14155552671', text='Hello')
+
+
+class TestAsyncSendly:
+    """Test cases for the AsyncSendly client."""
+
+    API_KEY = 'sl_test_1234567890123456789012345678901234567890'
+
+    def test_initialization(self):
+        """Test that configuration reaches the async HTTP client."""
+        client = AsyncSendly(
+            self.API_KEY,
+            base_url='https://api.example.com/',
+            timeout=10.0,
+            max_retries=2,
+            max_concurrent=8,
+            rate_limit=5
+        )
+
+        assert isinstance(client.sms, AsyncSMS)
+        assert client._http_client.base_url == 'https://api.example.com'
+        assert client._http_client.timeout == 10.0
+        assert client._http_client.max_retries == 2
+        assert client._http_client.max_concurrent == 8
+        assert client._http_client.rate_limiter.rate == 5.0
+
+    def test_invalid_api_key(self):
+        """Test that API keys are validated like the sync client."""
+        with pytest.raises(ValidationError, match='Invalid API key format'):
+            AsyncSendly('invalid_key')
+
+    def test_send_and_close(self):
+        """Test sending through the async context manager."""
+        def handler(request):
+            return httpx.Response(200, json={'id': 'msg_async', 'status': 'queued'})
+
+        async def send():
+            async with AsyncSendly(self.API_KEY) as client:
+                client._http_client.client = httpx.AsyncClient(
+                    base_url=client._http_client.base_url,
+                    transport=httpx.MockTransport(handler)
+                )
+                response = await client.sms.send(to='+14155552671', text='Hello')
+            return client, response
+
+        client, response = run(send())
+
+        assert response.id == 'msg_async'
+        assert client._http_client.client.is_closed
@@ -0,0 +1,119 @@
+"""Tests for request batching."""
+
+import threading
+
+import pytest
+
+from sendly.errors import APIError, NetworkError
+from sendly.utils.batcher import RequestBatcher
+
+
+class RecordingPost:
+    """POST stand-in that records calls and echoes bulk payloads."""
+
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, endpoint, data):
+        self.release.wait(5)
+        self.calls.append((endpoint, data))
+        if self.error:
+            raise self.error
+        if endpoint.endswith('/bulk'):
+            return {'messages': [{'id': item['to']} for item in data['messages']]}
+        return {'id': data['to']}
+
+
+class TestRequestBatcher:
+    """Test cases for RequestBatcher."""
+
+    def test_single_item_uses_single_endpoint(self):
+        """Test that a lone item is posted to the single-item endpoint."""
+        post = RecordingPost()
+        batcher = RequestBatcher(post, '/v1/send', max_wait_ms=1)
+
+        result = batcher.submit({'to': '+14155552671'}).result(timeout=5)
+        batcher.close()
+
+        assert result == {'id': '+14155552671'}
+        assert post.calls == [('/v1/send', {'to': '+14155552671'})]
+
+    def test_concurrent_items_are_coalesced(self):
+        """Test that queued items are sent as one bulk request."""
+        post = RecordingPost()
+        batcher = RequestBatcher(post, '/v1/send', max_batch=10, max_wait_ms=200)
+
+        futures = [batcher.submit({'to': f'+1415555000{i}'}) for i in range(5)]
+        results = [future.result(timeout=5) for future in futures]
+        batcher.close()
+
+        assert results == [{'id': f'+1415555000{i}'} for i in range(5)]
+        assert len(post.calls) == 1
+        endpoint, data = post.calls[0]
+        assert endpoint == '/v1/send/bulk'
+        assert len(data['messages']) == 5
+
+    def test_batches_respect_max_batch(self):
+        """Test that batches never exceed max_batch items."""
+        post = RecordingPost()
+        post.release.clear()
+        batcher = RequestBatcher(post, '/v1/send', max_batch=3, max_wait_ms=200)
+
+        futures = [batcher.submit({'to': f'+1415555000{i}'}) for i in range(7)]
+        post.release.set()
+        for future in futures:
+            future.result(timeout=5)
+        batcher.close()
+
+        sizes = [
+            len(data['messages']) if endpoint.endswith('/bulk') else 1
+            for endpoint, data in post.calls
+        ]
+        assert sum(sizes) == 7
+        assert max(sizes) <= 3
+
+    def test_errors_propagate_to_every_future(self):
+        """Test that a failed request fails all futures in the batch."""
+        post = RecordingPost(error=NetworkError('Connection error'))
+        batcher = RequestBatcher(post, '/v1/send', max_wait_ms=100)
+
+        futures = [batcher.submit({'to': f'+1415555000{i}'}) for i in range(3)]
+
+        for future in futures:
+            with pytest.raises(NetworkError, match='Connection error'):
+                future.result(timeout=5)
+        batcher.close()
+
+    def test_mismatched_bulk_response(self):
+        """Test that a bulk response of the wrong length raises APIError."""
+        def post(endpoint, data):
+            return {'messages': []}
+
+        batcher = RequestBatcher(post, '/v1/send', max_wait_ms=100)
+        futures = [batcher.submit({'to': '+14155552671'}) for _ in range(2)]
+
+        for future in futures:
+            with pytest.raises(APIError, match='did not contain 2 messages'):
+                future.result(timeout=5)
+        batcher.close()
+
+    def test_close_flushes_pending_items(self):
+        """Test that close() sends items that are still queued."""
+        post = RecordingPost()
+        batcher = RequestBatcher(post, '/v1/send', max_wait_ms=10000)
+
+        future = batcher.submit({'to': '+14155552671'})
+        batcher.close()
+
+        assert future.result(timeout=0) == {'id': '+14155552671'}
+
+    def test_submit_after_close_raises(self):
+        """Test that a closed batcher rejects new items."""
+        batcher = RequestBatcher(RecordingPost(), '/v1/send')
+        batcher.close()
+
+        with pytest.raises(RuntimeError, match='closed batcher'):
+            batcher.submit({'to': '+14155552671'})
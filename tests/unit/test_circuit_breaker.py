@@ -0,0 +1,171 @@
+"""Tests for the client-side circuit breaker."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from sendly.errors import APIError, NetworkError, ValidationError
+from sendly.utils.circuit_breaker import CircuitBreaker, CircuitState
+from sendly.utils.http_client import HttpClient
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+
+    def test_invalid_threshold(self):
+        """Test that a threshold below one is rejected."""
+        with pytest.raises(ValueError, match='failure_threshold must be at least 1'):
+            CircuitBreaker(failure_threshold=0)
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that the circuit opens at the failure threshold."""
+        breaker = CircuitBreaker(failure_threshold=3, clock=FakeClock())
+
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow()
+
+    def test_success_resets_failure_count(self):
+        """Test that only consecutive failures count."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_lets_one_trial_through(self):
+        """Test that one trial request is allowed after the reset timeout."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+
+        clock.now += 30
+
+        assert breaker.allow()
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert not breaker.allow()
+
+    def test_successful_trial_closes_circuit(self):
+        """Test that a successful trial closes the circuit."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now += 30
+        breaker.allow()
+
+        breaker.record_success()
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow()
+
+    def test_failed_trial_reopens_circuit(self):
+        """Test that a failed trial keeps the circuit open for another period."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30, clock=clock)
+        for _ in range(5):
+            breaker.record_failure()
+        clock.now += 30
+        breaker.allow()
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        clock.now += 29
+        assert not breaker.allow()
+        clock.now += 1
+        assert breaker.allow()
+
+
+class TestHttpClientCircuitBreaker:
+    """Test how HttpClient uses a circuit breaker."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.api_key = 'sl_test_1234567890123456789012345678901234567890'
+        self.base_url = 'https://api.sendly.example.com'
+
+    @patch('sendly.utils.http_client.requests.Session')
+    def test_open_circuit_stops_retries(self, mock_session_class):
+        """Test that retries stop as soon as the circuit opens."""
+        mock_sleep = Mock()
+        mock_session = Mock()
+        mock_session.request.side_effect = requests.exceptions.ConnectionError()
+        mock_session_class.return_value = mock_session
+
+        client = HttpClient(
+            self.base_url,
+            self.api_key,
+            max_retries=5,
+            circuit_breaker=CircuitBreaker(failure_threshold=2),
+            sleep=mock_sleep
+        )
+
+        with pytest.raises(NetworkError, match='Connection error'):
+            client.post('/v1/send', {})
+
+        assert mock_session.request.call_count == 2
+        assert mock_sleep.call_count == 1
+
+    @patch('sendly.utils.http_client.requests.Session')
+    def test_server_errors_trip_circuit(self, mock_session_class):
+        """Test that 5xx responses count as failures."""
+        mock_session = Mock()
+        mock_session.request.return_value = Mock(
+            ok=False,
+            status_code=503,
+            content=b'{"error": "unavailable", "message": "Down"}',
+            reason='Service Unavailable'
+        )
+        mock_session_class.return_value = mock_session
+
+        breaker = CircuitBreaker(failure_threshold=3)
+        client = HttpClient(
+            self.base_url, self.api_key, circuit_breaker=breaker, sleep=Mock()
+        )
+
+        with pytest.raises(APIError, match='Down'):
+            client.post('/v1/send', {})
+        with pytest.raises(NetworkError, match='Circuit breaker is open'):
+            client.post('/v1/send', {})
+
+        assert breaker.state is CircuitState.OPEN
+        assert mock_session.request.call_count == 3
+
+    @patch('sendly.utils.http_client.requests.Session')
+    def test_client_errors_do_not_trip_circuit(self, mock_session_class):
+        """Test that 4xx responses show the API is up."""
+        mock_session = Mock()
+        mock_session.request.return_value = Mock(
+            ok=False,
+            status_code=400,
+            content=b'{"error": "invalid", "message": "Bad request"}',
+            reason='Bad Request'
+        )
+        mock_session_class.return_value = mock_session
+
+        breaker = CircuitBreaker(failure_threshold=1)
+        client = HttpClient(self.base_url, self.api_key, circuit_breaker=breaker)
+
+        for _ in range(3):
+            with pytest.raises(ValidationError):
+                client.post('/v1/send', {})
+
+        assert breaker.state is CircuitState.CLOSED
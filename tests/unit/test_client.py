@@ -5,12 +5,20 @@ import pytest
 from unittest.mock import patch
 
 from sendly import Sendly
+from sendly.client import _clear_default_api_key
 from sendly.errors import ValidationError
 from sendly.resources.sms import SMS
 
 
 class TestSendlyClient:
     """Test cases for the Sendly client."""
+
+    @pytest.fixture(autouse=True)
+    def clear_api_key_cache(self):
+        """Make each test see the current SENDLY_API_KEY value."""
+        _clear_default_api_key()
+        yield
+        _clear_default_api_key()
     
     def test_client_initialization_with_api_key(self):
         """Test client initialization with API key parameter."""
@@ -32,6 +40,30 @@ class TestSendlyClient:
         with patch.dict(os.environ, {}, clear=True):
             with pytest.raises(ValidationError, match='API key is required'):
                 Sendly()
+
+    def test_env_var_read_once(self):
+        """Test that SENDLY_API_KEY is only read on first use."""
+        key = 'sl_test_1234567890123456789012345678901234567890'
+        with patch.dict(os.environ, {'SENDLY_API_KEY': key}):
+            with patch('sendly.client.os.getenv', wraps=os.getenv) as mock_getenv:
+                first = Sendly()
+                second = Sendly()
+
+        assert mock_getenv.call_count == 1
+        assert first._http_client.api_key == key
+        assert second._http_client.api_key == key
+
+    def test_env_var_set_after_missing_key(self):
+        """Test that a key exported after a failed lookup is picked up."""
+        key = 'sl_test_1234567890123456789012345678901234567890'
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ValidationError, match='API key is required'):
+                Sendly()
+
+            os.environ['SENDLY_API_KEY'] = key
+            client = Sendly()
+
+        assert client._http_client.api_key == key
     
     def test_client_initialization_invalid_api_key_format(self):
         """Test client initialization fails with invalid API key format."""
@@ -51,42 +83,66 @@ class TestSendlyClient:
         assert client._http_client.base_url == 'https://api.example.com'
         assert client._http_client.timeout == 60.0
         assert client._http_client.max_retries == 5
+
+    def test_client_pool_size_passed_to_http_client(self):
+        """Test that pool_size configures the HTTP connection pool."""
+        client = Sendly(
+            api_key='sl_test_1234567890123456789012345678901234567890',
+            pool_size=4
+        )
+
+        adapter = client._http_client.session.get_adapter('https://sendly.live')
+        assert adapter._pool_maxsize == 4
     
-    def test_valid_api_key_formats(self):
+    def test_client_rate_limit(self):
+        """Test that rate_limit installs a token bucket shared with async_sms."""
+        client = Sendly(
+            api_key='sl_test_1234567890123456789012345678901234567890',
+            rate_limit=5
+        )
+
+        assert client._http_client.rate_limiter.rate == 5.0
+
+    def test_client_no_rate_limit_by_default(self):
+        """Test that requests are not throttled unless asked."""
+        client = Sendly(api_key='sl_test_1234567890123456789012345678901234567890')
+
+        assert client._http_client.rate_limiter is None
+    
+    @pytest.mark.parametrize('key', [
+        'sl_test_1234567890123456789012345678901234567890',
+        'sl_live_abcdefghijklmnopqrstuvwxyz1234567890abcd',
+        'sl_test_ABC123_def456_GHI789',
+        'sl_live_short123456789012345678'
+    ])
+    def test_valid_api_key_formats(self, key):
         """Test various valid API key formats."""
-        valid_keys = [
-            'sl_test_1234567890123456789012345678901234567890',
-            'sl_live_abcdefghijklmnopqrstuvwxyz1234567890abcd',
-            'sl_test_ABC123_def456_GHI789',
-            'sl_live_short123456789012345678'
-        ]
-        
-        for key in valid_keys:
-            client = Sendly(key)
-            assert client.sms is not None
+        client = Sendly(key)
+        assert client.sms is not None
     
-    def test_invalid_api_key_formats(self):
+    @pytest.mark.parametrize('key', [
+        'invalid-key',
+        'sl_invalid_1234567890123456789012345678901234567890',
+        'sl_test_short',
+        'sl_live_',
+        'test_1234567890123456789012345678901234567890',
+        ''
+    ])
+    def test_invalid_api_key_formats(self, key):
         """Test various invalid API key formats."""
-        invalid_keys = [
-            'invalid-key',
-            'sl_invalid_1234567890123456789012345678901234567890',
-            'sl_test_short',
-            'sl_live_',
-            'test_1234567890123456789012345678901234567890',
-            ''
-        ]
-        
-        for key in invalid_keys:
-            with pytest.raises(ValidationError):
-                Sendly(key)
+        with pytest.raises(ValidationError):
+            Sendly(key)
     
-    def test_context_manager(self):
+    @patch('sendly.utils.http_client.requests.Session')
+    def test_context_manager(self, mock_session_class):
         """Test client as context manager."""
         with Sendly('sl_test_1234567890123456789012345678901234567890') as client:
             assert client.sms is not None
+            assert client._http_client is not None
+            mock_session_class.return_value.close.assert_not_called()
         
-        # Client should be closed after context exit
-        # Note: We can't easily test if session is closed without exposing internals
+        # The HTTP session is closed on context exit
+        mock_session_class.return_value.close.assert_called_once()
     
     def test_manual_close(self):
         """Test manual client closure."""
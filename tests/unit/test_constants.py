@@ -0,0 +1,109 @@
+"""Tests for sandbox magic number constants."""
+
+import pytest
+
+from sendly.constants import (
+    MAGIC_NUMBERS,
+    MAGIC_NUMBER_INFO,
+    is_magic_number,
+    get_magic_number_info,
+    get_magic_numbers_by_category,
+    get_error_magic_numbers,
+    get_success_magic_numbers,
+)
+
+
+class TestMagicNumberInfo:
+    """Test cases for MAGIC_NUMBER_INFO metadata."""
+
+    def test_every_magic_number_has_info(self):
+        """Test that every number in MAGIC_NUMBERS has metadata."""
+        numbers = [
+            number
+            for group in MAGIC_NUMBERS.values()
+            for number in group.values()
+        ]
+
+        assert sorted(numbers) == sorted(MAGIC_NUMBER_INFO)
+
+    def test_info_entry_shape(self):
+        """Test the fields of a metadata entry."""
+        info = MAGIC_NUMBER_INFO['+15550001003']
+
+        assert dict(info) == {
+            'number': '+15550001003',
+            'category': 'error',
+            'description': 'Rate limit exceeded',
+            'http_status': 429,
+            'error': 'rate_limit_exceeded',
+        }
+
+    @pytest.mark.parametrize("group,category", [
+        ('success', 'success'),
+        ('errors', 'error'),
+        ('delays', 'delay'),
+        ('carriers', 'carrier'),
+        ('webhooks', 'webhook'),
+    ])
+    def test_category_names_are_singular(self, group, category):
+        """Test that categories use the singular form of the group name."""
+        for number in MAGIC_NUMBERS[group].values():
+            assert MAGIC_NUMBER_INFO[number]['category'] == category
+
+
+class TestMagicNumbersReadOnly:
+    """Test that the sandbox tables cannot be modified."""
+
+    def test_magic_numbers_read_only(self):
+        """Test that MAGIC_NUMBERS and its groups reject writes."""
+        with pytest.raises(TypeError):
+            MAGIC_NUMBERS['custom'] = {}
+        with pytest.raises(TypeError):
+            MAGIC_NUMBERS['success']['instant'] = '+10000000000'
+
+    def test_magic_number_info_read_only(self):
+        """Test that MAGIC_NUMBER_INFO entries reject writes."""
+        with pytest.raises(TypeError):
+            MAGIC_NUMBER_INFO['+15550001234']['description'] = 'changed'
+
+    def test_lookup_by_key_unchanged(self):
+        """Test that nested key lookups still work."""
+        assert MAGIC_NUMBERS['success']['instant'] == '+15550001234'
+
+
+class TestMagicNumberLookup:
+    """Test cases for magic number lookup helpers."""
+
+    def test_is_magic_number(self):
+        """Test magic number detection."""
+        assert is_magic_number('+15550001234')
+        assert not is_magic_number('+14155552671')
+
+    def test_get_magic_number_info(self):
+        """Test metadata lookup."""
+        assert get_magic_number_info('+15550001235')['delay'] == 5000
+        assert get_magic_number_info('+14155552671') is None
+
+    def test_get_magic_numbers_by_category(self):
+        """Test category lookup preserves definition order."""
+        assert get_magic_numbers_by_category('delay') == [
+            '+15550001010',
+            '+15550001030',
+            '+15550001060',
+        ]
+
+    def test_get_magic_numbers_by_unknown_category(self):
+        """Test that an unknown category yields an empty list."""
+        assert get_magic_numbers_by_category('unknown') == []
+
+    def test_category_lookup_returns_fresh_list(self):
+        """Test that callers cannot mutate the cached index."""
+        numbers = get_magic_numbers_by_category('success')
+        numbers.append('+10000000000')
+
+        assert '+10000000000' not in get_magic_numbers_by_category('success')
+
+    def test_error_and_success_helpers(self):
+        """Test the error and success convenience helpers."""
+        assert get_error_magic_numbers() == list(MAGIC_NUMBERS['errors'].values())
+        assert get_success_magic_numbers() == list(MAGIC_NUMBERS['success'].values())
@@ -27,7 +27,6 @@ class TestSendlyError:
         """Test SendlyError with message and code."""
         error = SendlyError("Something went wrong", code="custom_error")
         
-        assert str(error) == "Something went wrong"
         assert error.message == "Something went wrong"
         assert error.code == "custom_error"
     
@@ -39,271 +38,83 @@ class TestSendlyError:
         assert isinstance(error, SendlyError)
 
 
-class TestValidationError:
-    """Test cases for ValidationError."""
-    
-    def test_validation_error_creation(self):
-        """Test ValidationError creation."""
-        error = ValidationError("Invalid phone number format")
-        
-        assert str(error) == "Invalid phone number format"
-        assert error.message == "Invalid phone number format"
-        assert error.code == "validation_error"
-    
-    def test_validation_error_inheritance(self):
-        """Test ValidationError inheritance."""
-        error = ValidationError("Validation failed")
-        
+# (error class, extra constructor arguments, expected code)
+ERROR_CASES = [
+    pytest.param(ValidationError, {}, "validation_error", id="validation"),
+    pytest.param(AuthenticationError, {}, "authentication_error", id="authentication"),
+    pytest.param(RateLimitError, {"retry_after": 30}, "rate_limit_exceeded", id="rate_limit"),
+    pytest.param(APIError, {"status_code": 500}, None, id="api"),
+    pytest.param(
+        APIError,
+        {"status_code": 400, "code": "bad_request"},
+        "bad_request",
+        id="api_with_code"
+    ),
+    pytest.param(NetworkError, {}, "network_error", id="network"),
+]
+
+
+class TestErrorSubclasses:
+    """Test cases shared by every specific Sendly error."""
+    
+    @pytest.mark.parametrize("error_class, kwargs, code", ERROR_CASES)
+    def test_creation(self, error_class, kwargs, code):
+        """Test that errors carry their message, code and extra attributes."""
+        error = error_class("Something failed", **kwargs)
+        
+        assert error.message == "Something failed"
+        assert error.code == code
+        for name, value in kwargs.items():
+            assert getattr(error, name) == value
+    
+    @pytest.mark.parametrize("error_class, kwargs, code", ERROR_CASES)
+    def test_str_equals_message(self, error_class, kwargs, code):
+        """Test that str() of an error is its message."""
+        error = error_class("Something failed", **kwargs)
+        
+        assert str(error) == error.message == "Something failed"
+    
+    @pytest.mark.parametrize("error_class, kwargs, code", ERROR_CASES)
+    def test_inheritance(self, error_class, kwargs, code):
+        """Test that errors are SendlyErrors and Exceptions."""
+        error = error_class("Something failed", **kwargs)
+        
+        assert isinstance(error, error_class)
         assert isinstance(error, SendlyError)
-        assert isinstance(error, ValidationError)
         assert isinstance(error, Exception)
     
-    def test_validation_error_can_be_raised_and_caught(self):
-        """Test that ValidationError can be raised and caught."""
-        with pytest.raises(ValidationError) as exc_info:
-            raise ValidationError("Test validation error")
-        
-        assert exc_info.value.message == "Test validation error"
-        assert exc_info.value.code == "validation_error"
-    
-    def test_validation_error_caught_as_sendly_error(self):
-        """Test that ValidationError can be caught as SendlyError."""
+    @pytest.mark.parametrize("error_class, kwargs, code", ERROR_CASES)
+    def test_caught_as_sendly_error(self, error_class, kwargs, code):
+        """Test that errors can be raised and caught as SendlyError."""
         with pytest.raises(SendlyError) as exc_info:
-            raise ValidationError("Test validation error")
+            raise error_class("Something failed", **kwargs)
         
-        assert isinstance(exc_info.value, ValidationError)
-        assert exc_info.value.message == "Test validation error"
-
-
-class TestAuthenticationError:
-    """Test cases for AuthenticationError."""
-    
-    def test_authentication_error_creation(self):
-        """Test AuthenticationError creation."""
-        error = AuthenticationError("Invalid API key")
-        
-        assert str(error) == "Invalid API key"
-        assert error.message == "Invalid API key"
-        assert error.code == "authentication_error"
-    
-    def test_authentication_error_inheritance(self):
-        """Test AuthenticationError inheritance."""
-        error = AuthenticationError("Auth failed")
-        
-        assert isinstance(error, SendlyError)
-        assert isinstance(error, AuthenticationError)
-        assert isinstance(error, Exception)
-    
-    def test_authentication_error_can_be_raised_and_caught(self):
-        """Test that AuthenticationError can be raised and caught."""
-        with pytest.raises(AuthenticationError) as exc_info:
-            raise AuthenticationError("Invalid credentials")
-        
-        assert exc_info.value.message == "Invalid credentials"
-        assert exc_info.value.code == "authentication_error"
-    
-    def test_authentication_error_caught_as_sendly_error(self):
-        """Test that AuthenticationError can be caught as SendlyError."""
-        with pytest.raises(SendlyError) as exc_info:
-            raise AuthenticationError("Invalid credentials")
-        
-        assert isinstance(exc_info.value, AuthenticationError)
-
-
-class TestRateLimitError:
-    """Test cases for RateLimitError."""
+        assert type(exc_info.value) is error_class
     
     def test_rate_limit_error_without_retry_after(self):
         """Test RateLimitError without retry_after."""
         error = RateLimitError("Rate limit exceeded")
         
-        assert str(error) == "Rate limit exceeded"
-        assert error.message == "Rate limit exceeded"
-        assert error.code == "rate_limit_exceeded"
         assert error.retry_after is None
     
-    def test_rate_limit_error_with_retry_after(self):
-        """Test RateLimitError with retry_after."""
-        error = RateLimitError("Rate limit exceeded", retry_after=30)
-        
-        assert str(error) == "Rate limit exceeded"
-        assert error.message == "Rate limit exceeded"
-        assert error.code == "rate_limit_exceeded"
-        assert error.retry_after == 30
-    
-    def test_rate_limit_error_inheritance(self):
-        """Test RateLimitError inheritance."""
-        error = RateLimitError("Rate limit exceeded")
-        
-        assert isinstance(error, SendlyError)
-        assert isinstance(error, RateLimitError)
-        assert isinstance(error, Exception)
-    
-    def test_rate_limit_error_can_be_raised_and_caught(self):
-        """Test that RateLimitError can be raised and caught."""
-        with pytest.raises(RateLimitError) as exc_info:
-            raise RateLimitError("Too many requests", retry_after=60)
-        
-        assert exc_info.value.message == "Too many requests"
-        assert exc_info.value.code == "rate_limit_exceeded"
-        assert exc_info.value.retry_after == 60
-    
-    def test_rate_limit_error_caught_as_sendly_error(self):
-        """Test that RateLimitError can be caught as SendlyError."""
-        with pytest.raises(SendlyError) as exc_info:
-            raise RateLimitError("Too many requests", retry_after=30)
-        
-        assert isinstance(exc_info.value, RateLimitError)
-        assert exc_info.value.retry_after == 30
-
-
-class TestAPIError:
-    """Test cases for APIError."""
-    
     def test_api_error_minimal(self):
         """Test APIError with minimal parameters."""
         error = APIError("Server error")
         
-        assert str(error) == "Server error"
-        assert error.message == "Server error"
         assert error.code is None
         assert error.status_code is None
     
-    def test_api_error_with_status_code(self):
-        """Test APIError with status code."""
-        error = APIError("Server error", status_code=500)
-        
-        assert str(error) == "Server error"
-        assert error.message == "Server error"
-        assert error.code is None
-        assert error.status_code == 500
-    
-    def test_api_error_with_code(self):
+    def test_api_error_with_code_only(self):
         """Test APIError with error code."""
         error = APIError("Server error", code="internal_server_error")
         
-        assert str(error) == "Server error"
-        assert error.message == "Server error"
         assert error.code == "internal_server_error"
         assert error.status_code is None
-    
-    def test_api_error_with_all_parameters(self):
-        """Test APIError with all parameters."""
-        error = APIError("Server error", status_code=500, code="internal_server_error")
-        
-        assert str(error) == "Server error"
-        assert error.message == "Server error"
-        assert error.code == "internal_server_error"
-        assert error.status_code == 500
-    
-    def test_api_error_inheritance(self):
-        """Test APIError inheritance."""
-        error = APIError("Server error")
-        
-        assert isinstance(error, SendlyError)
-        assert isinstance(error, APIError)
-        assert isinstance(error, Exception)
-    
-    def test_api_error_can_be_raised_and_caught(self):
-        """Test that APIError can be raised and caught."""
-        with pytest.raises(APIError) as exc_info:
-            raise APIError("Bad request", status_code=400, code="bad_request")
-        
-        assert exc_info.value.message == "Bad request"
-        assert exc_info.value.status_code == 400
-        assert exc_info.value.code == "bad_request"
-    
-    def test_api_error_caught_as_sendly_error(self):
-        """Test that APIError can be caught as SendlyError."""
-        with pytest.raises(SendlyError) as exc_info:
-            raise APIError("Bad request", status_code=400)
-        
-        assert isinstance(exc_info.value, APIError)
-        assert exc_info.value.status_code == 400
-
-
-class TestNetworkError:
-    """Test cases for NetworkError."""
-    
-    def test_network_error_creation(self):
-        """Test NetworkError creation."""
-        error = NetworkError("Connection timeout")
-        
-        assert str(error) == "Connection timeout"
-        assert error.message == "Connection timeout"
-        assert error.code == "network_error"
-    
-    def test_network_error_inheritance(self):
-        """Test NetworkError inheritance."""
-        error = NetworkError("Network failed")
-        
-        assert isinstance(error, SendlyError)
-        assert isinstance(error, NetworkError)
-        assert isinstance(error, Exception)
-    
-    def test_network_error_can_be_raised_and_caught(self):
-        """Test that NetworkError can be raised and caught."""
-        with pytest.raises(NetworkError) as exc_info:
-            raise NetworkError("DNS resolution failed")
-        
-        assert exc_info.value.message == "DNS resolution failed"
-        assert exc_info.value.code == "network_error"
-    
-    def test_network_error_caught_as_sendly_error(self):
-        """Test that NetworkError can be caught as SendlyError."""
-        with pytest.raises(SendlyError) as exc_info:
-            raise NetworkError("Connection refused")
-        
-        assert isinstance(exc_info.value, NetworkError)
 
 
 class TestErrorHierarchy:
     """Test cases for error hierarchy behavior."""
     
-    def test_all_errors_inherit_from_sendly_error(self):
-        """Test that all specific errors inherit from SendlyError."""
-        validation_error = ValidationError("Validation failed")
-        auth_error = AuthenticationError("Auth failed")
-        rate_limit_error = RateLimitError("Rate limit exceeded")
-        api_error = APIError("API failed")
-        network_error = NetworkError("Network failed")
-        
-        assert isinstance(validation_error, SendlyError)
-        assert isinstance(auth_error, SendlyError)
-        assert isinstance(rate_limit_error, SendlyError)
-        assert isinstance(api_error, SendlyError)
-        assert isinstance(network_error, SendlyError)
-    
-    def test_can_catch_all_errors_as_sendly_error(self):
-        """Test that all errors can be caught as SendlyError."""
-        errors = [
-            ValidationError("Validation failed"),
-            AuthenticationError("Auth failed"),
-            RateLimitError("Rate limit exceeded"),
-            APIError("API failed"),
-            NetworkError("Network failed"),
-        ]
-        
-        for error in errors:
-            try:
-                raise error
-            except SendlyError as e:
-                assert isinstance(e, SendlyError)
-                assert e.message is not None
-                assert hasattr(e, 'code')
-    
-    def test_error_codes_are_set_correctly(self):
-        """Test that error codes are set correctly for each error type."""
-        validation_error = ValidationError("Validation failed")
-        auth_error = AuthenticationError("Auth failed")
-        rate_limit_error = RateLimitError("Rate limit exceeded")
-        network_error = NetworkError("Network failed")
-        
-        assert validation_error.code == "validation_error"
-        assert auth_error.code == "authentication_error"
-        assert rate_limit_error.code == "rate_limit_exceeded"
-        assert network_error.code == "network_error"
-    
     def test_error_specific_attributes(self):
         """Test error-specific attributes."""
         # RateLimitError has retry_after
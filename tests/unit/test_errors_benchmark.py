@@ -0,0 +1,35 @@
+"""Benchmarks for error construction.
+
+Errors are built on every failed request, so a slow ``__init__`` slows every
+raise site in the SDK. Requires ``pytest-benchmark``; run with
+``make benchmark``.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from sendly.errors import APIError, RateLimitError
+
+# Generous per-error ceiling: construction currently takes well under 1us,
+# so only a real regression (e.g. validation in __init__) trips this
+MAX_SECONDS_PER_ERROR = 10e-6
+BATCH = 1000
+
+
+def _construct_errors():
+    """Build a batch of the errors raised most often."""
+    for _ in range(BATCH):
+        RateLimitError("Rate limit exceeded", retry_after=30)
+        APIError("Server error", status_code=500)
+
+
+class TestErrorConstructionBenchmark:
+    """Benchmarks for building Sendly errors."""
+
+    def test_error_construction(self, benchmark):
+        """Test that building errors stays cheap."""
+        benchmark.pedantic(_construct_errors, rounds=20, iterations=1)
+
+        per_error = benchmark.stats.stats.min / (2 * BATCH)
+        assert per_error < MAX_SECONDS_PER_ERROR
@@ -2,11 +2,17 @@
 
 import json
 import time
-from unittest.mock import Mock, patch, call
+from dataclasses import dataclass, field
+from typing import Dict
+from unittest.mock import Mock, patch
+import httpx
 import pytest
 import requests
 
-from sendly.utils.http_client import HttpClient
+from sendly import Sendly
+from sendly.utils.http_client import HttpClient, _parse_retry_after
+from sendly.utils.httpx_client import HttpxClient
+from sendly.utils.rate_limiter import TokenBucket
 from sendly.errors import (
     APIError,
     AuthenticationError,
@@ -15,20 +21,48 @@ from sendly.errors import (
     ValidationError
 )
 
+API_KEY = 'sl_test_1234567890123456789012345678901234567890'
+BASE_URL = 'https://api.sendly.example.com'
+
+
+@dataclass
+class FakeResponse:
+    """Stand-in for requests.Response with only the fields HttpClient reads."""
+    
+    status_code: int = 200
+    content: bytes = b''
+    headers: Dict[str, str] = field(default_factory=dict)
+    text: str = ''
+    reason: str = ''
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the status is below 400, as in requests."""
+        return self.status_code < 400
+
+
+@pytest.fixture(scope='module')
+def stateless_client():
+    """One client shared by tests that never send through or modify it."""
+    client = HttpClient(BASE_URL, API_KEY)
+    yield client
+    client.close()
+
 
 class TestHttpClient:
     """Test cases for HTTP client."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.api_key = 'sl_test_1234567890123456789012345678901234567890'
-        self.base_url = 'https://api.sendly.example.com'
-        self.client = HttpClient(
-            base_url=self.base_url,
-            api_key=self.api_key,
-            timeout=30.0,
-            max_retries=3
-        )
+    @pytest.fixture
+    def mock_session(self, monkeypatch):
+        """Make clients created in the test send through a Mock session."""
+        session = Mock()
+        monkeypatch.setattr('sendly.utils.http_client.requests.Session', lambda: session)
+        return session
+    
+    @pytest.fixture
+    def mock_sleep(self):
+        """Sleep function to inject into clients so retries don't wait."""
+        return Mock()
     
     def test_client_initialization(self):
         """Test HTTP client initialization."""
@@ -61,21 +95,50 @@ class TestHttpClient:
         assert client.timeout == 30.0
         assert client.max_retries == 3
         assert client.session.headers['User-Agent'] == 'sendly-python/0.1.0'
+
+    def test_connection_pool_configuration(self):
+        """Test that the session mounts a sized connection pool."""
+        client = HttpClient(
+            base_url='https://api.example.com',
+            api_key='test-key',
+            pool_size=8
+        )
+
+        for prefix in ('https://api.example.com', 'http://api.example.com'):
+            adapter = client.session.get_adapter(prefix)
+            assert adapter._pool_connections == 8
+            assert adapter._pool_maxsize == 8
+            assert adapter._pool_block is False
+
+    def test_connection_pool_default_size(self):
+        """Test the default connection pool size."""
+        client = HttpClient(
+            base_url='https://api.example.com',
+            api_key='test-key'
+        )
+
+        adapter = client.session.get_adapter('https://api.example.com')
+        assert adapter._pool_maxsize == 32
+
+    def test_session_keeps_compression_and_keep_alive(self):
+        """Test that our headers don't drop the session's gzip and keep-alive defaults."""
+        client = HttpClient(
+            base_url='https://api.example.com',
+            api_key='test-key'
+        )
+
+        assert 'gzip' in client.session.headers['Accept-Encoding']
+        assert client.session.headers['Connection'] == 'keep-alive'
     
-    @patch('sendly.utils.http_client.requests.Session')
-    def test_successful_post_request(self, mock_session_class):
+    def test_successful_post_request(self, mock_session):
         """Test successful POST request."""
         # Mock response
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {'status': 'success', 'id': '123'}
+        mock_response = FakeResponse(content=json.dumps({'status': 'success', 'id': '123'}).encode())
         
-        mock_session = Mock()
         mock_session.request.return_value = mock_response
-        mock_session_class.return_value = mock_session
         
         # Create client (will use mocked session)
-        client = HttpClient(self.base_url, self.api_key)
+        client = HttpClient(BASE_URL, API_KEY)
         
         # Make request
         result = client.post('/v1/send', {'to': '+14155552671', 'text': 'Hello'})
@@ -84,7 +147,7 @@ class TestHttpClient:
         mock_session.request.assert_called_once_with(
             method='POST',
             url='https://api.sendly.example.com/v1/send',
-            json={'to': '+14155552671', 'text': 'Hello'},
+            data=b'{"to":"+14155552671","text":"Hello"}',
             params=None,
             timeout=30.0
         )
@@ -92,20 +155,15 @@ class TestHttpClient:
         # Verify response
         assert result == {'status': 'success', 'id': '123'}
     
-    @patch('sendly.utils.http_client.requests.Session')
-    def test_successful_get_request(self, mock_session_class):
+    def test_successful_get_request(self, mock_session):
         """Test successful GET request."""
         # Mock response
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {'data': 'test'}
+        mock_response = FakeResponse(content=json.dumps({'data': 'test'}).encode())
         
-        mock_session = Mock()
         mock_session.request.return_value = mock_response
-        mock_session_class.return_value = mock_session
         
         # Create client
-        client = HttpClient(self.base_url, self.api_key)
+        client = HttpClient(BASE_URL, API_KEY)
         
         # Make request
         result = client.get('/v1/status', {'filter': 'active'})
@@ -114,7 +172,7 @@ class TestHttpClient:
         mock_session.request.assert_called_once_with(
             method='GET',
             url='https://api.sendly.example.com/v1/status',
-            json=None,
+            data=None,
             params={'filter': 'active'},
             timeout=30.0
         )
@@ -122,88 +180,81 @@ class TestHttpClient:
         # Verify response
         assert result == {'data': 'test'}
     
-    @patch('sendly.utils.http_client.requests.Session')
-    def test_invalid_json_response(self, mock_session_class):
+    def test_invalid_json_response(self, mock_session):
         """Test handling of invalid JSON response."""
         # Mock response
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.side_effect = ValueError('Invalid JSON')
+        mock_response = FakeResponse(content=b'Invalid JSON')
         
-        mock_session = Mock()
         mock_session.request.return_value = mock_response
-        mock_session_class.return_value = mock_session
         
-        client = HttpClient(self.base_url, self.api_key)
+        client = HttpClient(BASE_URL, API_KEY)
         
         with pytest.raises(APIError, match='Invalid JSON in response'):
             client.post('/v1/send', {})
     
-    @patch('sendly.utils.http_client.requests.Session')
-    def test_validation_error_400(self, mock_session_class):
-        """Test 400 validation error handling."""
-        # Mock error response
-        mock_response = Mock()
-        mock_response.ok = False
-        mock_response.status_code = 400
-        mock_response.json.return_value = {
-            'error': 'validation_error',
-            'message': 'Invalid phone number format'
-        }
-        
-        mock_session = Mock()
+    @pytest.mark.parametrize('status, error, message, exc, attributes', [
+        (400, 'validation_error', 'Invalid phone number format', ValidationError, {}),
+        (401, 'authentication_error', 'Invalid API key', AuthenticationError, {}),
+        (404, 'not_found', 'Resource not found', APIError, {'status_code': 404}),
+    ])
+    def test_client_error_mapping(self, mock_session, status, error, message, exc, attributes):
+        """Test that 4xx responses raise their error without retrying."""
+        mock_response = FakeResponse(
+            status_code=status,
+            content=json.dumps({'error': error, 'message': message}).encode()
+        )
+        
         mock_session.request.return_value = mock_response
-        mock_session_class.return_value = mock_session
         
-        client = HttpClient(self.base_url, self.api_key)
+        client = HttpClient(BASE_URL, API_KEY)
         
-        with pytest.raises(ValidationError, match='Invalid phone number format'):
+        with pytest.raises(exc) as exc_info:
             client.post('/v1/send', {})
-    
-    @patch('sendly.utils.http_client.requests.Session')
-    def test_authentication_error_401(self, mock_session_class):
-        """Test 401 authentication error handling."""
-        # Mock error response
-        mock_response = Mock()
-        mock_response.ok = False
-        mock_response.status_code = 401
-        mock_response.json.return_value = {
-            'error': 'authentication_error',
-            'message': 'Invalid API key'
-        }
-        
-        mock_session = Mock()
-        mock_session.request.return_value = mock_response
-        mock_session_class.return_value = mock_session
         
-        client = HttpClient(self.base_url, self.api_key)
+        assert type(exc_info.value) is exc
+        assert exc_info.value.message == message
+        assert exc_info.value.code == error
+        for name, value in attributes.items():
+            assert getattr(exc_info.value, name) == value
         
-        with pytest.raises(AuthenticationError, match='Invalid API key'):
-            client.post('/v1/send', {})
+        # Verify no retries for non-retryable errors
+        assert mock_session.request.call_count == 1
     
-    @patch('sendly.utils.http_client.requests.Session')
-    @patch('sendly.utils.http_client.time.sleep')
-    def test_rate_limit_error_429_retry(self, mock_sleep, mock_session_class):
+    @patch('sendly.utils.http_client._parse_retry_after')
+    def test_client_error_skips_retry_hints(self, mock_parse, mock_session):
+        """Test that non-retryable errors don't look for Retry-After."""
+        mock_response = FakeResponse(
+            status_code=400,
+            content=b'{"error": "validation_error", "message": "Bad request"}',
+            headers={'Retry-After': '5'}
+        )
+        mock_session.request.return_value = mock_response
+
+        client = HttpClient(BASE_URL, API_KEY)
+
+        with pytest.raises(ValidationError, match='Bad request'):
+            client.post('/v1/send', {})
+
+        mock_parse.assert_not_called()
+        assert mock_session.request.call_count == 1
+
+    def test_rate_limit_error_429_retry(self, mock_session, mock_sleep):
         """Test 429 rate limit error with retry."""
         # Mock rate limit response followed by success
-        rate_limit_response = Mock()
-        rate_limit_response.ok = False
-        rate_limit_response.status_code = 429
-        rate_limit_response.json.return_value = {
-            'error': 'rate_limit_exceeded',
-            'message': 'Rate limit exceeded',
-            'retry_after': 2
-        }
-        
-        success_response = Mock()
-        success_response.ok = True
-        success_response.json.return_value = {'status': 'success'}
-        
-        mock_session = Mock()
+        rate_limit_response = FakeResponse(
+            status_code=429,
+            content=json.dumps({
+                'error': 'rate_limit_exceeded',
+                'message': 'Rate limit exceeded',
+                'retry_after': 2
+            }).encode()
+        )
+        
+        success_response = FakeResponse(content=json.dumps({'status': 'success'}).encode())
+        
         mock_session.request.side_effect = [rate_limit_response, success_response]
-        mock_session_class.return_value = mock_session
         
-        client = HttpClient(self.base_url, self.api_key, max_retries=1)
+        client = HttpClient(BASE_URL, API_KEY, max_retries=1, sleep=mock_sleep)
         
         # Should succeed after retry
         result = client.post('/v1/send', {})
@@ -217,24 +268,20 @@ class TestHttpClient:
         # Verify final result
         assert result == {'status': 'success'}
     
-    @patch('sendly.utils.http_client.requests.Session')
-    @patch('sendly.utils.http_client.time.sleep')
-    def test_rate_limit_error_429_max_retries(self, mock_sleep, mock_session_class):
+    def test_rate_limit_error_429_max_retries(self, mock_session, mock_sleep):
         """Test 429 rate limit error exceeding max retries."""
         # Mock rate limit response
-        rate_limit_response = Mock()
-        rate_limit_response.ok = False
-        rate_limit_response.status_code = 429
-        rate_limit_response.json.return_value = {
-            'error': 'rate_limit_exceeded',
-            'message': 'Rate limit exceeded'
-        }
-        
-        mock_session = Mock()
+        rate_limit_response = FakeResponse(
+            status_code=429,
+            content=json.dumps({
+                'error': 'rate_limit_exceeded',
+                'message': 'Rate limit exceeded'
+            }).encode()
+        )
+        
         mock_session.request.return_value = rate_limit_response
-        mock_session_class.return_value = mock_session
         
-        client = HttpClient(self.base_url, self.api_key, max_retries=2)
+        client = HttpClient(BASE_URL, API_KEY, max_retries=2, sleep=mock_sleep)
         
         with pytest.raises(RateLimitError, match='Rate limit exceeded'):
             client.post('/v1/send', {})
@@ -243,83 +290,105 @@ class TestHttpClient:
         assert mock_session.request.call_count == 3  # Initial + 2 retries
         assert mock_sleep.call_count == 2
     
-    @patch('sendly.utils.http_client.requests.Session')
-    @patch('sendly.utils.http_client.time.sleep')
-    def test_server_error_500_retry(self, mock_sleep, mock_session_class):
+    def test_rate_limiter_paces_requests(self, mock_session, mock_sleep):
+        """Test that each request takes a token before it is sent."""
+        mock_session.request.return_value = FakeResponse(content=b'{}')
+
+        bucket = Mock(spec=TokenBucket)
+        bucket.reserve.side_effect = [0.0, 0.25]
+        client = HttpClient(BASE_URL, API_KEY, rate_limiter=bucket, sleep=mock_sleep)
+
+        client.post('/v1/send', {})
+        client.post('/v1/send', {})
+
+        assert bucket.reserve.call_count == 2
+        mock_sleep.assert_called_once_with(0.25)
+
+    def test_rate_limit_error_backs_off_rate_limiter(self, mock_session, mock_sleep):
+        """Test that a 429 slows the shared token bucket down."""
+        rate_limit_response = FakeResponse(
+            status_code=429,
+            content=json.dumps({
+                'error': 'rate_limit_exceeded',
+                'retry_after': 3
+            }).encode()
+        )
+
+        mock_session.request.side_effect = [
+            rate_limit_response,
+            FakeResponse(content=b'{}')
+        ]
+
+        bucket = Mock(spec=TokenBucket)
+        bucket.reserve.return_value = 0.0
+        client = HttpClient(BASE_URL, API_KEY, rate_limiter=bucket, sleep=mock_sleep)
+
+        client.post('/v1/send', {})
+
+        bucket.backoff.assert_called_once_with(3.0)
+        assert bucket.reserve.call_count == 2
+
+    def test_server_error_500_retry(self, mock_session, mock_sleep):
         """Test 500 server error with retry."""
         # Mock server error response followed by success
-        server_error_response = Mock()
-        server_error_response.ok = False
-        server_error_response.status_code = 500
-        server_error_response.json.return_value = {
-            'error': 'internal_server_error',
-            'message': 'Internal server error'
-        }
-        
-        success_response = Mock()
-        success_response.ok = True
-        success_response.json.return_value = {'status': 'success'}
-        
-        mock_session = Mock()
+        server_error_response = FakeResponse(
+            status_code=500,
+            content=json.dumps({
+                'error': 'internal_server_error',
+                'message': 'Internal server error'
+            }).encode()
+        )
+        
+        success_response = FakeResponse(content=json.dumps({'status': 'success'}).encode())
+        
         mock_session.request.side_effect = [server_error_response, success_response]
-        mock_session_class.return_value = mock_session
         
-        client = HttpClient(self.base_url, self.api_key, max_retries=1)
+        client = HttpClient(BASE_URL, API_KEY, max_retries=1, sleep=mock_sleep)
         
         # Should succeed after retry
         result = client.post('/v1/send', {})
         
-        # Verify exponential backoff delay
-        mock_sleep.assert_called_once_with(1.0)  # 2^0 * 1.0
+        # Verify exponential backoff delay: 2^0 * 1.0 with jitter
+        mock_sleep.assert_called_once()
+        assert 0.5 <= mock_sleep.call_args[0][0] <= 1.0
         
         # Verify result
         assert result == {'status': 'success'}
     
-    @patch('sendly.utils.http_client.requests.Session')
-    def test_api_error_non_retryable(self, mock_session_class):
-        """Test non-retryable API error."""
-        # Mock 404 error response
-        error_response = Mock()
-        error_response.ok = False
-        error_response.status_code = 404
-        error_response.json.return_value = {
-            'error': 'not_found',
-            'message': 'Resource not found'
-        }
-        
-        mock_session = Mock()
-        mock_session.request.return_value = error_response
-        mock_session_class.return_value = mock_session
-        
-        client = HttpClient(self.base_url, self.api_key)
-        
-        with pytest.raises(APIError) as exc_info:
+    def test_server_error_without_retries(self, mock_session, mock_sleep):
+        """Test that max_retries=0 surfaces the real error immediately."""
+        server_error_response = FakeResponse(
+            status_code=503,
+            content=json.dumps({
+                'error': 'service_unavailable',
+                'message': 'Service unavailable'
+            }).encode()
+        )
+
+        mock_session.request.return_value = server_error_response
+
+        client = HttpClient(BASE_URL, API_KEY, max_retries=0, sleep=mock_sleep)
+
+        with pytest.raises(APIError, match='Service unavailable') as exc_info:
             client.post('/v1/send', {})
-        
-        # Verify error details
-        assert exc_info.value.message == 'Resource not found'
-        assert exc_info.value.status_code == 404
-        assert exc_info.value.code == 'not_found'
-        
-        # Verify no retries for non-retryable error
+
+        assert exc_info.value.status_code == 503
         assert mock_session.request.call_count == 1
-    
-    @patch('sendly.utils.http_client.requests.Session')
-    def test_api_error_invalid_json_response(self, mock_session_class):
+        mock_sleep.assert_not_called()
+
+    def test_api_error_invalid_json_response(self, mock_session):
         """Test API error with invalid JSON response."""
         # Mock error response with invalid JSON
-        error_response = Mock()
-        error_response.ok = False
-        error_response.status_code = 500
-        error_response.json.side_effect = ValueError('Invalid JSON')
-        error_response.text = 'Internal Server Error'
-        error_response.reason = 'Internal Server Error'
-        
-        mock_session = Mock()
+        error_response = FakeResponse(
+            status_code=500,
+            content=b'Invalid JSON',
+            text='Internal Server Error',
+            reason='Internal Server Error'
+        )
+        
         mock_session.request.return_value = error_response
-        mock_session_class.return_value = mock_session
         
-        client = HttpClient(self.base_url, self.api_key, max_retries=0)  # No retries
+        client = HttpClient(BASE_URL, API_KEY, max_retries=0)  # No retries
         
         with pytest.raises(APIError) as exc_info:
             client.post('/v1/send', {})
@@ -328,35 +397,28 @@ class TestHttpClient:
         assert 'Internal Server Error' in exc_info.value.message
         assert exc_info.value.status_code == 500
     
-    @patch('sendly.utils.http_client.requests.Session')
-    @patch('sendly.utils.http_client.time.sleep')
-    def test_timeout_error_retry(self, mock_sleep, mock_session_class):
+    def test_timeout_error_retry(self, mock_session, mock_sleep):
         """Test timeout error with retry."""
-        mock_session = Mock()
         mock_session.request.side_effect = [
             requests.exceptions.Timeout(),
-            Mock(ok=True, json=lambda: {'status': 'success'})
+            FakeResponse(content=b'{"status": "success"}')
         ]
-        mock_session_class.return_value = mock_session
         
-        client = HttpClient(self.base_url, self.api_key, max_retries=1)
+        client = HttpClient(BASE_URL, API_KEY, max_retries=1, sleep=mock_sleep)
         
         # Should succeed after retry
         result = client.post('/v1/send', {})
         
         # Verify retry with exponential backoff
-        mock_sleep.assert_called_once_with(1.0)
+        mock_sleep.assert_called_once()
+        assert 0.5 <= mock_sleep.call_args[0][0] <= 1.0
         assert result == {'status': 'success'}
     
-    @patch('sendly.utils.http_client.requests.Session')
-    @patch('sendly.utils.http_client.time.sleep')
-    def test_timeout_error_max_retries(self, mock_sleep, mock_session_class):
+    def test_timeout_error_max_retries(self, mock_session, mock_sleep):
         """Test timeout error exceeding max retries."""
-        mock_session = Mock()
         mock_session.request.side_effect = requests.exceptions.Timeout()
-        mock_session_class.return_value = mock_session
         
-        client = HttpClient(self.base_url, self.api_key, max_retries=2)
+        client = HttpClient(BASE_URL, API_KEY, max_retries=2, sleep=mock_sleep)
         
         with pytest.raises(NetworkError, match='Request timed out'):
             client.post('/v1/send', {})
@@ -365,173 +427,316 @@ class TestHttpClient:
         assert mock_session.request.call_count == 3
         assert mock_sleep.call_count == 2
     
-    @patch('sendly.utils.http_client.requests.Session')
-    @patch('sendly.utils.http_client.time.sleep')
-    def test_connection_error_retry(self, mock_sleep, mock_session_class):
+    def test_connection_error_retry(self, mock_session, mock_sleep):
         """Test connection error with retry."""
-        mock_session = Mock()
         mock_session.request.side_effect = [
             requests.exceptions.ConnectionError(),
-            Mock(ok=True, json=lambda: {'status': 'success'})
+            FakeResponse(content=b'{"status": "success"}')
         ]
-        mock_session_class.return_value = mock_session
         
-        client = HttpClient(self.base_url, self.api_key, max_retries=1)
+        client = HttpClient(BASE_URL, API_KEY, max_retries=1, sleep=mock_sleep)
         
         # Should succeed after retry
         result = client.post('/v1/send', {})
         
         # Verify retry
-        mock_sleep.assert_called_once_with(1.0)
+        mock_sleep.assert_called_once()
+        assert 0.5 <= mock_sleep.call_args[0][0] <= 1.0
         assert result == {'status': 'success'}
     
-    @patch('sendly.utils.http_client.requests.Session')
-    def test_connection_error_max_retries(self, mock_session_class):
+    def test_connection_error_max_retries(self, mock_session, mock_sleep):
         """Test connection error exceeding max retries."""
-        mock_session = Mock()
         mock_session.request.side_effect = requests.exceptions.ConnectionError()
-        mock_session_class.return_value = mock_session
         
-        client = HttpClient(self.base_url, self.api_key, max_retries=1)
+        client = HttpClient(BASE_URL, API_KEY, max_retries=1, sleep=mock_sleep)
         
         with pytest.raises(NetworkError, match='Connection error'):
             client.post('/v1/send', {})
     
-    @patch('sendly.utils.http_client.requests.Session')
-    def test_generic_request_exception(self, mock_session_class):
+    def test_generic_request_exception(self, mock_session):
         """Test generic request exception."""
-        mock_session = Mock()
         mock_session.request.side_effect = requests.exceptions.RequestException('Network failure')
-        mock_session_class.return_value = mock_session
         
-        client = HttpClient(self.base_url, self.api_key)
+        client = HttpClient(BASE_URL, API_KEY)
         
         with pytest.raises(NetworkError, match='Request failed: Network failure'):
             client.post('/v1/send', {})
     
-    def test_calculate_delay_exponential_backoff(self):
+    def test_calculate_delay_exponential_backoff(self, stateless_client):
         """Test exponential backoff delay calculation."""
-        client = HttpClient(self.base_url, self.api_key)
-        
-        # Test exponential backoff: 1s, 2s, 4s
+        # Test exponential backoff: 1s, 2s, 4s, 8s, 16s with equal jitter
+        for attempt, delay in enumerate([1.0, 2.0, 4.0, 8.0, 16.0]):
+            for _ in range(20):
+                assert delay * 0.5 <= stateless_client._calculate_delay(attempt) <= delay
+
+    def test_calculate_delay_jitter_varies(self, stateless_client):
+        """Test that backoff delays are randomized."""
+        delays = {stateless_client._calculate_delay(2) for _ in range(20)}
+
+        assert len(delays) > 1
+
+    def test_calculate_delay_without_jitter(self):
+        """Test that disabling jitter gives the plain exponential sequence."""
+        client = HttpClient(BASE_URL, API_KEY)
+        client.jitter = 0.0
+
         assert client._calculate_delay(0) == 1.0
         assert client._calculate_delay(1) == 2.0
         assert client._calculate_delay(2) == 4.0
         assert client._calculate_delay(3) == 8.0
     
-    def test_calculate_delay_with_retry_after(self):
+    def test_calculate_delay_with_retry_after(self, stateless_client):
         """Test delay calculation with server-provided retry_after."""
-        client = HttpClient(self.base_url, self.api_key)
-        
         # Should use server-provided value
-        assert client._calculate_delay(0, retry_after=5) == 5.0
-        assert client._calculate_delay(2, retry_after=10) == 10.0
+        assert stateless_client._calculate_delay(0, retry_after=5) == 5.0
+        assert stateless_client._calculate_delay(2, retry_after=10) == 10.0
+
+    def test_calculate_delay_retry_after_is_a_minimum(self, stateless_client):
+        """Test that a short server hint doesn't undercut the backoff."""
+        for _ in range(20):
+            assert 4.0 <= stateless_client._calculate_delay(3, retry_after=1) <= 8.0
+
+    @pytest.mark.parametrize('value, expected', [
+        ('3', 3),
+        ('0', 0),
+        ('-5', 0),
+        ('Wed, 21 Oct 2015 07:28:00 GMT', 0),  # In the past
+        ('soon', None),
+        (None, None),
+    ])
+    def test_parse_retry_after(self, value, expected):
+        """Test parsing Retry-After delay-seconds and HTTP-dates."""
+        assert _parse_retry_after(value) == expected
+
+    def test_calculate_delay_capped_at_max_delay(self, stateless_client):
+        """Test that backoff never exceeds max_delay."""
+        for _ in range(20):
+            assert 15.0 <= stateless_client._calculate_delay(10) <= 30.0
+
+    def test_calculate_delay_caps_retry_after(self, stateless_client):
+        """Test that server-provided retry_after is capped at max_delay."""
+        assert stateless_client._calculate_delay(0, retry_after=3600) == 30.0
     
-    def test_is_retryable_error(self):
+    def test_is_retryable_error(self, stateless_client):
         """Test retryable error detection."""
-        client = HttpClient(self.base_url, self.api_key)
-        
         # Retryable errors
-        assert client._is_retryable_error(429) is True  # Rate limit
-        assert client._is_retryable_error(500) is True  # Server error
-        assert client._is_retryable_error(502) is True  # Bad gateway
-        assert client._is_retryable_error(503) is True  # Service unavailable
-        assert client._is_retryable_error(504) is True  # Gateway timeout
+        assert stateless_client._is_retryable_error(408) is True  # Request timeout
+        assert stateless_client._is_retryable_error(429) is True  # Rate limit
+        assert stateless_client._is_retryable_error(500) is True  # Server error
+        assert stateless_client._is_retryable_error(502) is True  # Bad gateway
+        assert stateless_client._is_retryable_error(503) is True  # Service unavailable
+        assert stateless_client._is_retryable_error(504) is True  # Gateway timeout
         
         # Non-retryable errors
-        assert client._is_retryable_error(400) is False  # Bad request
-        assert client._is_retryable_error(401) is False  # Unauthorized
-        assert client._is_retryable_error(403) is False  # Forbidden
-        assert client._is_retryable_error(404) is False  # Not found
+        assert stateless_client._is_retryable_error(400) is False  # Bad request
+        assert stateless_client._is_retryable_error(401) is False  # Unauthorized
+        assert stateless_client._is_retryable_error(403) is False  # Forbidden
+        assert stateless_client._is_retryable_error(404) is False  # Not found
+        assert stateless_client._is_retryable_error(501) is False  # Not implemented
+        assert stateless_client._is_retryable_error(505) is False  # HTTP version not supported
     
-    def test_serialize_params_basic(self):
-        """Test basic parameter serialization."""
-        client = HttpClient(self.base_url, self.api_key)
-        
-        params = {
-            'string_param': 'value',
-            'int_param': 123,
-            'bool_param': True,
-            'none_param': None
-        }
-        
-        result = client._serialize_params(params)
-        
-        expected = {
-            'string_param': 'value',
-            'int_param': '123',
-            'bool_param': 'True'
+    @pytest.mark.parametrize('params, expected', [
+        pytest.param(
+            {
+                'string_param': 'value',
+                'int_param': 123,
+                'bool_param': True,
+                'none_param': None
+            },
             # none_param should be excluded
-        }
-        assert result == expected
-    
-    def test_serialize_params_arrays(self):
-        """Test array parameter serialization."""
-        client = HttpClient(self.base_url, self.api_key)
-        
-        params = {
-            'tags': ['tag1', 'tag2', 'tag3'],
-            'numbers': [1, 2, 3],
-            'empty_array': [],
-            'single_item': ['item']
-        }
-        
-        result = client._serialize_params(params)
-        
-        expected = {
-            'tags': ['tag1', 'tag2', 'tag3'],
-            'numbers': [1, 2, 3],
-            'empty_array': [],
-            'single_item': ['item']
-        }
-        assert result == expected
+            {'string_param': 'value', 'int_param': '123', 'bool_param': 'True'},
+            id='scalars'
+        ),
+        pytest.param(
+            {
+                'tags': ['tag1', 'tag2', 'tag3'],
+                'numbers': [1, 2, 3],
+                'empty_array': [],
+                'single_item': ['item']
+            },
+            {
+                'tags': ['tag1', 'tag2', 'tag3'],
+                'numbers': [1, 2, 3],
+                'empty_array': [],
+                'single_item': ['item']
+            },
+            id='arrays'
+        ),
+    ])
+    def test_serialize_params(self, stateless_client, params, expected):
+        """Test query parameter serialization."""
+        assert stateless_client._serialize_params(params) == expected
     
-    def test_context_manager(self):
+    def test_serialize_params_all_strings_not_copied(self, stateless_client):
+        """Test that string-only params are passed through unchanged."""
+        params = {'status': 'delivered', 'page': '2'}
+
+        assert stateless_client._serialize_params(params) is params
+
+    def test_context_manager(self, mock_session):
         """Test HTTP client as context manager."""
-        with patch('sendly.utils.http_client.requests.Session') as mock_session_class:
-            mock_session = Mock()
-            mock_session_class.return_value = mock_session
-            
-            with HttpClient(self.base_url, self.api_key) as client:
-                assert client is not None
-            
-            # Session should be closed after context exit
-            mock_session.close.assert_called_once()
+        with HttpClient(BASE_URL, API_KEY) as client:
+            assert client is not None
+        
+        # Session should be closed after context exit
+        mock_session.close.assert_called_once()
     
-    def test_manual_close(self):
+    def test_manual_close(self, mock_session):
         """Test manual client closure."""
-        with patch('sendly.utils.http_client.requests.Session') as mock_session_class:
-            mock_session = Mock()
-            mock_session_class.return_value = mock_session
-            
-            client = HttpClient(self.base_url, self.api_key)
-            client.close()
-            
-            # Session should be closed
-            mock_session.close.assert_called_once()
+        client = HttpClient(BASE_URL, API_KEY)
+        client.close()
+        
+        # Session should be closed
+        mock_session.close.assert_called_once()
     
-    @patch('sendly.utils.http_client.requests.Session')
-    @patch('sendly.utils.http_client.time.sleep')
-    def test_exponential_backoff_sequence(self, mock_sleep, mock_session_class):
+    def test_post_batched_coalesces_requests(self, mock_session):
+        """Test that batched posts are sent as one bulk request."""
+        bulk_response = FakeResponse(
+            content=json.dumps({
+                'messages': [{'id': 'msg_1'}, {'id': 'msg_2'}]
+            }).encode()
+        )
+
+        mock_session.request.return_value = bulk_response
+
+        client = HttpClient(BASE_URL, API_KEY)
+        first = client.post_batched('/v1/send', {'to': '+14155552671'}, max_wait_ms=200)
+        second = client.post_batched('/v1/send', {'to': '+14155552672'}, max_wait_ms=200)
+
+        assert first.result(timeout=5) == {'id': 'msg_1'}
+        assert second.result(timeout=5) == {'id': 'msg_2'}
+        mock_session.request.assert_called_once_with(
+            method='POST',
+            url=f'{BASE_URL}/v1/send/bulk',
+            data=b'{"messages":[{"to":"+14155552671"},{"to":"+14155552672"}]}',
+            params=None,
+            timeout=30.0
+        )
+        client.close()
+
+    def test_close_flushes_batched_requests(self, mock_session):
+        """Test that close() sends queued batched posts first."""
+        response = FakeResponse(content=json.dumps({'id': 'msg_1'}).encode())
+
+        mock_session.request.return_value = response
+
+        client = HttpClient(BASE_URL, API_KEY)
+        future = client.post_batched('/v1/send', {'to': '+14155552671'}, max_wait_ms=10000)
+        client.close()
+
+        assert future.result(timeout=0) == {'id': 'msg_1'}
+        mock_session.close.assert_called_once()
+
+    def test_exponential_backoff_sequence(self, mock_session, mock_sleep):
         """Test the full exponential backoff sequence."""
         # Mock multiple failures followed by success
-        mock_session = Mock()
         mock_session.request.side_effect = [
             requests.exceptions.Timeout(),  # Attempt 0
             requests.exceptions.Timeout(),  # Attempt 1 
             requests.exceptions.Timeout(),  # Attempt 2
-            Mock(ok=True, json=lambda: {'status': 'success'})  # Attempt 3
+            FakeResponse(content=b'{"status": "success"}')  # Attempt 3
         ]
-        mock_session_class.return_value = mock_session
         
-        client = HttpClient(self.base_url, self.api_key, max_retries=3)
+        client = HttpClient(BASE_URL, API_KEY, max_retries=3, sleep=mock_sleep)
         
         result = client.post('/v1/send', {})
         
-        # Verify exponential backoff delays: 1s, 2s, 4s
-        expected_delays = [call(1.0), call(2.0), call(4.0)]
-        mock_sleep.assert_has_calls(expected_delays)
+        # Verify exponential backoff delays: 1s, 2s, 4s with jitter
+        delays = [args[0] for args, _ in mock_sleep.call_args_list]
+        assert len(delays) == 3
+        for delay, expected in zip(delays, [1.0, 2.0, 4.0]):
+            assert expected * 0.5 <= delay <= expected
         
         # Verify success after retries
         assert result == {'status': 'success'}
-        assert mock_session.request.call_count == 4
\ No newline at end of file
+        assert mock_session.request.call_count == 4
+
+    def test_injected_sleep(self, mock_session, mock_sleep, monkeypatch):
+        """Test that retry waits go through the injected sleep function."""
+        mock_session.request.side_effect = [
+            requests.exceptions.Timeout(),
+            FakeResponse(content=b'{"status": "success"}')
+        ]
+        time_sleep = Mock()
+        monkeypatch.setattr('sendly.utils.http_client.time.sleep', time_sleep)
+
+        client = HttpClient(BASE_URL, API_KEY, sleep=mock_sleep)
+
+        assert client.post('/v1/send', {}) == {'status': 'success'}
+
+        mock_sleep.assert_called_once()
+        assert 0.5 <= mock_sleep.call_args[0][0] <= 1.0
+        time_sleep.assert_not_called()
+
+
+class TestHttpxClient:
+    """Test cases for the httpx-backed HttpxClient."""
+
+    def make_client(self, handler, **kwargs):
+        """Build an HttpxClient whose requests go to ``handler``."""
+        client = HttpxClient(BASE_URL, API_KEY, **kwargs)
+        client.client = httpx.Client(transport=httpx.MockTransport(handler))
+        return client
+
+    def test_successful_post_request(self):
+        """Test that POST bodies and headers reach the server."""
+        def handler(request):
+            assert request.url == f'{BASE_URL}/v1/send'
+            assert json.loads(request.content) == {'to': '+14155552671'}
+            return httpx.Response(200, json={'id': 'msg_1'})
+
+        client = self.make_client(handler)
+
+        assert client.post('/v1/send', {'to': '+14155552671'}) == {'id': 'msg_1'}
+
+    def test_headers_and_http2_flag(self):
+        """Test that the httpx client is configured like the requests session."""
+        with patch('sendly.utils.httpx_client.httpx.Client') as mock_client:
+            HttpxClient(BASE_URL, API_KEY, user_agent='agent/1.0', http2=True)
+
+        kwargs = mock_client.call_args.kwargs
+        assert kwargs['http2'] is True
+        assert kwargs['headers']['Authorization'] == f'Bearer {API_KEY}'
+        assert kwargs['headers']['User-Agent'] == 'agent/1.0'
+
+    def test_retries_server_errors(self):
+        """Test that retryable statuses are retried like HttpClient does."""
+        statuses = iter([503, 200])
+
+        def handler(request):
+            status = next(statuses)
+            return httpx.Response(status, json={'id': 'msg_1'} if status == 200 else {})
+
+        sleep = Mock()
+        client = self.make_client(handler, sleep=sleep)
+
+        assert client.post('/v1/send', {}) == {'id': 'msg_1'}
+        assert sleep.call_count == 1
+
+    def test_error_mapping(self):
+        """Test that error responses map to Sendly exceptions."""
+        def handler(request):
+            return httpx.Response(400, json={'message': 'Bad number'})
+
+        client = self.make_client(handler)
+
+        with pytest.raises(ValidationError, match='Bad number'):
+            client.post('/v1/send', {})
+
+    def test_connection_error(self):
+        """Test that connection failures become NetworkError after retries."""
+        def handler(request):
+            raise httpx.ConnectError('refused')
+
+        client = self.make_client(handler, max_retries=1, sleep=Mock())
+
+        with pytest.raises(NetworkError, match='Connection error'):
+            client.post('/v1/send', {})
+
+    def test_sendly_http2_uses_httpx_client(self):
+        """Test that Sendly(http2=True) sends sync requests through httpx."""
+        with patch('sendly.utils.httpx_client.httpx.Client'):
+            client = Sendly(API_KEY, http2=True)
+
+        assert isinstance(client._http_client, HttpxClient)
+        assert client._http_client.http2 is True
@@ -0,0 +1,196 @@
+"""Tests for the in-process local transport."""
+
+import asyncio
+import os
+from unittest.mock import patch
+
+import pytest
+
+from sendly import AsyncSendly, Sendly, MAGIC_NUMBERS
+from sendly.errors import APIError, RateLimitError, ValidationError
+from sendly.types import SMSRequest
+from sendly.utils.http_client import HttpClient
+from sendly.utils.local_transport import AsyncLocalTransport, LocalTransport
+
+TEST_KEY = 'sl_test_1234567890123456789012345678901234567890'
+LIVE_KEY = 'sl_live_1234567890123456789012345678901234567890'
+
+
+class TestLocalTransport:
+    """Test cases for LocalTransport."""
+
+    def setup_method(self):
+        """Set up a client using the local transport."""
+        self.client = Sendly(TEST_KEY, transport='local')
+
+    def test_success_number_is_queued(self):
+        """Test that a success number gets a canned queued response."""
+        response = self.client.sms.send(
+            to=MAGIC_NUMBERS['success']['instant'],
+            text='Hello',
+            tags=['local']
+        )
+
+        assert response.id.startswith('msg_local_')
+        assert response.status == 'queued'
+        assert response.text == 'Hello'
+        assert response.tags == ['local']
+        assert response.cost.amount == 0.0
+
+    def test_message_ids_are_unique(self):
+        """Test that each send gets its own message ID."""
+        ids = {self.client.sms.send(to='+14155552671', text='Hi').id for _ in range(3)}
+
+        assert len(ids) == 3
+
+    def test_carrier_numbers_report_carrier(self):
+        """Test that carrier simulations report their carrier."""
+        response = self.client.sms.send(to=MAGIC_NUMBERS['carriers']['tmobile'], text='Hi')
+
+        assert response.carrier == 'tmobile'
+
+    @pytest.mark.parametrize('name, error', [
+        ('invalid_number', ValidationError),
+        ('carrier_rejection', ValidationError),
+        ('rate_limit', RateLimitError),
+        ('timeout', APIError),
+        ('insufficient_balance', APIError),
+    ])
+    def test_error_numbers_raise(self, name, error):
+        """Test that error numbers raise the error the API would."""
+        with pytest.raises(error):
+            self.client.sms.send(to=MAGIC_NUMBERS['errors'][name], text='Hi')
+
+    def test_error_status_code(self):
+        """Test that API errors carry the simulated status and code."""
+        with pytest.raises(APIError) as exc_info:
+            self.client.sms.send(
+                to=MAGIC_NUMBERS['errors']['insufficient_balance'],
+                text='Hi'
+            )
+
+        assert exc_info.value.status_code == 402
+        assert exc_info.value.code == 'insufficient_balance'
+
+    def test_send_many(self):
+        """Test that bulk sends are answered in order."""
+        responses = self.client.sms.send_many([
+            SMSRequest(to='+14155552671', text='One'),
+            SMSRequest(to='+14155552672', text='Two'),
+        ])
+
+        assert [response.text for response in responses] == ['One', 'Two']
+
+    def test_submit_returns_completed_future(self):
+        """Test that submit() resolves without a batching thread."""
+        future = self.client.sms.submit(to='+14155552671', text='Hi')
+
+        assert future.done()
+        assert future.result().status == 'queued'
+
+    def test_submit_error(self):
+        """Test that submit() futures carry simulated errors."""
+        future = self.client.sms.submit(to=MAGIC_NUMBERS['errors']['rate_limit'], text='Hi')
+
+        with pytest.raises(RateLimitError):
+            future.result()
+
+    def test_sent_message_is_delivered(self):
+        """Test that looking up a sent message reports it delivered."""
+        sent = self.client.sms.send(to=MAGIC_NUMBERS['delays']['60_seconds'], text='Hi')
+
+        response = self.client.sms.wait_for_status(sent.id, timeout=1)
+
+        assert response.id == sent.id
+        assert response.status == 'delivered'
+
+    def test_unknown_endpoint(self):
+        """Test that endpoints without a handler raise a 404 APIError."""
+        transport = LocalTransport('https://sendly.live/api', TEST_KEY)
+
+        with pytest.raises(APIError, match='No local handler for GET /v1/messages/missing') as exc_info:
+            transport.get('/v1/messages/missing')
+
+        assert exc_info.value.status_code == 404
+
+    def test_stored_messages_are_bounded(self):
+        """Test that only the most recent messages can be looked up."""
+        transport = LocalTransport('https://sendly.live/api', TEST_KEY)
+
+        with patch('sendly.utils.local_transport._MAX_STORED_MESSAGES', 2):
+            ids = [
+                transport.post('/v1/send', {'to': '+14155552671'})['messageId']
+                for _ in range(3)
+            ]
+
+        with pytest.raises(APIError):
+            transport.get(f'/v1/messages/{ids[0]}')
+        assert transport.get(f'/v1/messages/{ids[2]}')['status'] == 'delivered'
+        assert len(transport._messages) == 2
+
+    def test_async_sms_uses_local_transport(self):
+        """Test that async_sms stays local too."""
+        response = asyncio.run(self.client.async_sms.send(to='+14155552671', text='Hi'))
+
+        assert isinstance(self.client._async_http_client, AsyncLocalTransport)
+        assert response.status == 'queued'
+
+    def test_async_transport_matches_async_http_client(self):
+        """Test that the async transport only offers the awaitable API."""
+        transport = self.client.async_sms._http_client
+
+        assert not hasattr(transport, 'post_batched')
+        assert not isinstance(transport, LocalTransport)
+
+    def test_async_submit_uses_local_transport(self):
+        """Test that async_sms.submit resolves to a local response."""
+        async def submit():
+            return await self.client.async_sms.submit(to='+14155552671', text='Hi')
+
+        response = asyncio.run(submit())
+
+        assert response.id.startswith('msg_local_')
+        assert response.status == 'queued'
+
+    def test_async_client(self):
+        """Test AsyncSendly with the local transport."""
+        async def send():
+            async with AsyncSendly(TEST_KEY, transport='local') as client:
+                return await client.sms.send(to='+14155552671', text='Hi')
+
+        assert asyncio.run(send()).status == 'queued'
+
+
+class TestTransportSelection:
+    """Test how Sendly picks its transport."""
+
+    def test_http_by_default(self):
+        """Test that the real HTTP client is used by default."""
+        with patch.dict(os.environ, {}, clear=True):
+            client = Sendly(TEST_KEY)
+
+        assert isinstance(client._http_client, HttpClient)
+
+    def test_env_var_selects_local(self):
+        """Test that SENDLY_LOCAL=1 selects the local transport."""
+        with patch.dict(os.environ, {'SENDLY_LOCAL': '1'}):
+            client = Sendly(TEST_KEY)
+
+        assert isinstance(client._http_client, LocalTransport)
+
+    def test_explicit_http_overrides_env_var(self):
+        """Test that transport='http' wins over SENDLY_LOCAL."""
+        with patch.dict(os.environ, {'SENDLY_LOCAL': '1'}):
+            client = Sendly(TEST_KEY, transport='http')
+
+        assert isinstance(client._http_client, HttpClient)
+
+    def test_live_key_rejected(self):
+        """Test that the local transport refuses live keys."""
+        with pytest.raises(ValidationError, match='requires a test API key'):
+            Sendly(LIVE_KEY, transport='local')
+
+    def test_unknown_transport(self):
+        """Test that unknown transports are rejected."""
+        with pytest.raises(ValueError, match="transport must be 'http' or 'local'"):
+            Sendly(TEST_KEY, transport='grpc')
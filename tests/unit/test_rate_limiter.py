@@ -0,0 +1,111 @@
+"""Tests for client-side rate limiting."""
+
+from unittest.mock import patch
+
+import pytest
+
+from sendly.utils.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+
+    def test_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError, match='rate must be positive'):
+            TokenBucket(0)
+
+    def test_capacity_defaults_to_rate(self):
+        """Test default burst size."""
+        assert TokenBucket(10).capacity == 10
+        assert TokenBucket(0.5).capacity == 1
+
+    def test_burst_up_to_capacity(self):
+        """Test that a full bucket grants capacity tokens without waiting."""
+        bucket = TokenBucket(5, clock=FakeClock())
+
+        assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+
+    def test_empty_bucket_queues_callers(self):
+        """Test that callers past the burst wait one interval each."""
+        bucket = TokenBucket(2, capacity=1, clock=FakeClock())
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits == [0.0, 0.5, 1.0, 1.5]
+
+    def test_refill_over_time(self):
+        """Test that tokens refill at the configured rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(2, capacity=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+
+        clock.now += 0.5
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+
+    def test_backoff_halves_rate_until_expiry(self):
+        """Test AIMD-style backoff after a rate limit."""
+        clock = FakeClock()
+        bucket = TokenBucket(10, clock=clock)
+
+        bucket.backoff(2.0)
+        assert bucket.current_rate == 5.0
+
+        bucket.backoff(2.0)
+        assert bucket.current_rate == 2.5
+
+        clock.now += 2.0
+        assert bucket.current_rate == 10.0
+
+    def test_repeated_backoff_is_floored(self):
+        """Test that repeated 429s never slow the bucket below 1/8 rate."""
+        bucket = TokenBucket(16, clock=FakeClock())
+
+        for _ in range(10):
+            bucket.backoff(2.0)
+
+        assert bucket.current_rate == 2.0
+
+    def test_wait_within_backoff_window(self):
+        """Test that a short wait uses the reduced rate."""
+        bucket = TokenBucket(10, capacity=1, clock=FakeClock())
+        bucket.reserve()
+        bucket.backoff(5.0)
+
+        assert bucket.reserve() == pytest.approx(0.2)
+
+    def test_wait_crosses_end_of_backoff_window(self):
+        """Test that a wait past the window refills at the full rate."""
+        bucket = TokenBucket(10, capacity=1, clock=FakeClock())
+        bucket.reserve()
+        bucket.backoff(1.0)
+
+        for _ in range(9):
+            bucket.reserve()
+
+        # 5 tokens come back during the 1s window, the last 5 at 10/s
+        assert bucket.reserve() == pytest.approx(1.5)
+
+    @patch('sendly.utils.rate_limiter.time.sleep')
+    def test_acquire_sleeps_only_when_empty(self, mock_sleep):
+        """Test that acquire() sleeps for the reserved wait."""
+        bucket = TokenBucket(4, capacity=1, clock=FakeClock())
+
+        bucket.acquire()
+        mock_sleep.assert_not_called()
+
+        bucket.acquire()
+        mock_sleep.assert_called_once_with(0.25)
@@ -1,6 +1,8 @@
 """Tests for SMS resource."""
 
 import pytest
+from collections import OrderedDict
+from concurrent.futures import Future
 from unittest.mock import Mock, patch
 
 from sendly.resources.sms import SMS
@@ -174,7 +176,7 @@ class TestSMS:
         assert response.text is None
         assert response.media_urls == ['https://example.com/photo.png']
     
-    @patch('sendly.resources.sms.validate_sms_request')
+    @patch('sendly.resources.sms.validate_sms_fields')
     def test_validation_called(self, mock_validate):
         """Test that request validation is called."""
         mock_response = {'messageId': 'test', 'status': 'queued', 'routing': {}}
@@ -184,11 +186,10 @@ class TestSMS:
         
         # Verify validation was called
         mock_validate.assert_called_once()
-        request_arg = mock_validate.call_args[0][0]
-        assert request_arg.to == '+14155552671'
-        assert request_arg.text == 'Hello'
+        assert mock_validate.call_args[0][0] == '+14155552671'
+        assert mock_validate.call_args[1]['text'] == 'Hello'
     
-    @patch('sendly.resources.sms.validate_sms_request')
+    @patch('sendly.resources.sms.validate_sms_fields')
     def test_validation_error_propagated(self, mock_validate):
         """Test that validation errors are propagated."""
         mock_validate.side_effect = ValidationError('Invalid phone number')
@@ -199,27 +200,141 @@ class TestSMS:
         # HTTP client should not be called if validation fails
         self.mock_http_client.post.assert_not_called()
     
-    def test_authentication_error(self):
-        """Test handling of authentication errors."""
-        self.mock_http_client.post.side_effect = AuthenticationError('Invalid API key')
-        
-        with pytest.raises(AuthenticationError, match='Invalid API key'):
-            self.sms.send(to='+14155552671', text='Hello')
-    
-    def test_rate_limit_error(self):
-        """Test handling of rate limit errors."""
-        self.mock_http_client.post.side_effect = RateLimitError('Rate limit exceeded')
-        
-        with pytest.raises(RateLimitError, match='Rate limit exceeded'):
+    def test_submit_queues_batched_send(self):
+        """Test that submit() posts through the batching path."""
+        raw = Future()
+        self.mock_http_client.post_batched.return_value = raw
+
+        future = self.sms.submit(to='+14155552671', text='Hello world')
+        raw.set_result({'messageId': 'msg_batched', 'status': 'queued'})
+
+        response = future.result(timeout=0)
+        assert isinstance(response, SMSResponse)
+        assert response.id == 'msg_batched'
+        self.mock_http_client.post_batched.assert_called_once_with(
+            '/v1/send',
+            {'to': '+14155552671', 'text': 'Hello world', 'messageType': 'transactional'}
+        )
+
+    def test_send_with_idempotency_key(self):
+        """Test that the idempotency key is sent with the message."""
+        self.mock_http_client.post.return_value = {'messageId': 'msg_123'}
+
+        self.sms.send(to='+14155552671', text='Hello world', idempotency_key='key-1')
+
+        payload = self.mock_http_client.post.call_args[0][1]
+        assert payload['idempotencyKey'] == 'key-1'
+
+    def test_submit_with_idempotency_key(self):
+        """Test that batched messages keep their own idempotency keys."""
+        self.mock_http_client.post_batched.return_value = Future()
+
+        self.sms.submit(to='+14155552671', text='Hello world', idempotency_key='key-2')
+
+        payload = self.mock_http_client.post_batched.call_args[0][1]
+        assert payload['idempotencyKey'] == 'key-2'
+
+    def test_submit_propagates_request_errors(self):
+        """Test that submit() futures carry API errors."""
+        raw = Future()
+        self.mock_http_client.post_batched.return_value = raw
+
+        future = self.sms.submit(to='+14155552671', text='Hello world')
+        raw.set_exception(RateLimitError('Rate limit exceeded'))
+
+        with pytest.raises(RateLimitError):
+            future.result(timeout=0)
+
+    def test_submit_validates_before_queueing(self):
+        """Test that invalid messages are rejected synchronously."""
+        with pytest.raises(ValidationError, match='Invalid phone number format'):
+            self.sms.submit(to='invalid', text='Hello world')
+
+        self.mock_http_client.post_batched.assert_not_called()
+
+    def test_send_many_posts_bulk_chunks(self):
+        """Test that send_many() splits messages into bulk requests."""
+        from sendly.types import SMSRequest
+        messages = [
+            SMSRequest(to=f'+1415555267{i}', text=f'Message {i}') for i in range(5)
+        ]
+        self.mock_http_client.post.side_effect = lambda endpoint, data: {
+            'messages': [{'messageId': f"msg_{m['to']}"} for m in data['messages']]
+        }
+
+        responses = self.sms.send_many(messages, chunk_size=2)
+
+        assert [r.id for r in responses] == [f'msg_+1415555267{i}' for i in range(5)]
+        calls = self.mock_http_client.post.call_args_list
+        assert [call[0][0] for call in calls] == ['/v1/send/bulk'] * 3
+        assert [len(call[0][1]['messages']) for call in calls] == [2, 2, 1]
+
+    def test_send_many_validates_everything_first(self):
+        """Test that one invalid message stops the whole batch being sent."""
+        from sendly.types import SMSRequest
+        messages = [
+            SMSRequest(to='+14155552671', text='Valid'),
+            SMSRequest(to='invalid', text='Invalid'),
+        ]
+
+        with pytest.raises(ValidationError, match='Invalid phone number format'):
+            self.sms.send_many(messages)
+
+        self.mock_http_client.post.assert_not_called()
+
+    def test_send_many_mismatched_response(self):
+        """Test that a bulk response of the wrong length raises APIError."""
+        from sendly.types import SMSRequest
+        self.mock_http_client.post.return_value = {'messages': []}
+
+        with pytest.raises(APIError, match='did not contain 1 messages'):
+            self.sms.send_many([SMSRequest(to='+14155552671', text='Hello')])
+
+    def test_send_many_invalid_chunk_size(self):
+        """Test that chunk_size must be positive."""
+        with pytest.raises(ValueError, match='chunk_size'):
+            self.sms.send_many([], chunk_size=0)
+
+    @pytest.mark.parametrize('error_class, message', [
+        (AuthenticationError, 'Invalid API key'),
+        (RateLimitError, 'Rate limit exceeded'),
+        (APIError, 'Server error'),
+    ])
+    def test_http_errors_propagate(self, error_class, message):
+        """Test that errors from the HTTP client reach the caller unchanged."""
+        error = error_class(message)
+        self.mock_http_client.post.side_effect = error
+        
+        with pytest.raises(error_class, match=message) as exc_info:
             self.sms.send(to='+14155552671', text='Hello')
-    
-    def test_api_error(self):
-        """Test handling of general API errors."""
-        self.mock_http_client.post.side_effect = APIError('Server error')
         
-        with pytest.raises(APIError, match='Server error'):
-            self.sms.send(to='+14155552671', text='Hello')
+        assert exc_info.value is error
     
+    @pytest.mark.parametrize('cost_data, amount, currency', [
+        ('$1,000.50', 1000.5, 'USD'),
+        (3, 3.0, 'USD'),
+        (0.01, 0.01, 'USD'),
+        ({'amount': 0.02, 'currency': 'EUR'}, 0.02, 'EUR'),
+        (OrderedDict(amount=0.03), 0.03, 'USD'),
+        (True, 1.0, 'USD'),
+    ])
+    def test_response_cost_formats(self, cost_data, amount, currency):
+        """Test that every cost format (and subclasses) is parsed."""
+        self.mock_http_client.post.return_value = {'messageId': 'msg_1', 'cost': cost_data}
+
+        response = self.sms.send(to='+14155552671', text='Hello')
+
+        assert response.cost.amount == amount
+        assert response.cost.currency == currency
+
+    def test_response_with_unknown_cost_format(self):
+        """Test that an unrecognised cost format yields no cost info."""
+        self.mock_http_client.post.return_value = {'messageId': 'msg_1', 'cost': [1]}
+
+        response = self.sms.send(to='+14155552671', text='Hello')
+
+        assert response.cost is None
+
     def test_response_without_cost(self):
         """Test response transformation when cost info is missing."""
         mock_response = {
@@ -254,6 +369,61 @@ class TestSMS:
         assert response.routing.number_type == ''
         assert response.routing.rate_limit == 0
     
+    def test_get_message(self):
+        """Test fetching a message by ID."""
+        self.mock_http_client.get.return_value = {'messageId': 'msg/1', 'status': 'delivered'}
+
+        response = self.sms.get('msg/1')
+
+        self.mock_http_client.get.assert_called_once_with('/v1/messages/msg%2F1')
+        assert response.status == 'delivered'
+
+    def test_get_requires_message_id(self):
+        """Test that get() rejects an empty ID."""
+        with pytest.raises(ValidationError, match='message_id is required'):
+            self.sms.get('')
+
+    @patch('sendly.resources.sms.time')
+    def test_wait_for_status_backs_off(self, mock_time):
+        """Test that polling intervals grow up to max_interval."""
+        clock = [0.0]
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        mock_time.sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+        self.mock_http_client.get.side_effect = (
+            [{'messageId': 'msg_1', 'status': 'queued'}] * 5
+            + [{'messageId': 'msg_1', 'status': 'delivered'}]
+        )
+
+        response = self.sms.wait_for_status('msg_1', initial=1.0, max_interval=4.0)
+
+        assert response.status == 'delivered'
+        assert [c.args[0] for c in mock_time.sleep.call_args_list] == [1.0, 2.0, 4.0, 4.0, 4.0]
+
+    @patch('sendly.resources.sms.time')
+    def test_wait_for_status_stops_on_final_status(self, mock_time):
+        """Test that a failed message ends the wait immediately."""
+        mock_time.monotonic.return_value = 0.0
+        self.mock_http_client.get.return_value = {'messageId': 'msg_1', 'status': 'failed'}
+
+        response = self.sms.wait_for_status('msg_1', target='delivered')
+
+        assert response.status == 'failed'
+        mock_time.sleep.assert_not_called()
+
+    @patch('sendly.resources.sms.time')
+    def test_wait_for_status_timeout(self, mock_time):
+        """Test that the last response is returned once the timeout expires."""
+        clock = [0.0]
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        mock_time.sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+        self.mock_http_client.get.return_value = {'messageId': 'msg_1', 'status': 'queued'}
+
+        response = self.sms.wait_for_status('msg_1', timeout=5.0, initial=2.0)
+
+        assert response.status == 'queued'
+        # Sleeps 2s, then the remaining 3s rather than a full 4s interval
+        assert [c.args[0] for c in mock_time.sleep.call_args_list] == [2.0, 3.0]
+
     def test_build_payload_excludes_none_values(self):
         """Test that payload builder excludes None values."""
         # Create SMS instance to access private method
@@ -0,0 +1,49 @@
+"""Benchmarks for the client-side cost of sms.send().
+
+Every send validates its fields, builds a payload and parses the response,
+so this overhead is paid on each production call. The HTTP client is
+stubbed out to measure only that work. Requires ``pytest-benchmark``; run
+with ``make benchmark``.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from sendly.resources.sms import SMS
+
+# Generous per-send ceiling: a send currently takes about 5us here, so only
+# a real regression (e.g. a regex compiled per call) trips this
+MAX_SECONDS_PER_SEND = 50e-6
+BATCH = 1000
+
+
+class _StubHttpClient:
+    """HTTP client that answers every POST with a canned response."""
+
+    def post(self, endpoint, data):
+        return {
+            'messageId': 'msg_bench',
+            'status': 'queued',
+            'to': data['to'],
+            'cost': '$0.01',
+        }
+
+
+def _send_batch(sms):
+    """Send a batch of plain text messages."""
+    for _ in range(BATCH):
+        sms.send(to='+14155552671', text='Hello')
+
+
+class TestSendBenchmark:
+    """Benchmarks for SMS.send()."""
+
+    def test_send_overhead(self, benchmark):
+        """Test that validating, building and parsing a send stays cheap."""
+        sms = SMS(_StubHttpClient())
+
+        benchmark.pedantic(_send_batch, args=(sms,), rounds=20, iterations=1)
+
+        per_send = benchmark.stats.stats.min / BATCH
+        assert per_send < MAX_SECONDS_PER_SEND
@@ -0,0 +1,57 @@
+"""Tests for type definitions."""
+
+import sys
+from dataclasses import fields
+
+import pytest
+
+from sendly.types import (
+    SMSRequest,
+    SMSResponse,
+    RoutingInfo,
+    CostInfo,
+    MessageSummary,
+    PaginationInfo,
+    MessageListResponse,
+    StatsResponse,
+    LiveStatsResponse,
+    RateLimitStatusResponse,
+)
+
+ALL_TYPES = [
+    SMSRequest,
+    SMSResponse,
+    RoutingInfo,
+    CostInfo,
+    MessageSummary,
+    PaginationInfo,
+    MessageListResponse,
+    StatsResponse,
+    LiveStatsResponse,
+    RateLimitStatusResponse,
+]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+class TestSlottedTypes:
+    """Test that dataclasses are slotted."""
+
+    @pytest.mark.parametrize("cls", ALL_TYPES)
+    def test_slots_match_fields(self, cls):
+        """Test that every field is a slot."""
+        assert cls.__slots__ == tuple(f.name for f in fields(cls))
+
+    def test_instances_have_no_dict(self):
+        """Test that instances don't carry a __dict__."""
+        request = SMSRequest(to='+14155552671', text='Hello')
+
+        assert not hasattr(request, '__dict__')
+        with pytest.raises(AttributeError):
+            request.unknown_field = 'value'
+
+    def test_defaults_still_apply(self):
+        """Test that field defaults work with slots."""
+        request = SMSRequest(to='+14155552671')
+
+        assert request.text is None
+        assert request.tags is None
@@ -12,157 +12,193 @@ from sendly.utils.validation import (
     is_toll_free,
     validate_toll_free_routing,
     validate_sms_request,
+    validate_sms_fields,
+    _is_https_url,
 )
 
 
+class TestHttpsUrlCheck:
+    """Test the combined HTTPS URL check."""
+
+    @pytest.mark.parametrize("url,expected", [
+        ('https://example.com', True),
+        ('https://example.com/image.jpg?size=large', True),
+        ('http://example.com', False),
+        ('https://', False),
+        ('https:///path', False),
+        ('ftp://example.com', False),
+        ('invalid-url', False),
+        ('', False),
+        ('https://[invalid', False),
+    ])
+    def test_is_https_url(self, url, expected):
+        """Test that the check matches is_valid_url plus an HTTPS scheme."""
+        assert _is_https_url(url) is expected
+        assert _is_https_url(url) == (is_valid_url(url) and url.startswith('https://'))
+
+
 class TestPhoneNumberValidation:
     """Test phone number validation."""
     
-    def test_valid_phone_numbers(self):
+    @pytest.mark.parametrize("number", [
+        '+14155552671',
+        '+447700900123',
+        '+33123456789',
+        '+8613800138000',
+        '+12345678901234',  # Maximum length (15 digits)
+        '+1234567890',      # Minimum realistic length
+    ])
+    def test_valid_phone_numbers(self, number):
         """Test various valid phone numbers."""
-        valid_numbers = [
-            '+14155552671',
-            '+447700900123',
-            '+33123456789',
-            '+8613800138000',
-            '+12345678901234',  # Maximum length (15 digits)
-            '+1234567890',      # Minimum realistic length
-        ]
-        
-        for number in valid_numbers:
-            assert is_valid_phone_number(number), f"Should be valid: {number}"
+        assert is_valid_phone_number(number)
     
-    def test_invalid_phone_numbers(self):
+    @pytest.mark.parametrize("number", [
+        '14155552671',      # Missing +
+        '+014155552671',    # Starts with 0
+        '+1415555267',      # Too short
+        '+123456789012345', # Too long (16 digits)
+        '+1-415-555-2671',  # Contains dashes
+        '+1 415 555 2671',  # Contains spaces
+        '+1(415)555-2671',  # Contains parentheses
+        'invalid',          # Not a number
+        '',                 # Empty string
+        '+',                # Just plus sign
+    ])
+    def test_invalid_phone_numbers(self, number):
         """Test various invalid phone numbers."""
-        invalid_numbers = [
-            '14155552671',      # Missing +
-            '+014155552671',    # Starts with 0
-            '+1415555267',      # Too short
-            '+123456789012345', # Too long (16 digits)
-            '+1-415-555-2671',  # Contains dashes
-            '+1 415 555 2671',  # Contains spaces
-            '+1(415)555-2671',  # Contains parentheses
-            'invalid',          # Not a number
-            '',                 # Empty string
-            '+',                # Just plus sign
-        ]
-        
-        for number in invalid_numbers:
-            assert not is_valid_phone_number(number), f"Should be invalid: {number}"
+        assert not is_valid_phone_number(number)
+
+    def test_trailing_newline_rejected(self):
+        """Test that a trailing newline is not accepted as part of the number."""
+        assert not is_valid_phone_number('+14155552671\n')
 
 
 class TestAPIKeyValidation:
     """Test API key validation."""
     
-    def test_valid_api_keys(self):
+    @pytest.mark.parametrize("key", [
+        'sl_test_1234567890123456789012345678901234567890',
+        'sl_live_abcdefghijklmnopqrstuvwxyz1234567890abcd',
+        'sl_test_ABC123_def456_GHI789',
+        'sl_live_short123456789012345678',
+    ])
+    def test_valid_api_keys(self, key):
         """Test various valid API key formats."""
-        valid_keys = [
-            'sl_test_1234567890123456789012345678901234567890',
-            'sl_live_abcdefghijklmnopqrstuvwxyz1234567890abcd',
-            'sl_test_ABC123_def456_GHI789',
-            'sl_live_short123456789012345678',
-        ]
-        
-        for key in valid_keys:
-            assert is_valid_api_key(key), f"Should be valid: {key}"
+        assert is_valid_api_key(key)
     
-    def test_invalid_api_keys(self):
+    @pytest.mark.parametrize("key", [
+        'invalid-key',
+        'sl_invalid_1234567890123456789012345678901234567890',
+        'sl_test_short',
+        'sl_live_',
+        'test_1234567890123456789012345678901234567890',
+        '',
+        'sl_test',
+        'sl_live',
+        'sl_test_123456789012345678901234\n',
+        'sl_test_12345678901234567890123!',
+    ])
+    def test_invalid_api_keys(self, key):
         """Test various invalid API key formats."""
-        invalid_keys = [
-            'invalid-key',
-            'sl_invalid_1234567890123456789012345678901234567890',
-            'sl_test_short',
-            'sl_live_',
-            'test_1234567890123456789012345678901234567890',
-            '',
-            'sl_test',
-            'sl_live',
-        ]
-        
-        for key in invalid_keys:
-            assert not is_valid_api_key(key), f"Should be invalid: {key}"
+        assert not is_valid_api_key(key)
 
 
 class TestURLValidation:
     """Test URL validation."""
     
-    def test_valid_urls(self):
+    @pytest.mark.parametrize("url", [
+        'https://example.com',
+        'http://example.com',
+        'https://subdomain.example.com/path',
+        'https://example.com:8080/webhook',
+        'https://example.com/webhook?param=value',
+    ])
+    def test_valid_urls(self, url):
         """Test various valid URLs."""
-        valid_urls = [
-            'https://example.com',
-            'http://example.com',
-            'https://subdomain.example.com/path',
-            'https://example.com:8080/webhook',
-            'https://example.com/webhook?param=value',
-        ]
-        
-        for url in valid_urls:
-            assert is_valid_url(url), f"Should be valid: {url}"
+        assert is_valid_url(url)
     
-    def test_invalid_urls(self):
+    @pytest.mark.parametrize("url", [
+        'not-a-url',
+        'example.com',
+        'ftp://example.com',
+        '',
+        'https://',
+        '://example.com',
+    ])
+    def test_invalid_urls(self, url):
         """Test various invalid URLs."""
-        invalid_urls = [
-            'not-a-url',
-            'example.com',
-            'ftp://example.com',
-            '',
-            'https://',
-            '://example.com',
-        ]
-        
-        for url in invalid_urls:
-            assert not is_valid_url(url), f"Should be invalid: {url}"
+        assert not is_valid_url(url)
+
+    @pytest.mark.parametrize("url", [
+        'ftp://example.com/image.jpg',
+        'ws://example.com/socket',
+        'mailto://user@example.com',
+    ])
+    def test_non_http_schemes_rejected(self, url):
+        """Test that well-formed URLs with other schemes are not valid."""
+        assert is_valid_url(url) is False
 
 
 class TestCountryCodeDetection:
     """Test country code detection."""
     
-    def test_country_code_detection(self):
+    @pytest.mark.parametrize("phone,expected_code", [
+        ('+14155552671', '1'),      # US
+        ('+1234567890', '1'),       # US/Canada
+        ('+447700900123', '44'),    # UK
+        ('+33123456789', '33'),     # France
+        ('+8613800138000', '86'),   # China
+        ('+27123456789', '27'),     # South Africa
+        ('+81123456789', '81'),     # Japan
+        ('+99123456789', 'unknown'), # Unknown country
+    ])
+    def test_country_code_detection(self, phone, expected_code):
         """Test country code extraction from phone numbers."""
-        test_cases = [
-            ('+14155552671', '1'),      # US
-            ('+1234567890', '1'),       # US/Canada
-            ('+447700900123', '44'),    # UK
-            ('+33123456789', '33'),     # France
-            ('+8613800138000', '86'),   # China
-            ('+27123456789', '27'),     # South Africa
-            ('+81123456789', '81'),     # Japan
-            ('+99123456789', 'unknown'), # Unknown country
-        ]
-        
-        for phone, expected_code in test_cases:
-            actual_code = get_country_code(phone)
-            assert actual_code == expected_code, f"Phone {phone} should have country code {expected_code}, got {actual_code}"
+        assert get_country_code(phone) == expected_code
+
+    def test_short_numbers_need_full_length_for_two_digit_codes(self):
+        """Test that most two-digit codes need at least 10 digits."""
+        assert get_country_code('+271234567') == 'unknown'
+        assert get_country_code('+2712345678') == '27'
+        assert get_country_code('+4412') == '44'
+
+    def test_formatted_numbers(self):
+        """Test that punctuation and spaces are ignored."""
+        assert get_country_code('+44 (7700) 900-123') == '44'
+        assert get_country_code('1-415-555-2671') == '1'
+        assert get_country_code('') == 'unknown'
 
 
 class TestTollFreeDetection:
     """Test toll-free number detection."""
     
-    def test_toll_free_numbers(self):
+    @pytest.mark.parametrize("number", [
+        '+18005551234',
+        '+18335551234',
+        '+18445551234',
+        '+18555551234',
+        '+18665551234',
+        '+18775551234',
+        '+18885551234',
+    ])
+    def test_toll_free_numbers(self, number):
         """Test toll-free number detection."""
-        toll_free_numbers = [
-            '+18005551234',
-            '+18335551234',
-            '+18445551234',
-            '+18555551234',
-            '+18665551234',
-            '+18775551234',
-            '+18885551234',
-        ]
-        
-        for number in toll_free_numbers:
-            assert is_toll_free(number), f"Should be toll-free: {number}"
+        assert is_toll_free(number)
+
+    def test_toll_free_formatted_numbers(self):
+        """Test toll-free detection on non-E.164 input."""
+        assert is_toll_free('18005551234')
+        assert is_toll_free('+1 (800) 555-1234')
+        assert not is_toll_free('+1 (415) 555-1234')
     
-    def test_non_toll_free_numbers(self):
+    @pytest.mark.parametrize("number", [
+        '+14155551234',  # Regular US number
+        '+447700900123', # UK number
+        '+18125551234',  # Non-toll-free US number
+    ])
+    def test_non_toll_free_numbers(self, number):
         """Test non-toll-free number detection."""
-        non_toll_free_numbers = [
-            '+14155551234',  # Regular US number
-            '+447700900123', # UK number
-            '+18125551234',  # Non-toll-free US number
-        ]
-        
-        for number in non_toll_free_numbers:
-            assert not is_toll_free(number), f"Should not be toll-free: {number}"
+        assert not is_toll_free(number)
 
 
 class TestTollFreeRouting:
@@ -253,6 +289,15 @@ class TestSMSRequestValidation:
         )
         with pytest.raises(ValidationError, match='Media URLs must use HTTPS'):
             validate_sms_request(request)
+
+    def test_non_http_media_url_is_invalid_format(self):
+        """Test that an ftp media URL is reported as a malformed URL."""
+        request = SMSRequest(
+            to='+14155552671',
+            media_urls=['ftp://example.com/image.jpg']
+        )
+        with pytest.raises(ValidationError, match='Invalid URL format in media_urls'):
+            validate_sms_request(request)
     
     def test_webhook_url_validation(self):
         """Test webhook URL validation."""
@@ -312,6 +357,23 @@ class TestSMSRequestValidation:
         with pytest.raises(ValidationError, match='Tag length cannot exceed 50 characters'):
             validate_sms_request(request)
     
+    def test_size_limits_checked_before_formats(self):
+        """Test that size limits are reported before format errors."""
+        request = SMSRequest(
+            to='invalid',
+            text='Hello',
+            tags=['tag'] * 21
+        )
+        with pytest.raises(ValidationError, match='Maximum 20 tags allowed'):
+            validate_sms_request(request)
+
+        request = SMSRequest(
+            to='invalid',
+            media_urls=['https://example.com'] * 11
+        )
+        with pytest.raises(ValidationError, match='Maximum 10 media URLs allowed'):
+            validate_sms_request(request)
+
     def test_message_type_validation(self):
         """Test message type validation."""
         # Valid message types
@@ -330,5 +392,28 @@ class TestSMSRequestValidation:
             text='Hello',
             message_type='invalid'
         )
-        with pytest.raises(ValidationError, match='Invalid message_type'):
-            validate_sms_request(request)
\ No newline at end of file
+        with pytest.raises(ValidationError, match='Invalid message_type') as exc_info:
+            validate_sms_request(request)
+
+        assert str(exc_info.value).endswith(
+            'Must be one of: transactional, marketing, otp, alert, promotional'
+        )
+
+class TestValidateSMSFields:
+    """Test validation of SMS fields passed as plain arguments."""
+
+    def test_valid_fields(self):
+        """Test that valid fields pass without an SMSRequest."""
+        validate_sms_fields('+14155552671', text='Hello', tags=['a'])  # Should not raise
+
+    def test_matches_request_validation(self):
+        """Test that errors match validate_sms_request."""
+        with pytest.raises(ValidationError, match='Maximum 20 tags allowed'):
+            validate_sms_fields('+14155552671', text='Hello', tags=['t'] * 21)
+
+        with pytest.raises(ValidationError, match='Webhook URL must use HTTPS'):
+            validate_sms_fields(
+                '+14155552671',
+                text='Hello',
+                webhook_url='http://example.com/hook'
+            )